@@ -8,13 +8,61 @@ class TestConfig:
     """Configuration class for test settings"""
     
     # Base URL
-    BASE_URL = "https://www.saucedemo.com/v1/"
+    BASE_URL = os.getenv("BASE_URL", "https://www.saucedemo.com/v1/")
+    
+    # Local stand-in app (see utils/demo_server.py); replaces BASE_URL when enabled
+    LOCAL_APP = os.getenv("LOCAL_APP", "false").lower() == "true"
+    LOCAL_APP_PORT = int(os.getenv("LOCAL_APP_PORT", "0"))  # 0 = free port per worker
+    # Latency/fault profile of the local app (see config/latency_profiles.py)
+    LATENCY_PROFILE = os.getenv("LATENCY_PROFILE", "default")
+    LATENCY_SEED = int(os.environ["LATENCY_SEED"]) if os.getenv("LATENCY_SEED") else None
     
     # Browser settings
     BROWSER = os.getenv("BROWSER", "chrome").lower()
     HEADLESS = os.getenv("HEADLESS", "false").lower() == "true"
-    IMPLICIT_WAIT = int(os.getenv("IMPLICIT_WAIT", "10"))
+    # Implicit wait stays at 0: all waiting is done by BasePage's WaitEngine
+    IMPLICIT_WAIT = int(os.getenv("IMPLICIT_WAIT", "0"))
+    EXPLICIT_WAIT = int(os.getenv("EXPLICIT_WAIT", "10"))
+    POLL_FREQUENCY = float(os.getenv("POLL_FREQUENCY", "0.1"))
+    ABSENT_TIMEOUT = float(os.getenv("ABSENT_TIMEOUT", "0"))
     PAGE_LOAD_TIMEOUT = int(os.getenv("PAGE_LOAD_TIMEOUT", "30"))
+    WINDOW_WIDTH = 1920
+    WINDOW_HEIGHT = 1080
+    
+    # full, or lean: no images/fonts/media/analytics, eager page loads (tests marked full_load keep full)
+    BROWSER_PROFILE = os.getenv("BROWSER_PROFILE", "full").lower()
+    
+    # BasePage click/type/text: webdriver, or cdp (one DevTools websocket per session, Chrome/Edge only)
+    ACTION_BACKEND = os.getenv("ACTION_BACKEND", "webdriver").lower()
+    
+    # Driver reuse settings (one pool per process / xdist worker)
+    DRIVER_REUSE = os.getenv("DRIVER_REUSE", "true").lower() == "true"
+    DRIVER_POOL_SIZE = int(os.getenv("DRIVER_POOL_SIZE", "1"))
+    DRIVER_MAX_REUSE = int(os.getenv("DRIVER_MAX_REUSE", "50"))
+    # Browsers launched ahead of time to replace crashed or recycled sessions (per pool, opt-in)
+    DRIVER_SPARES = int(os.getenv("DRIVER_SPARES", "0"))
+    DRIVER_SPARE_MEMORY_CEILING = float(os.getenv("DRIVER_SPARE_MEMORY_CEILING", "80"))
+    
+    # Driver binary resolution (see utils/driver_resolver.py)
+    DRIVER_MANIFEST = os.getenv("DRIVER_MANIFEST", "")
+    DRIVER_CACHE_TTL_HOURS = int(os.getenv("DRIVER_CACHE_TTL_HOURS", "24"))
+    DRIVER_OFFLINE = os.getenv("DRIVER_OFFLINE", "false").lower() == "true"
+    
+    # Parallel runs (more than one xdist worker): order tests longest first from .cache/durations.json
+    DURATION_SCHEDULING = os.getenv("DURATION_SCHEDULING", "true").lower() == "true"
+    
+    # WebDriver command timing (see utils/command_recorder.py)
+    COMMAND_METRICS = os.getenv("COMMAND_METRICS", "true").lower() == "true"
+    COMMAND_HISTORY_SIZE = int(os.getenv("COMMAND_HISTORY_SIZE", "50"))
+    
+    # Page load timings appended to .cache/page_timings.jsonl (see utils/page_timing.py)
+    PAGE_TIMING = os.getenv("PAGE_TIMING", "false").lower() == "true"
+    # What a test marked @pytest.mark.budget does when a page is over budget: warn or fail
+    BUDGET_MODE = os.getenv("BUDGET_MODE", "warn").lower()
+    
+    # Fast login: inject captured session state instead of using the login form
+    FAST_LOGIN = os.getenv("FAST_LOGIN", "true").lower() == "true"
+    SESSION_BOOTSTRAP_PATH = os.getenv("SESSION_BOOTSTRAP_PATH", "robots.txt")
     
     # Test data
     VALID_USERNAME = "standard_user"
@@ -25,6 +73,16 @@ class TestConfig:
     
     # Screenshot settings
     SCREENSHOT_DIR = "screenshots"
+    # Stored format (png, jpeg, webp) and scale; anything but full-size PNG needs Pillow
+    SCREENSHOT_FORMAT = os.getenv("SCREENSHOT_FORMAT", "png").lower()
+    SCREENSHOT_SCALE = float(os.getenv("SCREENSHOT_SCALE", "1.0"))
+    SCREENSHOT_QUALITY = int(os.getenv("SCREENSHOT_QUALITY", "80"))
+    # Zip of screenshot, DOM, console log and recent commands per failed test (reports/failures/)
+    FAILURE_BUNDLES = os.getenv("FAILURE_BUNDLES", "true").lower() == "true"
+    
+    # Per-process JSON-lines log (logs/automation_gwN.jsonl or automation_main_<pid>.jsonl), rotated at this size
+    LOG_MAX_BYTES = int(os.getenv("LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+    LOG_BACKUP_COUNT = int(os.getenv("LOG_BACKUP_COUNT", "5"))
     
     # Test timeout
     TEST_TIMEOUT = int(os.getenv("TEST_TIMEOUT", "60")) 
\ No newline at end of file
@@ -0,0 +1,81 @@
+"""Named latency and fault injection profiles for the local stand-in app"""
+
+class LatencyProfiles:
+    """Route-level latency and fault rules applied by utils/fault_injection.py
+    
+    Each profile is a list of rules. A rule applies to requests whose path
+    matches its "route" glob (relative to the site root, "index.html" for "/")
+    and, if "users" is given, whose session cookie names one of those users.
+    Every matching rule contributes:
+    
+        delay            Distribution of extra latency before the response
+        jitter_ms        Uniform +/- noise added to the delay
+        slow_first_byte  {"rate", "ms"}: occasionally hold the response back
+        drop_rate        Probability of closing the connection without answering
+    
+    Delay distributions (all values in milliseconds):
+        {"dist": "fixed", "ms": 100}
+        {"dist": "uniform", "min_ms": 50, "max_ms": 150}
+        {"dist": "normal", "mean_ms": 100, "stddev_ms": 20}
+        {"dist": "lognormal", "median_ms": 100, "sigma": 0.5}
+        {"dist": "pareto", "scale_ms": 100, "alpha": 3}
+    """
+    
+    # The glitch the real site applies to performance_glitch_user
+    PERFORMANCE_GLITCH = {
+        "route": "inventory.html",
+        "users": ["performance_glitch_user"],
+        "delay": {"dist": "fixed", "ms": 2500},
+    }
+    
+    PROFILES = {
+        # No injected latency at all, not even the glitch
+        "none": [],
+        
+        # Behaves like saucedemo.com on a fast connection
+        "default": [PERFORMANCE_GLITCH],
+        
+        # Heavy-tailed glitch: p50 ~1.5s, p99 ~4.8s
+        "glitch_p99": [
+            {
+                "route": "inventory.html",
+                "users": ["performance_glitch_user"],
+                "delay": {"dist": "lognormal", "median_ms": 1500, "sigma": 0.5},
+                "jitter_ms": 100,
+            },
+        ],
+        
+        # Typical home broadband round trips on every request
+        "broadband": [
+            PERFORMANCE_GLITCH,
+            {"route": "*", "delay": {"dist": "normal", "mean_ms": 40, "stddev_ms": 10}, "jitter_ms": 10},
+        ],
+        
+        # Slow mobile network: pages and assets are slow, some responses stall
+        "mobile_3g": [
+            PERFORMANCE_GLITCH,
+            {"route": "*.html", "delay": {"dist": "lognormal", "median_ms": 300, "sigma": 0.4}},
+            {"route": "static/*", "delay": {"dist": "lognormal", "median_ms": 150, "sigma": 0.4}},
+            {"route": "*", "slow_first_byte": {"rate": 0.05, "ms": 1500}},
+        ],
+        
+        # Unreliable backend: stalls everywhere and lost image responses
+        "flaky": [
+            PERFORMANCE_GLITCH,
+            {"route": "*", "delay": {"dist": "pareto", "scale_ms": 20, "alpha": 2}},
+            {"route": "*", "slow_first_byte": {"rate": 0.1, "ms": 1000}},
+            {"route": "static/img/*", "drop_rate": 0.2},
+        ],
+    }
+    
+    @classmethod
+    def get_profile(cls, name):
+        """Get the rules of a named profile"""
+        if name not in cls.PROFILES:
+            raise ValueError(f"Unknown latency profile: {name} (available: {', '.join(cls.get_profile_names())})")
+        return cls.PROFILES[name]
+    
+    @classmethod
+    def get_profile_names(cls):
+        """Get the names of all profiles"""
+        return list(cls.PROFILES)
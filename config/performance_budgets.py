@@ -0,0 +1,56 @@
+"""Page load budgets per page object and user type"""
+
+class PerformanceBudgets:
+    """Budgets checked against the page timing history (.cache/page_timings.jsonl)
+    
+    A budget limits a percentile of one page timing metric (see
+    PageTimingCollector.TIMING_FIELDS, in milliseconds from navigation start,
+    or "ready", the duration of a step timed with PageTimingCollector.measure)
+    for a page object and the user it was loaded as. "*" is the budget for
+    users without their own entry.
+    """
+    
+    # Budgets are checked over the samples of the last WINDOW_RUNS runs, this one included
+    WINDOW_RUNS = 5
+    
+    # Warm-up: with fewer runs than this in the window a page is reported as "insufficient"
+    # and never fails a test, so budgets cannot fail in the first MIN_RUNS - 1 runs of a history
+    MIN_RUNS = 3
+    
+    BUDGETS = {
+        "LoginPage": {
+            "*": {"metric": "load", "percentile": 95, "limit_ms": 1500},
+        },
+        # Reached from the login page by a client-side route change, so the login step is timed
+        "InventoryPage": {
+            "*": {"metric": "ready", "percentile": 95, "limit_ms": 1500},
+            # Slow on purpose: the inventory page takes a few seconds for this user
+            "performance_glitch_user": {"metric": "ready", "percentile": 95, "limit_ms": 6000},
+        },
+        "InventoryItemPage": {
+            "*": {"metric": "load", "percentile": 95, "limit_ms": 1500},
+        },
+        "CartPage": {
+            "*": {"metric": "load", "percentile": 95, "limit_ms": 1500},
+        },
+        "CheckoutPage": {
+            "*": {"metric": "load", "percentile": 95, "limit_ms": 1500},
+        },
+        "CheckoutOverviewPage": {
+            "*": {"metric": "load", "percentile": 95, "limit_ms": 1500},
+        },
+        "CheckoutCompletePage": {
+            "*": {"metric": "load", "percentile": 95, "limit_ms": 1500},
+        },
+    }
+    
+    @classmethod
+    def get_budget(cls, page, user=None):
+        """Get the budget of a page for a user, falling back to the page's default budget"""
+        budgets = cls.BUDGETS.get(page, {})
+        return budgets.get(user) or budgets.get("*")
+    
+    @classmethod
+    def get_pages(cls):
+        """Get the page objects that have budgets"""
+        return list(cls.BUDGETS.keys())
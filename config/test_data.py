@@ -6,36 +6,42 @@ class TestData:
     # Product data
     PRODUCTS = {
         "Sauce Labs Backpack": {
+            "id": 4,
             "name": "Sauce Labs Backpack",
             "price": "$29.99",
             "price_value": 29.99,
             "description": "carry.allTheThings() with the sleek, streamlined Sly Pack that melds uncompromising style with unequaled laptop and tablet protection."
         },
         "Sauce Labs Bike Light": {
+            "id": 0,
             "name": "Sauce Labs Bike Light",
             "price": "$9.99",
             "price_value": 9.99,
             "description": "A red light isn't the desired state in testing but it sure helps when riding your bike at night. Water-resistant with 3 lighting modes, 1 AAA battery included."
         },
         "Sauce Labs Bolt T-Shirt": {
+            "id": 1,
             "name": "Sauce Labs Bolt T-Shirt",
             "price": "$15.99",
             "price_value": 15.99,
             "description": "Get your testing superhero on with the Sauce Labs bolt T-shirt. From American Apparel, 100% ringspun combed cotton, heather gray with red bolt."
         },
         "Sauce Labs Fleece Jacket": {
+            "id": 5,
             "name": "Sauce Labs Fleece Jacket",
             "price": "$49.99",
             "price_value": 49.99,
             "description": "It's not every day that you come across a midweight quarter-zip fleece jacket capable of handling everything from a relaxing day outdoors to a busy day at the office."
         },
         "Sauce Labs Onesie": {
+            "id": 2,
             "name": "Sauce Labs Onesie",
             "price": "$7.99",
             "price_value": 7.99,
             "description": "Rib snap infant onesie for the junior automation engineer in development. Reinforced 3-snap bottom closure, two-needle hemmed sleeved and bottom won't unravel."
         },
         "Test.allTheThings() T-Shirt (Red)": {
+            "id": 3,
             "name": "Test.allTheThings() T-Shirt (Red)",
             "price": "$15.99",
             "price_value": 15.99,
@@ -151,6 +157,11 @@ class TestData:
         """Get product description by name"""
         return cls.PRODUCTS.get(product_name, {}).get("description", "")
     
+    @classmethod
+    def get_product_id(cls, product_name):
+        """Get the app's product id by name"""
+        return cls.PRODUCTS.get(product_name, {}).get("id")
+    
     @classmethod
     def get_user_credentials(cls, user_type):
         """Get user credentials by type"""
@@ -1,3 +1,5 @@
+import json
+import os
 import pytest
 
 # Setup Python path using PathManager
@@ -5,6 +7,23 @@ from .utils.path_manager import PathManager
 PathManager.setup_python_path()
 
 from utils.driver_factory import DriverFactory
+from utils.driver_pool import DriverPools
+from utils.browser_matrix import BrowserMatrixPlugin
+from utils.base_page import WaitStats
+from utils.command_recorder import CommandRecorder
+from utils.page_timing import PageTimingCollector
+from utils.screenshot_writer import ScreenshotWriter
+from utils.failure_bundle import FailureBundle
+from utils.lazy_report import LazyReportPlugin
+from utils.logger import Logger
+from utils.performance_budget import PerformanceBudgetChecker, PerformanceBudgetPlugin
+from utils.test_context import TestContext
+from utils.session_state import SessionStateCache
+from utils.cart_state import CartStateBuilder
+from utils.demo_server import DemoServer
+from utils.duration_store import DurationSchedulingPlugin
+from utils.sharding import ShardPlanner
+from utils.result_cache import IncrementalRunPlugin, ResultCache
 from pages.login_page import LoginPage
 from pages.inventory_page import InventoryPage
 from pages.cart_page import CartPage
@@ -12,13 +31,232 @@ from pages.checkout_page import CheckoutPage, CheckoutOverviewPage, CheckoutComp
 from config.config import TestConfig
 
 
+def pytest_addoption(parser):
+    """Command line options for splitting the suite across machines"""
+    group = parser.getgroup("sharding", "split the suite into balanced shards across machines")
+    group.addoption("--shard-count", type=int, default=None,
+                    help="Number of shards the collected tests are split into")
+    group.addoption("--shard-index", type=int, default=None,
+                    help="Shard to run on this machine, 0-based (requires --shard-count)")
+    group.addoption("--shard-durations", default=None,
+                    help="Durations file used to balance shards; must be the same on every machine "
+                         "(default: .cache/durations.json)")
+    
+    group = parser.getgroup("incremental", "reorder or skip tests using the results of earlier runs")
+    group.addoption("--incremental", choices=ResultCache.MODES, default=None,
+                    help="failed-first / changed-first: reorder; changed-only: run only tests whose code or "
+                         "config changed; skip-passed: skip tests that passed against identical code and config")
+    
+    group = parser.getgroup("browser-matrix", "run every browser test once per browser in the same session")
+    group.addoption("--browsers", default=None, metavar="LIST",
+                    help="Comma-separated browsers (e.g. chrome,firefox,edge) the driver fixture is parametrised "
+                         "over; the (test x browser) cells are spread over the xdist workers")
+    
+    group = parser.getgroup("lazy-report", "small HTML report index that loads results and artifacts on demand")
+    group.addoption("--lazy-report", default=None, metavar="PATH",
+                    help="Write the lazy report index to PATH (e.g. reports/index.html)")
+    group.addoption("--lazy-report-archive", action="store_true", default=False,
+                    help="Also zip the index, its files and the artifacts it links to next to PATH")
+
+
+def pytest_configure(config):
+    """Register the duration-aware scheduler (records durations, orders tests longest first) and the run plugins"""
+    shard_count = config.getoption("shard_count")
+    shard_index = config.getoption("shard_index")
+    if (shard_count is None) != (shard_index is None):
+        raise pytest.UsageError("--shard-index and --shard-count must be given together")
+    if shard_count is not None and not 0 <= shard_index < shard_count:
+        raise pytest.UsageError(f"--shard-index must be in 0..{shard_count - 1}")
+    
+    # Only worth it with workers to balance; registered on the controller and on every worker
+    if TestConfig.DURATION_SCHEDULING and DurationSchedulingPlugin.is_parallel(config):
+        config.pluginmanager.register(DurationSchedulingPlugin(config), "duration_scheduling")
+    
+    # Always records results; only reorders or filters when --incremental is given
+    config.pluginmanager.register(IncrementalRunPlugin(config, config.getoption("incremental")), "incremental_run")
+    config.pluginmanager.register(PerformanceBudgetPlugin(config), "performance_budgets")
+    
+    browsers = get_matrix_browsers(config)
+    if browsers:
+        config.pluginmanager.register(BrowserMatrixPlugin(config, browsers), "browser_matrix")
+    
+    # Written once by the controller from the reports the workers send back
+    if config.getoption("lazy_report") and not hasattr(config, "workerinput"):
+        plugin = LazyReportPlugin(config, config.getoption("lazy_report"), config.getoption("lazy_report_archive"))
+        config.pluginmanager.register(plugin, "lazy_report")
+
+
+def get_matrix_browsers(config):
+    """Get the browsers given with --browsers, or an empty list outside matrix mode"""
+    option = config.getoption("browsers")
+    if not option:
+        return []
+    browsers = list(dict.fromkeys(name.strip().lower() for name in option.split(",") if name.strip()))
+    unknown = [name for name in browsers if name not in DriverFactory.BROWSERS]
+    if unknown:
+        raise pytest.UsageError(f"--browsers: unsupported browser(s) {', '.join(unknown)}; "
+                                f"choose from {', '.join(DriverFactory.BROWSERS)}")
+    return browsers
+
+
+def pytest_generate_tests(metafunc):
+    """In matrix mode, run every test that uses a browser once per browser"""
+    browsers = get_matrix_browsers(metafunc.config)
+    if browsers and "browser_name" in metafunc.fixturenames:
+        metafunc.parametrize("browser_name", browsers, indirect=True)
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    """Keep only this machine's shard of the collected tests"""
+    shard_count = config.getoption("shard_count")
+    if not shard_count or not items:
+        return
+    shard_index = config.getoption("shard_index")
+    planner = ShardPlanner(shard_count, config.getoption("shard_durations"))
+    selected, deselected = planner.select(items, shard_index)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = selected
+
+
+def pytest_report_collectionfinish(config, items):
+    """Show which shard is running"""
+    shard_count = config.getoption("shard_count")
+    if shard_count:
+        return f"shard {config.getoption('shard_index')} of {shard_count}: {len(items)} tests selected"
+
+
+def pytest_runtest_logstart(nodeid, location):
+    """Attribute driver commands issued from here on (fixtures included) to this test"""
+    TestContext.set_current_test(nodeid)
+
+
+def pytest_runtest_logfinish(nodeid, location):
+    """Stop attributing driver commands to the finished test"""
+    TestContext.set_current_test(None)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Bundle screenshot, DOM, URL, console log and recent commands of a failed test"""
+    outcome = yield
+    report = outcome.get_result()
+    if not report.failed or not TestConfig.FAILURE_BUNDLES:
+        return
+    driver = item.funcargs.get("driver") if hasattr(item, "funcargs") else None
+    if driver is None:
+        return
+    
+    try:
+        bundle = FailureBundle.capture(driver, item.nodeid, report.when, report.longreprtext)
+    except Exception as e:
+        # Never let the bundle hide the test's own failure
+        Logger().warning(f"Could not write the failure bundle of {item.nodeid}: {e}")
+        return
+    # Relative to the pytest-html report when there is one (the lazy report re-anchors it), else to the lazy index
+    report_path = item.config.getoption("htmlpath", None) or item.config.getoption("lazy_report", None)
+    if report_path:
+        link = os.path.relpath(bundle, os.path.dirname(os.path.abspath(report_path))).replace(os.sep, "/")
+        # Same shape as pytest_html.extras.url(), which the lazy report also reads without pytest-html
+        extra = {"name": "Failure bundle", "format_type": "url", "content": link, "mime_type": None, "extension": None}
+        report.extras = getattr(report, "extras", []) + [extra]
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """Write per-worker wait and WebDriver command statistics and finish queued screenshots and logs"""
+    WaitStats.write_report()
+    CommandRecorder.write_report()
+    ScreenshotWriter.flush()
+    Logger.flush()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def local_app():
+    """Fixture to serve the app from a per-worker local stand-in when LOCAL_APP is set"""
+    if not TestConfig.LOCAL_APP:
+        yield None
+        return
+    
+    server = DemoServer(port=TestConfig.LOCAL_APP_PORT).start()
+    original_base_url = TestConfig.BASE_URL
+    TestConfig.BASE_URL = server.base_url
+    yield server
+    TestConfig.BASE_URL = original_base_url
+    server.stop()
+
+
+@pytest.fixture(autouse=True)
+def performance_budget(request, monkeypatch):
+    """Fixture to check page load budgets of tests marked with @pytest.mark.budget
+    
+    Marker arguments: page="InventoryPage" checks one page only and
+    mode="warn" / "fail" overrides BUDGET_MODE. Page timing is turned on for
+    marked tests even when PAGE_TIMING is off. Until PerformanceBudgets.MIN_RUNS
+    runs are in the timing history a page is reported as insufficient and
+    never fails the test, whatever the mode.
+    """
+    marker = request.node.get_closest_marker("budget")
+    if marker is None:
+        yield None
+        return
+    
+    # Undone after this fixture's teardown, so it also covers the driver fixture's teardown capture
+    monkeypatch.setattr(TestConfig, "PAGE_TIMING", True)
+    yield PerformanceBudgetChecker
+    
+    # Runs after the driver fixture's teardown capture, so the last page is included
+    results = PerformanceBudgetChecker().check_test(request.node.nodeid, marker.kwargs.get("page"))
+    request.node.user_properties.append((PerformanceBudgetPlugin.PROPERTY, json.dumps(results)))
+    over = [PerformanceBudgetChecker.format_result(result) for result in results if result["status"] == "over"]
+    if over and marker.kwargs.get("mode", TestConfig.BUDGET_MODE) == "fail":
+        pytest.fail("Performance budget exceeded:\n" + "\n".join(over), pytrace=False)
+
+
+@pytest.fixture(scope="session")
+def driver_pools():
+    """Fixture to provide per-worker pools of reusable WebDriver sessions, one per browser used"""
+    pools = DriverPools()
+    yield pools
+    pools.shutdown()
+
+
+@pytest.fixture(scope="function")
+def browser_name(request):
+    """Fixture to provide the browser of the current matrix cell, or BROWSER outside matrix mode"""
+    return getattr(request, "param", None) or TestConfig.BROWSER
+
+
+@pytest.fixture(scope="function")
+def browser_profile(request):
+    """Fixture to provide the browser profile: full for full_load and budget tests, else BROWSER_PROFILE"""
+    # Budgets are measured on complete page loads
+    if request.node.get_closest_marker("full_load") or request.node.get_closest_marker("budget"):
+        return "full"
+    return TestConfig.BROWSER_PROFILE
+
+
 @pytest.fixture(scope="function")
-def driver():
+def driver(request, driver_pools, browser_name, browser_profile):
     """Fixture to create and manage WebDriver instance"""
-    driver = DriverFactory.get_driver()
+    request.node.user_properties.append((BrowserMatrixPlugin.PROPERTY, browser_name))
+    if not TestConfig.DRIVER_REUSE:
+        driver = DriverFactory.get_driver(browser_name, profile=browser_profile)
+        yield driver
+        if TestConfig.PAGE_TIMING:
+            PageTimingCollector.capture(driver, "teardown")
+        # Teardown: Clean up driver after test
+        driver.quit()
+        return
+    
+    driver_pool = driver_pools.get(browser_name, browser_profile)
+    driver = driver_pool.acquire()
     yield driver
-    # Teardown: Clean up driver after test
-    driver.quit()
+    if TestConfig.PAGE_TIMING:
+        # Pick up a page reached by a click that was still loading when it was checked
+        PageTimingCollector.capture(driver, "teardown")
+    # Teardown: Reset session state and hand the driver back to the pool
+    driver_pool.release(driver)
 
 
 @pytest.fixture(scope="function")
@@ -58,36 +296,51 @@ def checkout_complete_page(driver):
 
 
 @pytest.fixture(scope="function")
-def logged_in_driver(driver):
+def login_as(driver):
+    """Fixture to log the driver in as a TestData.USERS user type"""
+    def _login_as(user_type="valid"):
+        SessionStateCache.login(driver, user_type)
+        return driver
+    return _login_as
+
+
+@pytest.fixture(scope="function")
+def logged_in_driver(driver, login_as):
     """Fixture to provide a driver that's already logged in"""
-    login_page = LoginPage(driver)
-    login_page.navigate_to_login_page()
-    login_page.login(TestConfig.VALID_USERNAME, TestConfig.VALID_PASSWORD)
+    login_as("valid")
     
+    # Teardown is handled by the driver fixture
     yield driver
-    # Teardown: Clean up driver after test
-    driver.quit()
 
 
 @pytest.fixture(scope="function")
-def cart_with_item(logged_in_driver, inventory_page, cart_page):
+def cart_state(driver):
+    """Fixture to seed the cart directly and land on a page of the purchase funnel"""
+    return CartStateBuilder(driver)
+
+
+@pytest.fixture(scope="function")
+def cart_with_item(cart_state, cart_page):
     """Fixture to provide a cart with a specific item"""
-    inventory_page.wait_for_inventory_page_to_load()
-    inventory_page.add_item_to_cart_by_name("Sauce Labs Backpack")
-    inventory_page.click_shopping_cart()
+    cart_state.with_products("Sauce Labs Backpack").open("cart")
     cart_page.wait_for_cart_page_to_load()
     
     yield cart_page
 
 
 @pytest.fixture(scope="function")
-def checkout_page_with_item(logged_in_driver, inventory_page, cart_page, checkout_page):
+def checkout_page_with_item(cart_state, checkout_page):
     """Fixture to provide a checkout page with a specific item"""
-    inventory_page.wait_for_inventory_page_to_load()
-    inventory_page.add_item_to_cart_by_name("Sauce Labs Backpack")
-    inventory_page.click_shopping_cart()
-    cart_page.wait_for_cart_page_to_load()
-    cart_page.click_checkout()
+    cart_state.with_products("Sauce Labs Backpack").open("checkout_step_one")
     checkout_page.wait_for_checkout_page_to_load()
     
-    yield checkout_page 
\ No newline at end of file
+    yield checkout_page
+
+
+@pytest.fixture(scope="function")
+def checkout_overview_with_item(cart_state, checkout_overview_page):
+    """Fixture to provide a checkout overview page with a specific item"""
+    cart_state.with_products("Sauce Labs Backpack").open("checkout_step_two")
+    checkout_overview_page.wait_for_overview_page_to_load()
+    
+    yield checkout_overview_page 
\ No newline at end of file
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Load test: run the purchase journey with many concurrent headless browsers
+
+Usage:
+    python load_test.py --users 10 --duration 300 --ramp-up 60
+    python load_test.py --users 5 --iterations 20 --local-app
+    python load_test.py --protocol --users 2000 --duration 120 --local-app
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from config.config import TestConfig
+from config.latency_profiles import LatencyProfiles
+from config.test_data import TestData
+from utils.demo_server import DemoServer
+from utils.load_generator import LoadGenerator, PurchaseJourney
+from utils.protocol_driver import ProtocolLoadGenerator
+
+
+def print_summary(summary):
+    """Print throughput and the per-step latency table"""
+    print("=" * 72)
+    print(f"👥 {summary['users']} users, {summary['elapsed_s']:.1f}s elapsed (ramp-up {summary['ramp_up_s']:.0f}s)")
+    print(f"🛒 {summary['completed_checkouts']} completed checkouts, {summary['checkouts_per_min']:.2f} checkouts/min")
+    if "connections_opened" in summary:
+        print(f"🔌 {summary['requests']} requests over {summary['connections_opened']} connections")
+    print("-" * 72)
+    print(f"{'step':<12}{'count':>7}{'errors':>8}{'p50':>9}{'p90':>9}{'p95':>9}{'p99':>9}{'max':>9}")
+    for step in PurchaseJourney.STEPS:
+        stats = summary["steps"][step]
+        cells = [
+            "-" if stats[key] is None else f"{stats[key]:.2f}s"
+            for key in ("p50_s", "p90_s", "p95_s", "p99_s", "max_s")
+        ]
+        print(f"{step:<12}{stats['count']:>7}{stats['errors']:>8}" + "".join(f"{cell:>9}" for cell in cells))
+    print("=" * 72)
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Run the purchase journey with concurrent headless browsers")
+    parser.add_argument("--users", type=int, default=1, help="Concurrent virtual users (one browser each)")
+    parser.add_argument("--duration", type=float, help="Stop after this many seconds")
+    parser.add_argument("--iterations", type=int, help="Journeys per virtual user")
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="Seconds over which users are started")
+    parser.add_argument("--browser", choices=["chrome", "firefox", "edge"], help="Browser to use (default: BROWSER)")
+    parser.add_argument("--items", nargs="+", choices=sorted(TestData.PRODUCTS),
+                        default=["Sauce Labs Backpack"], metavar="ITEM", help="Products added to the cart")
+    parser.add_argument("--checkout-data", choices=sorted(TestData.CHECKOUT_DATA), default="valid",
+                        help="Checkout form data set")
+    parser.add_argument("--local-app", action="store_true", help="Run against the bundled local stand-in")
+    parser.add_argument("--latency-profile", choices=LatencyProfiles.get_profile_names(),
+                        help="Latency/fault profile of the local stand-in (implies --local-app)")
+    parser.add_argument("--protocol", action="store_true",
+                        help="Replay the journey as plain HTTP requests instead of driving browsers")
+    parser.add_argument("--connections", type=int,
+                        help="Keep-alive connections shared by all --protocol users (default: min(users, 50))")
+    parser.add_argument("--output", default="reports/load_report.json", help="JSON summary file")
+    args = parser.parse_args()
+    
+    if args.duration is None and args.iterations is None:
+        parser.error("one of --duration or --iterations is required")
+    if args.users < 1:
+        parser.error("--users must be at least 1")
+    if args.protocol and not (args.local_app or args.latency_profile):
+        parser.error("--protocol replays the local stand-in's page scripts and needs --local-app")
+    
+    server = None
+    if args.local_app or args.latency_profile:
+        server = DemoServer(latency_profile=args.latency_profile).start()
+        TestConfig.BASE_URL = server.base_url
+    
+    print(f"🚀 {'Protocol' if args.protocol else 'Browser'} load test against {TestConfig.BASE_URL}")
+    options = dict(
+        users=args.users,
+        duration=args.duration,
+        iterations=args.iterations,
+        ramp_up=args.ramp_up,
+        items=args.items,
+        checkout_data=TestData.get_checkout_data(args.checkout_data),
+    )
+    if args.protocol:
+        generator = ProtocolLoadGenerator(connections=args.connections, **options)
+    else:
+        generator = LoadGenerator(browser_name=args.browser, **options)
+    try:
+        summary = generator.run()
+    except KeyboardInterrupt:
+        print("⚠️  Interrupted, reporting what completed so far")
+        summary = generator.summary()
+    finally:
+        if server is not None:
+            server.stop()
+    
+    print_summary(summary)
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(summary, f, indent=2)
+    print(f"📊 JSON Report: {output.absolute()}")
+    
+    errors = sum(stats["errors"] for stats in summary["steps"].values())
+    return 1 if errors or not summary["completed_checkouts"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
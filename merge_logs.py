@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Interleave the per-worker JSON-lines logs (logs/automation*.jsonl) by timestamp
+
+Usage:
+    python merge_logs.py                              # all workers, as text
+    python merge_logs.py --test test_login --level WARNING
+    python merge_logs.py --json --output logs/merged.jsonl
+"""
+
+import argparse
+import heapq
+import json
+import logging
+import re
+import sys
+from datetime import datetime
+from pathlib import Path
+
+
+def find_worker_logs(logs_dir):
+    """Group log files by worker, each group ordered oldest (highest backup number) first"""
+    workers = {}
+    for path in logs_dir.glob("automation*.jsonl*"):
+        match = re.fullmatch(r"(automation[^.]*)\.jsonl(?:\.(\d+))?", path.name)
+        if match:
+            workers.setdefault(match.group(1), []).append((int(match.group(2) or 0), path))
+    return {
+        name: [path for _, path in sorted(files, key=lambda item: -item[0])]
+        for name, files in sorted(workers.items())
+    }
+
+
+def read_entries(paths):
+    """Yield the entries of one worker's files in order, skipping unreadable lines"""
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+
+def format_entry(entry):
+    """Render an entry as one readable line"""
+    timestamp = datetime.fromtimestamp(entry["ts"]).strftime("%H:%M:%S.%f")[:-3]
+    test = f" [{entry['test']}]" if entry.get("test") else ""
+    line = f"{timestamp} {entry['worker']:<6} {entry['level']:<8}{test} {entry['msg']}"
+    if entry.get("exc"):
+        line += "\n" + entry["exc"]
+    return line
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Merge per-worker logs by timestamp")
+    parser.add_argument("--logs-dir", default="logs", help="Directory holding automation*.jsonl")
+    parser.add_argument("--test", help="Only entries whose test node id contains this text")
+    parser.add_argument("--level", default="DEBUG", choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+                        help="Minimum level to show")
+    parser.add_argument("--json", action="store_true", help="Write JSON lines instead of text")
+    parser.add_argument("--output", help="Write to this file instead of stdout")
+    args = parser.parse_args()
+    
+    workers = find_worker_logs(Path(args.logs_dir))
+    if not workers:
+        print(f"❌ No logs found in {Path(args.logs_dir).absolute()}/automation*.jsonl", file=sys.stderr)
+        return 1
+    
+    # Each worker's files are already in time order, so a k-way merge is enough
+    merged = heapq.merge(*(read_entries(paths) for paths in workers.values()), key=lambda entry: entry["ts"])
+    min_level = logging.getLevelName(args.level)
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        for entry in merged:
+            if logging.getLevelName(entry["level"]) < min_level:
+                continue
+            if args.test and args.test not in (entry.get("test") or ""):
+                continue
+            output.write((json.dumps(entry, separators=(",", ":")) if args.json else format_entry(entry)) + "\n")
+    finally:
+        if args.output:
+            output.close()
+            print(f"📄 Merged {len(workers)} worker logs into {Path(args.output).absolute()}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
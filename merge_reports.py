@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Merge per-shard reports (reports/shard-N/) into a single report under reports/
+
+Usage:
+    python merge_reports.py                    # merge reports/shard-*/ into reports/
+    python merge_reports.py --reports-dir out  # merge out/shard-*/ into out/
+"""
+
+import argparse
+import html
+import json
+import re
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+
+def find_shard_dirs(reports_dir):
+    """Find shard report directories, ordered by shard index"""
+    shard_dirs = [path for path in reports_dir.glob("shard-*") if path.is_dir()]
+    return sorted(shard_dirs, key=lambda path: int(re.sub(r"\D", "", path.name) or 0))
+
+
+def get_outcome(testcase):
+    """Get the outcome of a JUnit testcase element"""
+    for tag in ("failure", "error", "skipped"):
+        if testcase.find(tag) is not None:
+            return {"failure": "failed", "error": "error", "skipped": "skipped"}[tag]
+    return "passed"
+
+
+def merge_junit(shard_dirs, output_path):
+    """Merge shard JUnit files into one <testsuites> document; return the test cases"""
+    root = ET.Element("testsuites")
+    totals = {"tests": 0, "failures": 0, "errors": 0, "skipped": 0, "time": 0.0}
+    cases = []
+    for shard_dir in shard_dirs:
+        junit_path = shard_dir / "report.xml"
+        if not junit_path.exists():
+            continue
+        shard_root = ET.parse(junit_path).getroot()
+        suites = [shard_root] if shard_root.tag == "testsuite" else shard_root.findall("testsuite")
+        for suite in suites:
+            suite.set("name", f"{suite.get('name', 'pytest')}-{shard_dir.name}")
+            for key in ("tests", "failures", "errors", "skipped"):
+                totals[key] += int(suite.get(key, 0))
+            totals["time"] += float(suite.get("time", 0))
+            for testcase in suite.iter("testcase"):
+                cases.append({
+                    "shard": shard_dir.name,
+                    "classname": testcase.get("classname", ""),
+                    "name": testcase.get("name", ""),
+                    "time": float(testcase.get("time", 0)),
+                    "outcome": get_outcome(testcase),
+                })
+            root.append(suite)
+    if not cases:
+        return cases
+    for key, value in totals.items():
+        root.set(key, f"{value:.3f}" if key == "time" else str(value))
+    ET.ElementTree(root).write(output_path, encoding="utf-8", xml_declaration=True)
+    return cases
+
+
+def merge_json(shard_dirs, output_path):
+    """Merge shard pytest-json-report files; return True if any were found"""
+    merged = None
+    for shard_dir in shard_dirs:
+        json_path = shard_dir / "report.json"
+        if not json_path.exists():
+            continue
+        with open(json_path, encoding="utf-8") as f:
+            report = json.load(f)
+        for test in report.get("tests", []):
+            test["shard"] = shard_dir.name
+        if merged is None:
+            merged = report
+            merged["shards"] = [shard_dir.name]
+            continue
+        merged["shards"].append(shard_dir.name)
+        merged["tests"] = merged.get("tests", []) + report.get("tests", [])
+        merged["duration"] = max(merged.get("duration", 0), report.get("duration", 0))
+        for key, value in report.get("summary", {}).items():
+            if isinstance(value, (int, float)):
+                merged.setdefault("summary", {})[key] = merged["summary"].get(key, 0) + value
+    if merged is None:
+        return False
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(merged, f, indent=2)
+    return True
+
+
+def write_html(cases, shard_dirs, output_path):
+    """Write one HTML page with every shard's results and links to the shard reports"""
+    counts = {}
+    for case in cases:
+        counts[case["outcome"]] = counts.get(case["outcome"], 0) + 1
+    shard_time = {}
+    for case in cases:
+        shard_time[case["shard"]] = shard_time.get(case["shard"], 0.0) + case["time"]
+    
+    shard_rows = "".join(
+        f"<tr><td>{html.escape(shard_dir.name)}</td>"
+        f"<td>{sum(1 for case in cases if case['shard'] == shard_dir.name)}</td>"
+        f"<td>{shard_time.get(shard_dir.name, 0.0):.1f}s</td>"
+        f"<td><a href=\"{html.escape(shard_dir.name)}/report.html\">HTML report</a></td></tr>"
+        for shard_dir in shard_dirs
+    )
+    order = {"failed": 0, "error": 1, "skipped": 2, "passed": 3}
+    test_rows = "".join(
+        f"<tr class=\"{case['outcome']}\"><td>{case['outcome']}</td>"
+        f"<td>{html.escape(case['classname'])}::{html.escape(case['name'])}</td>"
+        f"<td>{case['time']:.2f}s</td><td>{html.escape(case['shard'])}</td></tr>"
+        for case in sorted(cases, key=lambda case: (order.get(case["outcome"], 4), case["classname"], case["name"]))
+    )
+    summary = ", ".join(f"{count} {outcome}" for outcome, count in sorted(counts.items()))
+    page = f"""<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Merged test report</title>
+<style>
+body {{ font-family: Helvetica, Arial, sans-serif; font-size: 13px; margin: 20px; }}
+table {{ border-collapse: collapse; margin-bottom: 24px; }}
+td, th {{ border: 1px solid #e6e6e6; padding: 4px 10px; text-align: left; }}
+tr.failed td:first-child, tr.error td:first-child {{ color: #d00; font-weight: bold; }}
+tr.passed td:first-child {{ color: #080; }}
+tr.skipped td:first-child {{ color: #888; }}
+</style>
+</head>
+<body>
+<h1>Merged test report</h1>
+<p>{len(cases)} tests from {len(shard_dirs)} shards: {summary}</p>
+<h2>Shards</h2>
+<table><tr><th>Shard</th><th>Tests</th><th>Test time</th><th>Report</th></tr>{shard_rows}</table>
+<h2>Tests</h2>
+<table><tr><th>Result</th><th>Test</th><th>Duration</th><th>Shard</th></tr>{test_rows}</table>
+</body>
+</html>
+"""
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(page)
+
+
+def main():
+    """Main function"""
+    parser = argparse.ArgumentParser(description="Merge per-shard test reports")
+    parser.add_argument("--reports-dir", default="reports", help="Directory holding shard-N/ subdirectories")
+    args = parser.parse_args()
+    
+    reports_dir = Path(args.reports_dir)
+    shard_dirs = find_shard_dirs(reports_dir)
+    if not shard_dirs:
+        print(f"❌ No shard reports found in {reports_dir.absolute()}/shard-*/")
+        return 1
+    
+    print(f"📁 Merging {len(shard_dirs)} shards: {', '.join(path.name for path in shard_dirs)}")
+    cases = merge_junit(shard_dirs, reports_dir / "report.xml")
+    if cases:
+        print(f"   XML Report: {(reports_dir / 'report.xml').absolute()}")
+        write_html(cases, shard_dirs, reports_dir / "report.html")
+        print(f"   HTML Report: {(reports_dir / 'report.html').absolute()}")
+    else:
+        print("⚠️  No shard JUnit reports (report.xml) found, skipping XML and HTML")
+    if merge_json(shard_dirs, reports_dir / "report.json"):
+        print(f"   JSON Report: {(reports_dir / 'report.json').absolute()}")
+    
+    failed = sum(1 for case in cases if case["outcome"] in ("failed", "error"))
+    print(f"✅ Merged {len(cases)} tests ({failed} failed)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,9 +9,17 @@ import webbrowser
 from pathlib import Path
 
 
+def find_html_report():
+    """Get the most recently written of the lazy report index and the pytest-html report"""
+    candidates = [path for path in (Path("reports/index.html"), Path("reports/report.html")) if path.exists()]
+    if not candidates:
+        return Path("reports/report.html")
+    return max(candidates, key=lambda path: path.stat().st_mtime)
+
+
 def open_html_report():
     """Open the HTML test report in the default browser"""
-    report_path = Path("reports/report.html")
+    report_path = find_html_report()
     
     if not report_path.exists():
         print("❌ HTML report not found!")
@@ -1,5 +1,6 @@
 from selenium.webdriver.common.by import By
 from utils.base_page import BasePage
+from utils.item_index import ItemIndex
 
 
 class CartPage(BasePage):
@@ -16,66 +17,66 @@ class CartPage(BasePage):
     CHECKOUT_BUTTON = (By.CLASS_NAME, "btn_action")
     CART_TITLE = (By.CLASS_NAME, "subheader")
     
+    SNAPSHOT_FIELDS = {
+        "name": ITEM_NAMES,
+        "price": ITEM_PRICES,
+        "quantity": ITEM_QUANTITIES,
+    }
+    
+    INDEX_PARTS = {
+        "name": ITEM_NAMES,
+        "price": ITEM_PRICES,
+        "quantity": ITEM_QUANTITIES,
+        "button": REMOVE_BUTTONS,
+    }
+    
     def __init__(self, driver):
         super().__init__(driver)
+        self.item_index = ItemIndex(self, self.CART_LIST, self.CART_ITEMS, self.INDEX_PARTS)
     
     def wait_for_cart_page_to_load(self):
         """Wait for cart page to load completely"""
         self.wait_for_element_visible(self.CART_LIST)
     
+    def get_items_snapshot(self):
+        """Get name, price, quantity, button state and index of every cart item in one call"""
+        return self.get_listing_snapshot(self.CART_LIST, self.CART_ITEMS, self.SNAPSHOT_FIELDS)
+    
     def get_cart_items_count(self):
         """Get the number of items in cart"""
-        items = self.find_elements(self.CART_ITEMS)
-        return len(items)
+        return len(self.get_items_snapshot())
     
     def get_all_item_names(self):
         """Get all item names in cart"""
-        items = self.find_elements(self.ITEM_NAMES)
-        return [item.text for item in items]
+        return [item["name"] for item in self.get_items_snapshot()]
     
     def get_all_item_prices(self):
         """Get all item prices in cart"""
-        items = self.find_elements(self.ITEM_PRICES)
-        return [item.text for item in items]
+        return [item["price"] for item in self.get_items_snapshot()]
     
     def get_all_item_quantities(self):
         """Get all item quantities in cart"""
-        items = self.find_elements(self.ITEM_QUANTITIES)
-        return [item.text for item in items]
+        return [item["quantity"] for item in self.get_items_snapshot()]
     
     def get_item_by_name(self, item_name):
         """Get cart item element by name"""
-        items = self.find_elements(self.CART_ITEMS)
-        for item in items:
-            name_element = item.find_element(By.CLASS_NAME, "inventory_item_name")
-            if name_element.text == item_name:
-                return item
-        return None
+        entry = self.item_index.get(item_name)
+        return entry["item"] if entry else None
     
     def remove_item_by_name(self, item_name):
         """Remove item from cart by name"""
-        item = self.get_item_by_name(item_name)
-        if item:
-            remove_button = item.find_element(By.CLASS_NAME, "btn_secondary")
-            remove_button.click()
+        def remove(entry):
+            entry["button"].click()
             return True
-        return False
+        return self.item_index.apply(item_name, remove, default=False)
     
     def get_item_price_by_name(self, item_name):
         """Get item price by name"""
-        item = self.get_item_by_name(item_name)
-        if item:
-            price_element = item.find_element(By.CLASS_NAME, "inventory_item_price")
-            return price_element.text
-        return None
+        return self.item_index.apply(item_name, lambda entry: entry["price"].text)
     
     def get_item_quantity_by_name(self, item_name):
         """Get item quantity by name"""
-        item = self.get_item_by_name(item_name)
-        if item:
-            quantity_element = item.find_element(By.CLASS_NAME, "cart_quantity")
-            return quantity_element.text
-        return None
+        return self.item_index.apply(item_name, lambda entry: entry["quantity"].text)
     
     def click_continue_shopping(self):
         """Click continue shopping button"""
@@ -130,9 +131,6 @@ class CartPage(BasePage):
             return False
     
     def is_checkout_button_enabled(self):
-        """Check if checkout button is enabled"""
-        try:
-            element = self.find_element(self.CHECKOUT_BUTTON)
-            return element.is_enabled()
-        except:
-            return False 
\ No newline at end of file
+        """Check if checkout button is enabled (without waiting, so an absent button fails fast)"""
+        buttons = self.find_elements_now(self.CHECKOUT_BUTTON)
+        return bool(buttons) and buttons[0].is_enabled() 
\ No newline at end of file
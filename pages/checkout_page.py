@@ -1,4 +1,5 @@
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException
 from utils.base_page import BasePage
 
 
@@ -14,6 +15,9 @@ class CheckoutPage(BasePage):
     CANCEL_BUTTON = (By.CLASS_NAME, "btn_secondary")
     ERROR_MESSAGE = (By.CLASS_NAME, "error-message-container")
     ERROR_MESSAGE_TEXT = (By.CLASS_NAME, "error-message-container")
+    
+    # The error is rendered by the submit handler, so reading it right after a submit waits briefly
+    ERROR_MESSAGE_TIMEOUT = 2
     CHECKOUT_TITLE = (By.CLASS_NAME, "subheader")
     
     def __init__(self, driver):
@@ -49,11 +53,11 @@ class CheckoutPage(BasePage):
         """Click cancel button"""
         self.click_element(self.CANCEL_BUTTON)
     
-    def get_error_message(self):
-        """Get error message text"""
+    def get_error_message(self, timeout=ERROR_MESSAGE_TIMEOUT):
+        """Get the error message text, waiting up to timeout seconds for it after a submit ("" when none is shown)"""
         try:
-            return self.get_element_text(self.ERROR_MESSAGE_TEXT)
-        except:
+            return self.get_element_text(self.ERROR_MESSAGE_TEXT, timeout)
+        except TimeoutException:
             return ""
     
     def is_error_message_displayed(self):
@@ -135,6 +139,12 @@ class CheckoutOverviewPage(BasePage):
     CANCEL_BUTTON = (By.CLASS_NAME, "btn_secondary")
     OVERVIEW_TITLE = (By.CLASS_NAME, "subheader")
     
+    SNAPSHOT_FIELDS = {
+        "name": ITEM_NAMES,
+        "price": ITEM_PRICES,
+        "quantity": ITEM_QUANTITIES,
+    }
+    
     def __init__(self, driver):
         super().__init__(driver)
     
@@ -142,20 +152,21 @@ class CheckoutOverviewPage(BasePage):
         """Wait for overview page to load completely"""
         self.wait_for_element_visible(self.CHECKOUT_SUMMARY_CONTAINER)
     
+    def get_items_snapshot(self):
+        """Get name, price, quantity and index of every ordered item in one call"""
+        return self.get_listing_snapshot(self.CART_LIST, self.CART_ITEMS, self.SNAPSHOT_FIELDS)
+    
     def get_cart_items_count(self):
         """Get the number of items in cart"""
-        items = self.find_elements(self.CART_ITEMS)
-        return len(items)
+        return len(self.get_items_snapshot())
     
     def get_all_item_names(self):
         """Get all item names in cart"""
-        items = self.find_elements(self.ITEM_NAMES)
-        return [item.text for item in items]
+        return [item["name"] for item in self.get_items_snapshot()]
     
     def get_all_item_prices(self):
         """Get all item prices in cart"""
-        items = self.find_elements(self.ITEM_PRICES)
-        return [item.text for item in items]
+        return [item["price"] for item in self.get_items_snapshot()]
     
     def get_subtotal_text(self):
         """Get subtotal text"""
@@ -2,6 +2,7 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import Select
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 from utils.base_page import BasePage
+from utils.item_index import ItemIndex
 
 
 class InventoryPage(BasePage):
@@ -26,70 +27,77 @@ class InventoryPage(BasePage):
     CLOSE_BURGER_MENU = (By.ID, "react-burger-cross-btn")
     SORT_CONTAINER = (By.CLASS_NAME, "product_sort_container")
     ACTIVE_OPTION = (By.CLASS_NAME, "active_option")
+    ITEM_IMAGES = (By.CLASS_NAME, "inventory_item_img")
+    
+    SNAPSHOT_FIELDS = {
+        "name": ITEM_NAMES,
+        "price": ITEM_PRICES,
+        "description": ITEM_DESCRIPTIONS,
+    }
+    
+    INDEX_PARTS = {
+        "name": ITEM_NAMES,
+        "price": ITEM_PRICES,
+        "description": ITEM_DESCRIPTIONS,
+        "button": ADD_TO_CART_BUTTONS,
+        "image": ITEM_IMAGES,
+    }
     
     def __init__(self, driver):
         super().__init__(driver)
+        self.item_index = ItemIndex(self, self.INVENTORY_LIST, self.INVENTORY_ITEMS, self.INDEX_PARTS)
     
-    def wait_for_inventory_page_to_load(self):
+    def wait_for_inventory_page_to_load(self, timeout=None):
         """Wait for inventory page to load completely"""
-        self.wait_for_element_visible(self.INVENTORY_CONTAINER)
-        self.wait_for_element_visible(self.INVENTORY_LIST)
+        self.wait_for_element_visible(self.INVENTORY_CONTAINER, timeout)
+        self.wait_for_element_visible(self.INVENTORY_LIST, timeout)
+    
+    def get_items_snapshot(self):
+        """Get name, price, description, button state and index of every item in one call"""
+        records = self.get_listing_snapshot(self.INVENTORY_LIST, self.INVENTORY_ITEMS, self.SNAPSHOT_FIELDS)
+        for record in records:
+            record["in_cart"] = (record["button_text"] or "").lower() == "remove"
+        return records
     
     def get_inventory_items_count(self):
         """Get the number of inventory items"""
-        items = self.find_elements(self.INVENTORY_ITEMS)
-        return len(items)
+        return len(self.get_items_snapshot())
     
     def get_all_item_names(self):
         """Get all item names"""
-        items = self.find_elements(self.ITEM_NAMES)
-        return [item.text for item in items]
+        return [item["name"] for item in self.get_items_snapshot()]
     
     def get_all_item_prices(self):
         """Get all item prices"""
-        items = self.find_elements(self.ITEM_PRICES)
-        return [item.text for item in items]
+        return [item["price"] for item in self.get_items_snapshot()]
     
     def get_all_item_descriptions(self):
         """Get all item descriptions"""
-        items = self.find_elements(self.ITEM_DESCRIPTIONS)
-        return [item.text for item in items]
+        return [item["description"] for item in self.get_items_snapshot()]
     
     def get_item_by_name(self, item_name):
         """Get item element by name"""
-        items = self.find_elements(self.INVENTORY_ITEMS)
-        for item in items:
-            name_element = item.find_element(By.CLASS_NAME, "inventory_item_name")
-            if name_element.text == item_name:
-                return item
-        return None
+        entry = self.item_index.get(item_name)
+        return entry["item"] if entry else None
     
     def add_item_to_cart_by_name(self, item_name):
         """Add item to cart by name"""
-        item = self.get_item_by_name(item_name)
-        if item:
-            add_button = item.find_element(By.CLASS_NAME, "btn_inventory")
-            add_button.click()
-            return True
-        return False
+        return self.item_index.apply(item_name, self._click_part("button"), default=False)
     
     def remove_item_from_cart_by_name(self, item_name):
         """Remove item from cart by name"""
-        item = self.get_item_by_name(item_name)
-        if item:
-            remove_button = item.find_element(By.CLASS_NAME, "btn_inventory")
-            if remove_button.text == "Remove":
-                remove_button.click()
+        def remove(entry):
+            if entry["button"].text == "Remove":
+                entry["button"].click()
                 return True
-        return False
+            return False
+        return self.item_index.apply(item_name, remove, default=False)
     
     def get_cart_items_count(self):
         """Get the number of items in cart"""
-        try:
-            badge = self.find_element(self.SHOPPING_CART_BADGE)
-            return int(badge.text)
-        except (TimeoutException, NoSuchElementException):
-            return 0
+        # The badge is only rendered for a non-empty cart, so don't wait for it
+        badges = self.find_elements_now(self.SHOPPING_CART_BADGE)
+        return int(badges[0].text) if badges else 0
     
     def click_shopping_cart(self):
         """Click on shopping cart"""
@@ -103,6 +111,7 @@ class InventoryPage(BasePage):
     def close_burger_menu(self):
         """Close the burger menu"""
         self.click_element(self.CLOSE_BURGER_MENU)
+        self.wait_for_element_invisible(self.BURGER_MENU_ITEMS)
     
     def click_logout(self):
         """Click logout from burger menu"""
@@ -134,49 +143,35 @@ class InventoryPage(BasePage):
     
     def is_item_in_cart(self, item_name):
         """Check if item is in cart"""
-        item = self.get_item_by_name(item_name)
-        if item:
-            button = item.find_element(By.CLASS_NAME, "btn_inventory")
-            return button.text == "Remove"
-        return False
+        return self.item_index.apply(item_name, lambda entry: entry["button"].text == "Remove", default=False)
     
     def get_item_price_by_name(self, item_name):
         """Get item price by name"""
-        item = self.get_item_by_name(item_name)
-        if item:
-            price_element = item.find_element(By.CLASS_NAME, "inventory_item_price")
-            return price_element.text
-        return None
+        return self.item_index.apply(item_name, lambda entry: entry["price"].text)
     
     def get_item_description_by_name(self, item_name):
         """Get item description by name"""
-        item = self.get_item_by_name(item_name)
-        if item:
-            desc_element = item.find_element(By.CLASS_NAME, "inventory_item_desc")
-            return desc_element.text
-        return None
+        return self.item_index.apply(item_name, lambda entry: entry["description"].text)
     
     def click_item_name(self, item_name):
         """Click on item name to view details"""
-        item = self.get_item_by_name(item_name)
-        if item:
-            name_element = item.find_element(By.CLASS_NAME, "inventory_item_name")
-            name_element.click()
-            return True
-        return False
+        return self.item_index.apply(item_name, self._click_part("name"), default=False)
     
     def click_item_image(self, item_name):
         """Click on item image to view details"""
-        item = self.get_item_by_name(item_name)
-        if item:
-            image_element = item.find_element(By.CLASS_NAME, "inventory_item_img")
-            image_element.click()
+        return self.item_index.apply(item_name, self._click_part("image"), default=False)
+    
+    @staticmethod
+    def _click_part(part):
+        """Build an index action that clicks one part of an item row"""
+        def click(entry):
+            entry[part].click()
             return True
-        return False
+        return click
     
     def is_burger_menu_open(self):
         """Check if burger menu is open"""
-        return self.is_element_visible(self.BURGER_MENU_ITEMS)
+        return self.is_element_visible_now(self.BURGER_MENU_ITEMS)
     
     def get_page_title(self):
         """Get the page title"""
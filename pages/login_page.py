@@ -1,4 +1,5 @@
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import TimeoutException
 from utils.base_page import BasePage
 from config.config import TestConfig
 
@@ -12,6 +13,9 @@ class LoginPage(BasePage):
     LOGIN_BUTTON = (By.ID, "login-button")
     ERROR_MESSAGE = (By.CLASS_NAME, "error-message-container")
     ERROR_MESSAGE_TEXT = (By.CLASS_NAME, "error-message-container")
+    
+    # The error is rendered by the submit handler, so reading it right after a submit waits briefly
+    ERROR_MESSAGE_TIMEOUT = 2
     LOGO = (By.CLASS_NAME, "login_logo")
     BOT_COLUMN = (By.CLASS_NAME, "bot_column")
     
@@ -42,11 +46,11 @@ class LoginPage(BasePage):
         self.enter_password(password)
         self.click_login_button()
     
-    def get_error_message(self):
-        """Get the error message text"""
+    def get_error_message(self, timeout=ERROR_MESSAGE_TIMEOUT):
+        """Get the error message text, waiting up to timeout seconds for it after a submit ("" when none is shown)"""
         try:
-            return self.get_element_text(self.ERROR_MESSAGE_TEXT)
-        except:
+            return self.get_element_text(self.ERROR_MESSAGE_TEXT, timeout)
+        except TimeoutException:
             return ""
     
     def is_error_message_displayed(self):
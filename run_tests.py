@@ -11,6 +11,9 @@ import subprocess
 import argparse
 from pathlib import Path
 
+from config.latency_profiles import LatencyProfiles
+from utils.result_cache import ResultCache
+
 
 def create_directories():
     """Create necessary directories if they don't exist"""
@@ -36,6 +39,14 @@ def run_tests(args):
     if args.browser:
         os.environ['BROWSER'] = args.browser
     
+    # Lean profile: no images, fonts, media or analytics; pages return at DOMContentLoaded
+    if args.profile:
+        os.environ['BROWSER_PROFILE'] = args.profile
+    
+    # Cross-browser matrix: every test runs once per browser in this one session
+    if args.browsers:
+        cmd.extend(['--browsers', ','.join(args.browsers)])
+    
     # Add headless mode if specified
     if args.headless:
         os.environ['HEADLESS'] = 'true'
@@ -47,6 +58,28 @@ def run_tests(args):
     if args.page_load_timeout:
         os.environ['PAGE_LOAD_TIMEOUT'] = str(args.page_load_timeout)
     
+    if args.wait_timeout:
+        os.environ['EXPLICIT_WAIT'] = str(args.wait_timeout)
+    
+    if args.poll_frequency:
+        os.environ['POLL_FREQUENCY'] = str(args.poll_frequency)
+    
+    # Serve the app from the bundled local stand-in
+    if args.local_app:
+        os.environ['LOCAL_APP'] = 'true'
+    
+    # Latency profiles are injected by the local stand-in, so they imply --local-app
+    if args.latency_profile:
+        os.environ['LOCAL_APP'] = 'true'
+        os.environ['LATENCY_PROFILE'] = args.latency_profile
+    
+    if args.latency_seed is not None:
+        os.environ['LATENCY_SEED'] = str(args.latency_seed)
+    
+    # Reorder or skip tests using the results of earlier runs
+    if args.incremental:
+        cmd.extend(['--incremental', args.incremental])
+    
     # Add verbosity
     if args.verbose:
         cmd.append('-v')
@@ -56,29 +89,56 @@ def run_tests(args):
         cmd.append('-x')
     
     # Add parallel execution
+    # Longest tests (by recorded duration) are dealt out first across the workers
     if args.parallel:
-        cmd.extend(['-n', 'auto'])
+        cmd.extend(['-n', 'auto', '--dist', 'load'])
+    
+    # Run one shard of the suite; its reports go to reports/shard-N/ for merge_reports.py
+    reports_dir = 'reports'
+    if args.shard_count:
+        reports_dir = f'reports/shard-{args.shard_index}'
+        Path(reports_dir).mkdir(parents=True, exist_ok=True)
+        cmd.extend(['--shard-index', str(args.shard_index), '--shard-count', str(args.shard_count)])
+        if args.shard_durations:
+            cmd.extend(['--shard-durations', args.shard_durations])
+        # pytest.ini writes reports/report.html by default; keep every shard's report separate
+        if args.report_format not in ('html', 'all'):
+            cmd.extend([f'--html={reports_dir}/report.html', '--self-contained-html'])
+        # merge_reports.py combines the shards' JUnit files
+        if args.report_format not in ('xml', 'all'):
+            cmd.append(f'--junitxml={reports_dir}/report.xml')
     
     # Add reporting options
     if args.report_format:
         if args.report_format == 'html':
-            cmd.extend(['--html=reports/report.html', '--self-contained-html'])
+            cmd.extend([f'--html={reports_dir}/report.html', '--self-contained-html'])
+        elif args.report_format == 'lazy':
+            cmd.append(f'--lazy-report={reports_dir}/index.html')
         elif args.report_format == 'json':
-            cmd.extend(['--json-report', '--json-report-file=reports/report.json'])
+            cmd.extend(['--json-report', f'--json-report-file={reports_dir}/report.json'])
         elif args.report_format == 'xml':
-            cmd.extend(['--junitxml=reports/report.xml'])
+            cmd.extend([f'--junitxml={reports_dir}/report.xml'])
         elif args.report_format == 'all':
             cmd.extend([
-                '--html=reports/report.html', 
+                f'--html={reports_dir}/report.html', 
                 '--self-contained-html',
+                f'--lazy-report={reports_dir}/index.html',
                 '--json-report', 
-                '--json-report-file=reports/report.json',
-                '--junitxml=reports/report.xml'
+                f'--json-report-file={reports_dir}/report.json',
+                f'--junitxml={reports_dir}/report.xml'
             ])
     
+    # Zip the lazy report with its files and linked artifacts for sharing
+    if args.report_archive:
+        if args.report_format not in ('lazy', 'all'):
+            cmd.append(f'--lazy-report={reports_dir}/index.html')
+        cmd.append('--lazy-report-archive')
+    
     print(f"Running command: {' '.join(cmd)}")
     print(f"Environment: BROWSER={os.environ.get('BROWSER', 'chrome')}, "
-          f"HEADLESS={os.environ.get('HEADLESS', 'false')}")
+          f"HEADLESS={os.environ.get('HEADLESS', 'false')}, "
+          f"LOCAL_APP={os.environ.get('LOCAL_APP', 'false')}, "
+          f"LATENCY_PROFILE={os.environ.get('LATENCY_PROFILE', 'default')}")
     print("-" * 50)
     
     try:
@@ -90,11 +150,13 @@ def run_tests(args):
         if args.report_format:
             print("\n📊 Reports generated:")
             if args.report_format in ['html', 'all']:
-                print(f"   HTML Report: {os.path.abspath('reports/report.html')}")
+                print(f"   HTML Report: {os.path.abspath(f'{reports_dir}/report.html')}")
+            if args.report_format in ['lazy', 'all'] or args.report_archive:
+                print(f"   Lazy HTML Report: {os.path.abspath(f'{reports_dir}/index.html')}")
             if args.report_format in ['json', 'all']:
-                print(f"   JSON Report: {os.path.abspath('reports/report.json')}")
+                print(f"   JSON Report: {os.path.abspath(f'{reports_dir}/report.json')}")
             if args.report_format in ['xml', 'all']:
-                print(f"   XML Report: {os.path.abspath('reports/report.xml')}")
+                print(f"   XML Report: {os.path.abspath(f'{reports_dir}/report.xml')}")
         
         return result.returncode
     except subprocess.CalledProcessError as e:
@@ -105,11 +167,13 @@ def run_tests(args):
         if args.report_format:
             print("\n📊 Reports generated (may contain failure details):")
             if args.report_format in ['html', 'all']:
-                print(f"   HTML Report: {os.path.abspath('reports/report.html')}")
+                print(f"   HTML Report: {os.path.abspath(f'{reports_dir}/report.html')}")
+            if args.report_format in ['lazy', 'all'] or args.report_archive:
+                print(f"   Lazy HTML Report: {os.path.abspath(f'{reports_dir}/index.html')}")
             if args.report_format in ['json', 'all']:
-                print(f"   JSON Report: {os.path.abspath('reports/report.json')}")
+                print(f"   JSON Report: {os.path.abspath(f'{reports_dir}/report.json')}")
             if args.report_format in ['xml', 'all']:
-                print(f"   XML Report: {os.path.abspath('reports/report.xml')}")
+                print(f"   XML Report: {os.path.abspath(f'{reports_dir}/report.xml')}")
         
         return e.returncode
 
@@ -124,11 +188,19 @@ def main():
             python run_tests.py                           # Run all tests
             python run_tests.py -m login                  # Run login tests only
             python run_tests.py -m e2e -b firefox        # Run e2e tests in Firefox
+            python run_tests.py --browsers chrome firefox edge --parallel  # Cross-browser matrix in one run
             python run_tests.py --headless               # Run tests in headless mode
+            python run_tests.py --profile lean --headless  # Skip images/fonts/analytics, eager page loads
             python run_tests.py tests/test_login.py      # Run specific test file
             python run_tests.py -m smoke --parallel      # Run smoke tests in parallel
             python run_tests.py --report-format html     # Generate HTML report
             python run_tests.py --report-format all      # Generate all report formats
+            python run_tests.py --report-format lazy --report-archive  # Lazy report plus a zip to share
+            python run_tests.py --local-app --parallel   # Run offline against the local stand-in
+            python run_tests.py --latency-profile glitch_p99 tests/test_login.py  # Heavy-tailed glitch latency
+            python run_tests.py --shard-index 0 --shard-count 4  # Run the first of 4 balanced shards
+            python merge_reports.py                      # Merge reports/shard-*/ into reports/
+            python run_tests.py --incremental skip-passed  # Rerun only failed and changed tests
         """
     )
     
@@ -152,6 +224,19 @@ def main():
         help='Browser to use for testing (default: chrome)'
     )
     
+    parser.add_argument(
+        '--browsers',
+        nargs='+',
+        choices=['chrome', 'firefox', 'edge'],
+        help='Run every test once per browser in a single run (overrides -b); combine with --parallel'
+    )
+    
+    parser.add_argument(
+        '--profile',
+        choices=['full', 'lean'],
+        help='Browser profile; lean skips images, fonts, media and analytics (default: BROWSER_PROFILE or full)'
+    )
+    
     parser.add_argument(
         '--headless',
         action='store_true',
@@ -161,7 +246,19 @@ def main():
     parser.add_argument(
         '--implicit-wait',
         type=int,
-        help='Implicit wait timeout in seconds'
+        help='Implicit wait timeout in seconds (default 0; stacks with explicit waits)'
+    )
+    
+    parser.add_argument(
+        '--wait-timeout',
+        type=int,
+        help='Default explicit wait timeout in seconds'
+    )
+    
+    parser.add_argument(
+        '--poll-frequency',
+        type=float,
+        help='Polling interval in seconds for explicit waits'
     )
     
     parser.add_argument(
@@ -170,6 +267,24 @@ def main():
         help='Page load timeout in seconds'
     )
     
+    parser.add_argument(
+        '--local-app',
+        action='store_true',
+        help='Run against the bundled local Sauce Demo stand-in instead of saucedemo.com'
+    )
+    
+    parser.add_argument(
+        '--latency-profile',
+        choices=LatencyProfiles.get_profile_names(),
+        help='Latency/fault injection profile for the local stand-in (implies --local-app)'
+    )
+    
+    parser.add_argument(
+        '--latency-seed',
+        type=int,
+        help='Seed for latency/fault sampling, to replay a run exactly'
+    )
+    
     parser.add_argument(
         '-v', '--verbose',
         action='store_true',
@@ -185,17 +300,52 @@ def main():
     parser.add_argument(
         '--parallel',
         action='store_true',
-        help='Run tests in parallel'
+        help='Run tests in parallel, longest recorded tests first'
+    )
+    
+    parser.add_argument(
+        '--incremental',
+        choices=ResultCache.MODES,
+        help='failed-first/changed-first: reorder tests; changed-only: only tests whose code or config '
+             'changed; skip-passed: skip tests that passed against identical code and config'
+    )
+    
+    parser.add_argument(
+        '--shard-index',
+        type=int,
+        help='Shard to run on this machine, 0-based (requires --shard-count)'
+    )
+    
+    parser.add_argument(
+        '--shard-count',
+        type=int,
+        help='Split the suite into this many duration-balanced shards'
+    )
+    
+    parser.add_argument(
+        '--shard-durations',
+        help='Durations file shared by all shards (default: .cache/durations.json)'
     )
     
     parser.add_argument(
         '--report-format',
-        choices=['html', 'json', 'xml', 'all'],
-        help='Generate test reports in specified format(s)'
+        choices=['html', 'lazy', 'json', 'xml', 'all'],
+        help='Generate test reports in specified format(s); lazy is a small index that loads results on demand'
+    )
+    
+    parser.add_argument(
+        '--report-archive',
+        action='store_true',
+        help='Also write the lazy report and its artifacts to a single zip (implies a lazy report)'
     )
     
     args = parser.parse_args()
     
+    if (args.shard_index is None) != (args.shard_count is None):
+        parser.error('--shard-index and --shard-count must be given together')
+    if args.shard_count is not None and not 0 <= args.shard_index < args.shard_count:
+        parser.error(f'--shard-index must be in 0..{args.shard_count - 1}')
+    
     # Create necessary directories
     create_directories()
     
@@ -30,14 +30,10 @@ class TestCheckout:
         error_message = checkout_page_with_item.get_error_message()
         assert "Error" in error_message
     
-    def test_checkout_form_validation_missing_first_name(self, logged_in_driver, inventory_page, cart_page, checkout_page):
+    def test_checkout_form_validation_missing_first_name(self, cart_state, checkout_page):
         """Test checkout form validation with missing first name"""
-        # Navigate to checkout
-        inventory_page.wait_for_inventory_page_to_load()
-        inventory_page.add_item_to_cart_by_name("Sauce Labs Backpack")
-        inventory_page.click_shopping_cart()
-        cart_page.wait_for_cart_page_to_load()
-        cart_page.click_checkout()
+        # Land directly on checkout step one
+        cart_state.with_products("Sauce Labs Backpack").open("checkout_step_one")
         checkout_page.wait_for_checkout_page_to_load()
         
         # Fill form without first name
@@ -48,14 +44,10 @@ class TestCheckout:
         # Verify error message
         assert checkout_page.is_error_message_displayed()
     
-    def test_checkout_form_validation_missing_last_name(self, logged_in_driver, inventory_page, cart_page, checkout_page):
+    def test_checkout_form_validation_missing_last_name(self, cart_state, checkout_page):
         """Test checkout form validation with missing last name"""
-        # Navigate to checkout
-        inventory_page.wait_for_inventory_page_to_load()
-        inventory_page.add_item_to_cart_by_name("Sauce Labs Backpack")
-        inventory_page.click_shopping_cart()
-        cart_page.wait_for_cart_page_to_load()
-        cart_page.click_checkout()
+        # Land directly on checkout step one
+        cart_state.with_products("Sauce Labs Backpack").open("checkout_step_one")
         checkout_page.wait_for_checkout_page_to_load()
         
         # Fill form without last name
@@ -66,14 +58,10 @@ class TestCheckout:
         # Verify error message
         assert checkout_page.is_error_message_displayed()
     
-    def test_checkout_form_validation_missing_postal_code(self, logged_in_driver, inventory_page, cart_page, checkout_page):
+    def test_checkout_form_validation_missing_postal_code(self, cart_state, checkout_page):
         """Test checkout form validation with missing postal code"""
-        # Navigate to checkout
-        inventory_page.wait_for_inventory_page_to_load()
-        inventory_page.add_item_to_cart_by_name("Sauce Labs Backpack")
-        inventory_page.click_shopping_cart()
-        cart_page.wait_for_cart_page_to_load()
-        cart_page.click_checkout()
+        # Land directly on checkout step one
+        cart_state.with_products("Sauce Labs Backpack").open("checkout_step_one")
         checkout_page.wait_for_checkout_page_to_load()
         
         # Fill form without postal code
@@ -84,14 +72,10 @@ class TestCheckout:
         # Verify error message
         assert checkout_page.is_error_message_displayed()
     
-    def test_successful_checkout_form_submission(self, logged_in_driver, inventory_page, cart_page, checkout_page, checkout_overview_page):
+    def test_successful_checkout_form_submission(self, cart_state, checkout_page, checkout_overview_page):
         """Test successful checkout form submission"""
-        # Navigate to checkout
-        inventory_page.wait_for_inventory_page_to_load()
-        inventory_page.add_item_to_cart_by_name("Sauce Labs Backpack")
-        inventory_page.click_shopping_cart()
-        cart_page.wait_for_cart_page_to_load()
-        cart_page.click_checkout()
+        # Land directly on checkout step one
+        cart_state.with_products("Sauce Labs Backpack").open("checkout_step_one")
         checkout_page.wait_for_checkout_page_to_load()
         
         # Fill checkout form
@@ -103,14 +87,10 @@ class TestCheckout:
         assert "/checkout-step-two.html" in checkout_overview_page.get_current_url()
         assert "Checkout: Overview" in checkout_overview_page.get_overview_title()
     
-    def test_checkout_form_field_functionality(self, logged_in_driver, inventory_page, cart_page, checkout_page):
+    def test_checkout_form_field_functionality(self, cart_state, checkout_page):
         """Test checkout form field functionality"""
-        # Navigate to checkout
-        inventory_page.wait_for_inventory_page_to_load()
-        inventory_page.add_item_to_cart_by_name("Sauce Labs Backpack")
-        inventory_page.click_shopping_cart()
-        cart_page.wait_for_cart_page_to_load()
-        cart_page.click_checkout()
+        # Land directly on checkout step one
+        cart_state.with_products("Sauce Labs Backpack").open("checkout_step_one")
         checkout_page.wait_for_checkout_page_to_load()
         
         # Test first name field
@@ -131,14 +111,10 @@ class TestCheckout:
         checkout_page.clear_postal_code()
         assert checkout_page.get_postal_code_value() == ""
     
-    def test_checkout_cancel_functionality(self, logged_in_driver, inventory_page, cart_page, checkout_page):
+    def test_checkout_cancel_functionality(self, cart_state, checkout_page):
         """Test checkout cancel functionality"""
-        # Navigate to checkout
-        inventory_page.wait_for_inventory_page_to_load()
-        inventory_page.add_item_to_cart_by_name("Sauce Labs Backpack")
-        inventory_page.click_shopping_cart()
-        cart_page.wait_for_cart_page_to_load()
-        cart_page.click_checkout()
+        # Land directly on checkout step one
+        cart_state.with_products("Sauce Labs Backpack").open("checkout_step_one")
         checkout_page.wait_for_checkout_page_to_load()
         
         # Click cancel
@@ -147,17 +123,10 @@ class TestCheckout:
         # Verify navigation back to cart
         assert "/cart.html" in checkout_page.get_current_url()
     
-    def test_checkout_overview_page_display(self, logged_in_driver, inventory_page, cart_page, checkout_page, checkout_overview_page):
+    def test_checkout_overview_page_display(self, cart_state, checkout_overview_page):
         """Test checkout overview page displays correctly"""
-        # Complete checkout form
-        inventory_page.wait_for_inventory_page_to_load()
-        inventory_page.add_item_to_cart_by_name("Sauce Labs Backpack")
-        inventory_page.click_shopping_cart()
-        cart_page.wait_for_cart_page_to_load()
-        cart_page.click_checkout()
-        checkout_page.wait_for_checkout_page_to_load()
-        checkout_page.fill_checkout_form("John", "Doe", "12345")
-        checkout_page.click_continue()
+        # Land directly on the checkout overview
+        cart_state.with_products("Sauce Labs Backpack").open("checkout_step_two")
         
         # Verify overview page
         checkout_overview_page.wait_for_overview_page_to_load()
@@ -166,17 +135,10 @@ class TestCheckout:
         assert "Tax:" in checkout_overview_page.get_tax_text()
         assert "Total:" in checkout_overview_page.get_total_text()
     
-    def test_checkout_overview_calculations(self, logged_in_driver, inventory_page, cart_page, checkout_page, checkout_overview_page):
+    def test_checkout_overview_calculations(self, cart_state, checkout_overview_page):
         """Test checkout overview calculations"""
-        # Complete checkout form
-        inventory_page.wait_for_inventory_page_to_load()
-        inventory_page.add_item_to_cart_by_name("Sauce Labs Backpack")
-        inventory_page.click_shopping_cart()
-        cart_page.wait_for_cart_page_to_load()
-        cart_page.click_checkout()
-        checkout_page.wait_for_checkout_page_to_load()
-        checkout_page.fill_checkout_form("John", "Doe", "12345")
-        checkout_page.click_continue()
+        # Land directly on the checkout overview
+        cart_state.with_products("Sauce Labs Backpack").open("checkout_step_two")
         
         # Verify calculations
         checkout_overview_page.wait_for_overview_page_to_load()
@@ -192,17 +154,10 @@ class TestCheckout:
         expected_total = subtotal + tax
         assert abs(total - expected_total) < 0.01
     
-    def test_checkout_overview_cancel_functionality(self, logged_in_driver, inventory_page, cart_page, checkout_page, checkout_overview_page):
+    def test_checkout_overview_cancel_functionality(self, cart_state, checkout_overview_page):
         """Test checkout overview cancel functionality"""
-        # Complete checkout form
-        inventory_page.wait_for_inventory_page_to_load()
-        inventory_page.add_item_to_cart_by_name("Sauce Labs Backpack")
-        inventory_page.click_shopping_cart()
-        cart_page.wait_for_cart_page_to_load()
-        cart_page.click_checkout()
-        checkout_page.wait_for_checkout_page_to_load()
-        checkout_page.fill_checkout_form("John", "Doe", "12345")
-        checkout_page.click_continue()
+        # Land directly on the checkout overview
+        cart_state.with_products("Sauce Labs Backpack").open("checkout_step_two")
         
         # Cancel from overview
         checkout_overview_page.wait_for_overview_page_to_load()
@@ -211,14 +166,11 @@ class TestCheckout:
         # Verify navigation back to inventory
         assert "/inventory.html" in checkout_overview_page.get_current_url()
     
-    def test_checkout_complete_flow(self, logged_in_driver, inventory_page, cart_page, checkout_page, checkout_overview_page, checkout_complete_page):
+    @pytest.mark.full_load
+    def test_checkout_complete_flow(self, cart_state, checkout_page, checkout_overview_page, checkout_complete_page):
         """Test complete checkout flow from cart to completion"""
-        # Start checkout process
-        inventory_page.wait_for_inventory_page_to_load()
-        inventory_page.add_item_to_cart_by_name("Sauce Labs Backpack")
-        inventory_page.click_shopping_cart()
-        cart_page.wait_for_cart_page_to_load()
-        cart_page.click_checkout()
+        # Land directly on checkout step one
+        cart_state.with_products("Sauce Labs Backpack").open("checkout_step_one")
         checkout_page.wait_for_checkout_page_to_load()
         
         # Fill checkout form
@@ -235,17 +187,10 @@ class TestCheckout:
         assert "Thank you for your order!" in checkout_complete_page.get_complete_header()
         assert checkout_complete_page.is_pony_express_image_displayed()
     
-    def test_checkout_complete_back_home_functionality(self, logged_in_driver, inventory_page, cart_page, checkout_page, checkout_overview_page, checkout_complete_page):
+    def test_checkout_complete_back_home_functionality(self, cart_state, checkout_overview_page, checkout_complete_page):
         """Test back home functionality from completion page"""
-        # Complete checkout flow
-        inventory_page.wait_for_inventory_page_to_load()
-        inventory_page.add_item_to_cart_by_name("Sauce Labs Backpack")
-        inventory_page.click_shopping_cart()
-        cart_page.wait_for_cart_page_to_load()
-        cart_page.click_checkout()
-        checkout_page.wait_for_checkout_page_to_load()
-        checkout_page.fill_checkout_form("John", "Doe", "12345")
-        checkout_page.click_continue()
+        # Land directly on the checkout overview
+        cart_state.with_products("Sauce Labs Backpack").open("checkout_step_two")
         checkout_overview_page.wait_for_overview_page_to_load()
         checkout_overview_page.click_finish()
         
@@ -256,19 +201,14 @@ class TestCheckout:
         # Verify navigation back to inventory
         assert "/inventory.html" in checkout_complete_page.get_current_url()
     
-    def test_checkout_with_multiple_items(self, logged_in_driver, inventory_page, cart_page, checkout_page, checkout_overview_page):
+    def test_checkout_with_multiple_items(self, cart_state, checkout_page, checkout_overview_page):
         """Test checkout with multiple items"""
-        # Add multiple items
-        inventory_page.wait_for_inventory_page_to_load()
+        # Seed multiple items and land on checkout step one
         items_to_add = ["Sauce Labs Backpack", "Sauce Labs Bike Light"]
-        for item in items_to_add:
-            inventory_page.add_item_to_cart_by_name(item)
+        cart_state.with_products(*items_to_add).open("checkout_step_one")
+        checkout_page.wait_for_checkout_page_to_load()
         
         # Complete checkout
-        inventory_page.click_shopping_cart()
-        cart_page.wait_for_cart_page_to_load()
-        cart_page.click_checkout()
-        checkout_page.wait_for_checkout_page_to_load()
         checkout_page.fill_checkout_form("John", "Doe", "12345")
         checkout_page.click_continue()
         
@@ -280,14 +220,10 @@ class TestCheckout:
         for item in items_to_add:
             assert item in item_names
     
-    def test_checkout_form_clear_functionality(self, logged_in_driver, inventory_page, cart_page, checkout_page):
+    def test_checkout_form_clear_functionality(self, cart_state, checkout_page):
         """Test checkout form clear functionality"""
-        # Navigate to checkout
-        inventory_page.wait_for_inventory_page_to_load()
-        inventory_page.add_item_to_cart_by_name("Sauce Labs Backpack")
-        inventory_page.click_shopping_cart()
-        cart_page.wait_for_cart_page_to_load()
-        cart_page.click_checkout()
+        # Land directly on checkout step one
+        cart_state.with_products("Sauce Labs Backpack").open("checkout_step_one")
         checkout_page.wait_for_checkout_page_to_load()
         
         # Fill form
@@ -301,27 +237,19 @@ class TestCheckout:
         assert checkout_page.get_last_name_value() == ""
         assert checkout_page.get_postal_code_value() == ""
     
-    def test_checkout_page_title(self, logged_in_driver, inventory_page, cart_page, checkout_page):
+    def test_checkout_page_title(self, cart_state, checkout_page):
         """Test checkout page title"""
-        # Navigate to checkout
-        inventory_page.wait_for_inventory_page_to_load()
-        inventory_page.add_item_to_cart_by_name("Sauce Labs Backpack")
-        inventory_page.click_shopping_cart()
-        cart_page.wait_for_cart_page_to_load()
-        cart_page.click_checkout()
+        # Land directly on checkout step one
+        cart_state.with_products("Sauce Labs Backpack").open("checkout_step_one")
         checkout_page.wait_for_checkout_page_to_load()
         
         # Verify page title
         assert "Swag Labs" in checkout_page.get_page_title()
     
-    def test_checkout_button_states(self, logged_in_driver, inventory_page, cart_page, checkout_page):
+    def test_checkout_button_states(self, cart_state, checkout_page):
         """Test checkout button states"""
-        # Navigate to checkout
-        inventory_page.wait_for_inventory_page_to_load()
-        inventory_page.add_item_to_cart_by_name("Sauce Labs Backpack")
-        inventory_page.click_shopping_cart()
-        cart_page.wait_for_cart_page_to_load()
-        cart_page.click_checkout()
+        # Land directly on checkout step one
+        cart_state.with_products("Sauce Labs Backpack").open("checkout_step_one")
         checkout_page.wait_for_checkout_page_to_load()
         
         # Verify buttons are enabled
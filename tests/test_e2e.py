@@ -11,6 +11,7 @@ from config.test_data import TestData
 class TestEndToEnd:
     """End-to-end test cases covering complete user journeys"""
     
+    @pytest.mark.full_load
     @pytest.mark.parametrize("items,checkout_data", [
         (["Sauce Labs Backpack"], TestData.get_checkout_data("valid")),
         (["Sauce Labs Backpack", "Sauce Labs Bike Light", "Sauce Labs Bolt T-Shirt"], 
@@ -166,6 +166,7 @@ class TestInventory:
         # Verify navigation to item details page
         assert "/inventory-item.html" in inventory_page.get_current_url()
     
+    @pytest.mark.full_load
     def test_click_item_image_navigates_to_details(self, logged_in_driver, inventory_page):
         """Test clicking item image navigates to item details"""
         inventory_page.wait_for_inventory_page_to_load()
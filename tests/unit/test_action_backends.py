@@ -0,0 +1,214 @@
+import pytest
+from types import SimpleNamespace
+
+# Setup Python path using PathManager
+from utils.path_manager import PathManager
+PathManager.setup_python_path()
+
+from selenium.common.exceptions import ElementClickInterceptedException, TimeoutException
+from selenium.webdriver.common.by import By
+from utils import action_backends
+from utils.action_backends import CdpActions, CdpPageSession, WebDriverActions
+from utils.cdp_client import CdpError
+
+
+class FakeConnection:
+    """Stands in for CdpConnection: records commands and lets a test fire events"""
+    
+    def __init__(self, url=None, timeout=None, responses=None):
+        self.url = url
+        self.closed = False
+        self.sent = []
+        self.responses = list(responses or [])
+        self._listeners = {}
+    
+    def on(self, event, callback):
+        """Register an event callback"""
+        self._listeners.setdefault(event, []).append(callback)
+    
+    def emit(self, event, params=None):
+        """Deliver an event as the reader thread would"""
+        for callback in self._listeners.get(event, ()):
+            callback(params or {})
+    
+    def send(self, method, params=None, timeout=None):
+        """Send one command"""
+        return self.send_batch([(method, params)], timeout)[0]
+    
+    def send_batch(self, commands, timeout=None):
+        """Record commands and answer them"""
+        self.sent.extend(commands)
+        results = []
+        for method, params in commands:
+            if method == "Page.getFrameTree":
+                results.append({"frameTree": {"frame": {"id": "MAIN"}}})
+            elif method == "Runtime.evaluate" and self.responses:
+                response = self.responses.pop(0)
+                if isinstance(response, Exception):
+                    raise response
+                results.append(response)
+            else:
+                results.append({})
+        return results
+    
+    def close(self):
+        """Close and notify the close listeners"""
+        self.closed = True
+        self.emit("close", {"reason": "closed by client"})
+
+
+class FakeWaits:
+    """Stands in for WaitEngine: records the waits the backend reports"""
+    
+    timeout = 1
+    
+    def __init__(self):
+        self.recorded = []
+    
+    def record(self, label, elapsed, timed_out):
+        """Record one wait"""
+        self.recorded.append((label, timed_out))
+
+
+class ChromiumDriver:
+    """A driver that reports a DevTools address, like chromedriver does; each window is its own target"""
+    
+    capabilities = {"goog:chromeOptions": {"debuggerAddress": "127.0.0.1:9222"}}
+    
+    def __init__(self, session_id="S1"):
+        self.session_id = session_id
+        self.current_window_handle = "WINDOW-1"
+    
+    def execute_cdp_cmd(self, method, params):
+        """Answer Target.getTargetInfo for the current window"""
+        return {"targetInfo": {"targetId": f"TARGET-{self.current_window_handle}"}}
+
+
+def evaluated(value=None, exception=None):
+    """A Runtime.evaluate result returning value or throwing an error with the given description"""
+    if exception is not None:
+        return {"result": {}, "exceptionDetails": {"exception": {"description": exception}}}
+    return {"result": {"value": value}}
+
+
+class TestCdpPageSession:
+    """Unit tests for navigation tracking and the per-window session registry"""
+    
+    @pytest.fixture
+    def session(self):
+        """A session on a fake connection"""
+        return CdpPageSession(FakeConnection())
+    
+    def test_reads_main_frame(self, session):
+        """Test that the session enables Page events and learns the main frame"""
+        assert session.main_frame_id == "MAIN"
+        assert [method for method, _ in session.connection.sent] == ["Page.enable", "Page.getFrameTree"]
+    
+    def test_main_frame_navigation_waits_for_dom_content_loaded(self, session):
+        """Test that a main-frame navigation is pending until DOMContentLoaded"""
+        session.connection.emit("Page.frameStartedLoading", {"frameId": "MAIN"})
+        assert not session._loaded.is_set()
+        session.connection.emit("Page.domContentEventFired", {"timestamp": 1.0})
+        assert session._loaded.is_set()
+    
+    def test_subframe_navigation_is_ignored(self, session):
+        """Test that iframes loading do not hold actions back"""
+        session.connection.emit("Page.frameRequestedNavigation", {"frameId": "AD-FRAME"})
+        assert session._loaded.is_set()
+    
+    @pytest.mark.parametrize("event", ["Page.navigatedWithinDocument", "Page.frameStoppedLoading"])
+    def test_navigations_without_dom_content_loaded_finish(self, session, event):
+        """Test that same-document and aborted navigations do not leave the session waiting"""
+        session.connection.emit("Page.frameRequestedNavigation", {"frameId": "MAIN"})
+        session.connection.emit(event, {"frameId": "MAIN"})
+        assert session._loaded.is_set()
+    
+    def test_session_is_shared_and_dropped_on_close(self, monkeypatch):
+        """Test that page objects of one driver share a session until its connection closes"""
+        monkeypatch.setattr(action_backends, "CdpConnection", FakeConnection)
+        monkeypatch.setattr(CdpPageSession, "_sessions", {})
+        driver = ChromiumDriver()
+        session = CdpPageSession.for_driver(driver)
+        assert CdpPageSession.for_driver(driver) is session
+        session.connection.close()
+        assert (driver.session_id, driver.current_window_handle) not in CdpPageSession._sessions
+        assert CdpPageSession.for_driver(driver) is not session
+    
+    def test_each_window_gets_its_own_target(self, monkeypatch):
+        """Test that switching windows connects to the new window's target and switching back reuses the first"""
+        monkeypatch.setattr(action_backends, "CdpConnection", FakeConnection)
+        monkeypatch.setattr(CdpPageSession, "_sessions", {})
+        driver = ChromiumDriver()
+        first = CdpPageSession.for_driver(driver)
+        driver.current_window_handle = "WINDOW-2"
+        second = CdpPageSession.for_driver(driver)
+        assert second is not first
+        assert first.connection.url.endswith("/devtools/page/TARGET-WINDOW-1")
+        assert second.connection.url.endswith("/devtools/page/TARGET-WINDOW-2")
+        driver.current_window_handle = "WINDOW-1"
+        assert CdpPageSession.for_driver(driver) is first
+    
+    def test_unreachable_cdp_falls_back_to_webdriver(self, monkeypatch):
+        """Test that drivers without a DevTools address get WebDriver actions"""
+        monkeypatch.setattr(CdpPageSession, "_sessions", {})
+        driver = SimpleNamespace(session_id="FF", current_window_handle="W", capabilities={"browserName": "firefox"})
+        assert isinstance(CdpActions.for_driver(driver, FakeWaits()), WebDriverActions)
+
+
+class TestCdpActions:
+    """Unit tests for the waits and error mapping of the CDP backend"""
+    
+    @pytest.fixture
+    def actions(self, monkeypatch):
+        """Factory of CDP actions whose Runtime.evaluate calls return responses in turn"""
+        monkeypatch.setattr(action_backends, "CdpConnection", FakeConnection)
+        monkeypatch.setattr(CdpPageSession, "_sessions", {})
+        
+        def make(*responses):
+            driver = ChromiumDriver()
+            actions = CdpActions.for_driver(driver, FakeWaits())
+            actions.session.connection.responses.extend(responses)
+            return actions
+        return make
+    
+    def test_click_sends_one_input_batch(self, actions):
+        """Test that a click is a move, press and release at the element's centre"""
+        actions = actions(evaluated({"x": 10, "y": 20}))
+        actions.click((By.ID, "login-button"), 1, "click_element")
+        mouse_events = [params for method, params in actions.session.connection.sent
+                        if method == "Input.dispatchMouseEvent"]
+        assert [event["type"] for event in mouse_events] == ["mouseMoved", "mousePressed", "mouseReleased"]
+        assert (mouse_events[1]["x"], mouse_events[1]["y"]) == (10, 20)
+        assert actions.waits.recorded == [("click_element", False)]
+    
+    def test_retries_when_navigation_replaces_the_document(self, actions):
+        """Test that an evaluation lost to a navigation is retried in the new document"""
+        actions = actions(CdpError("Runtime.evaluate failed: Execution context was destroyed."),
+                               evaluated("Products"))
+        assert actions.get_text((By.CLASS_NAME, "title"), 1, "get_element_text") == "Products"
+    
+    def test_timeout_maps_to_timeout_exception(self, actions):
+        """Test that an in-page timeout raises TimeoutException and is recorded as one"""
+        actions = actions(evaluated(exception="Error: cdp-wait-timeout"))
+        with pytest.raises(TimeoutException):
+            actions.get_text((By.ID, "missing"), 1, "get_element_text")
+        assert actions.waits.recorded == [("get_element_text", True)]
+    
+    def test_covered_element_maps_to_click_intercepted(self, actions):
+        """Test that a click on a covered element raises ElementClickInterceptedException"""
+        actions = actions(evaluated(exception="Error: cdp-click-intercepted by <div class=\"overlay\">"))
+        with pytest.raises(ElementClickInterceptedException):
+            actions.click((By.ID, "checkout"), 1, "click_element")
+    
+    def test_typing_replaces_content(self, actions):
+        """Test that typing focuses the element and inserts the text in one command"""
+        actions = actions(evaluated(True))
+        actions.type_text((By.ID, "user-name"), "standard_user", 1, "send_keys_to_element")
+        assert actions.session.connection.sent[-1] == ("Input.insertText", {"text": "standard_user"})
+    
+    def test_actions_follow_switch_to_window(self, actions):
+        """Test that a page object created in one window acts in the window the driver switched to"""
+        actions = actions(evaluated("First window"))
+        actions.driver.current_window_handle = "WINDOW-2"
+        CdpPageSession.for_driver(actions.driver).connection.responses.append(evaluated("Second window"))
+        assert actions.get_text((By.CLASS_NAME, "title"), 1, "get_element_text") == "Second window"
@@ -0,0 +1,228 @@
+import base64
+import hashlib
+import json
+import socket
+import struct
+import threading
+import pytest
+
+# Setup Python path using PathManager
+from utils.path_manager import PathManager
+PathManager.setup_python_path()
+
+from utils.cdp_client import CdpConnection, CdpError
+
+
+class FakeDevTools:
+    """A one-connection websocket server answering CDP commands like a browser would
+    
+    Every command is echoed back in its result. "Fail" gets an error
+    response, "Big" a 70000 byte result (64-bit length) and "Frag" a
+    fragmented response with a ping between the fragments. Each command is
+    preceded by a Page.frameStartedLoading event.
+    """
+    
+    def __init__(self):
+        self.server = socket.socket()
+        self.server.bind(("127.0.0.1", 0))
+        self.server.listen(1)
+        self.frames = []
+        self.pongs = []
+        self.closed = threading.Event()
+        self._client = None
+        threading.Thread(target=self._serve, daemon=True).start()
+    
+    @property
+    def url(self):
+        """Address the client connects to"""
+        return f"ws://127.0.0.1:{self.server.getsockname()[1]}/devtools/page/TARGET"
+    
+    def drop(self):
+        """Close the connection without a close frame, as a crashed browser would"""
+        self._client.shutdown(socket.SHUT_RDWR)
+        self._client.close()
+    
+    @staticmethod
+    def frame(opcode, payload, fin=True):
+        """Build an unmasked server frame"""
+        length = len(payload)
+        if length < 126:
+            header = bytes([length])
+        elif length < 1 << 16:
+            header = bytes([126]) + struct.pack("!H", length)
+        else:
+            header = bytes([127]) + struct.pack("!Q", length)
+        return bytes([(0x80 if fin else 0) | opcode]) + header + payload
+    
+    def _recv_exact(self, size):
+        """Read exactly size bytes from the client"""
+        data = b""
+        while len(data) < size:
+            chunk = self._client.recv(size - len(data))
+            if not chunk:
+                raise EOFError
+            data += chunk
+        return data
+    
+    def _serve(self):
+        """Accept one client, complete the handshake and answer its frames"""
+        self._client, _ = self.server.accept()
+        request = b""
+        while b"\r\n\r\n" not in request:
+            request += self._client.recv(1024)
+        key = next(
+            line.split(b":", 1)[1].strip().decode() for line in request.split(b"\r\n")
+            if line.lower().startswith(b"sec-websocket-key")
+        )
+        accept = base64.b64encode(hashlib.sha1((key + CdpConnection.GUID).encode()).digest()).decode()
+        self._client.sendall(
+            f"HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+            f"Sec-WebSocket-Accept: {accept}\r\n\r\n".encode()
+        )
+        try:
+            while True:
+                first, second = self._recv_exact(2)
+                length = second & 0x7F
+                if length == 126:
+                    length = struct.unpack("!H", self._recv_exact(2))[0]
+                elif length == 127:
+                    length = struct.unpack("!Q", self._recv_exact(8))[0]
+                mask = self._recv_exact(4)
+                payload = bytes(byte ^ mask[index % 4] for index, byte in enumerate(self._recv_exact(length)))
+                opcode = first & 0x0F
+                self.frames.append((first, second, opcode, payload))
+                if opcode == CdpConnection.OP_CLOSE:
+                    break
+                if opcode == CdpConnection.OP_PONG:
+                    self.pongs.append(payload)
+                    continue
+                self._answer(json.loads(payload))
+        except (EOFError, OSError):
+            pass
+        self.closed.set()
+    
+    def _answer(self, message):
+        """Send an event and then the response to one command"""
+        event = {"method": "Page.frameStartedLoading", "params": {"frameId": "MAIN"}}
+        self._client.sendall(self.frame(CdpConnection.OP_TEXT, json.dumps(event).encode()))
+        if message["method"] == "Fail":
+            response = {"id": message["id"], "error": {"message": "No node with given id"}}
+        elif message["method"] == "Big":
+            response = {"id": message["id"], "result": {"value": "x" * 70000}}
+        else:
+            response = {"id": message["id"], "result": {"echo": message["params"]}}
+        payload = json.dumps(response).encode()
+        if message["method"] == "Frag":
+            self._client.sendall(
+                self.frame(CdpConnection.OP_TEXT, payload[:5], fin=False)
+                + self.frame(CdpConnection.OP_PING, b"keepalive")
+                + self.frame(CdpConnection.OP_CONTINUATION, payload[5:])
+            )
+        else:
+            self._client.sendall(self.frame(CdpConnection.OP_TEXT, payload))
+
+
+class TestCdpFraming:
+    """Unit tests for the websocket frames the client writes"""
+    
+    @staticmethod
+    def decode(frame):
+        """Split a client frame into (first byte, length, mask, unmasked payload)"""
+        length = frame[1] & 0x7F
+        offset = 2
+        if length == 126:
+            length, offset = struct.unpack("!H", frame[2:4])[0], 4
+        elif length == 127:
+            length, offset = struct.unpack("!Q", frame[2:10])[0], 10
+        mask = frame[offset:offset + 4]
+        masked = frame[offset + 4:]
+        assert len(masked) == length
+        return frame[0], frame[1], mask, bytes(byte ^ mask[index % 4] for index, byte in enumerate(masked))
+    
+    @pytest.mark.parametrize("size, length_byte", [(0, 0), (125, 125), (126, 126), (65535, 126), (65536, 127)])
+    def test_length_encoding(self, size, length_byte):
+        """Test the 7-bit, 16-bit and 64-bit payload lengths around their boundaries"""
+        payload = bytes(index % 251 for index in range(size))
+        first, second, mask, unmasked = self.decode(CdpConnection._encode_frame(CdpConnection.OP_TEXT, payload))
+        assert second & 0x7F == length_byte
+        assert unmasked == payload
+    
+    def test_frames_are_final_and_masked(self):
+        """Test that client frames set FIN and the mask bit and do not send the payload in clear"""
+        payload = b'{"id":1,"method":"Runtime.evaluate"}'
+        frame = CdpConnection._encode_frame(CdpConnection.OP_TEXT, payload)
+        first, second, mask, unmasked = self.decode(frame)
+        assert first == 0x80 | CdpConnection.OP_TEXT
+        assert second & 0x80
+        assert len(mask) == 4
+        assert unmasked == payload
+        assert payload not in frame
+
+
+class TestCdpConnection:
+    """Unit tests for CdpConnection against a fake DevTools endpoint"""
+    
+    @pytest.fixture
+    def devtools(self):
+        """A fresh fake endpoint"""
+        return FakeDevTools()
+    
+    @pytest.fixture
+    def connection(self, devtools):
+        """A client connected to the fake endpoint"""
+        connection = CdpConnection(devtools.url, timeout=5)
+        yield connection
+        connection.close()
+    
+    def test_send_returns_result(self, connection):
+        """Test that a response is matched to its command"""
+        assert connection.send("Runtime.evaluate", {"expression": "1"}) == {"echo": {"expression": "1"}}
+    
+    def test_send_batch_keeps_order(self, connection):
+        """Test that a batch returns the results in command order"""
+        results = connection.send_batch([("A", {"n": 1}), ("B", {"n": 2}), ("C", {"n": 3})])
+        assert [result["echo"]["n"] for result in results] == [1, 2, 3]
+    
+    def test_large_payloads(self, connection):
+        """Test 16-bit lengths on the way out and 64-bit lengths on the way back"""
+        assert connection.send("Echo", {"text": "y" * 300})["echo"]["text"] == "y" * 300
+        assert len(connection.send("Big")["value"]) == 70000
+    
+    def test_fragmented_response_with_ping(self, connection, devtools):
+        """Test that fragments are reassembled and a ping in between is answered"""
+        assert connection.send("Frag", {"c": 3}) == {"echo": {"c": 3}}
+        assert devtools.pongs == [b"keepalive"]
+    
+    def test_error_response_raises(self, connection):
+        """Test that an error response raises CdpError with the browser's message"""
+        with pytest.raises(CdpError, match="No node with given id"):
+            connection.send("Fail")
+    
+    def test_events_reach_listeners(self, connection):
+        """Test that events are handed to the callbacks registered for them"""
+        events = []
+        connection.on("Page.frameStartedLoading", events.append)
+        connection.send("A")
+        assert events == [{"frameId": "MAIN"}]
+    
+    def test_close_sends_close_frame(self, connection, devtools):
+        """Test that close() sends a close frame and later commands fail"""
+        reasons = []
+        connection.on("close", reasons.append)
+        connection.close()
+        assert devtools.closed.wait(5)
+        assert devtools.frames[-1][2] == CdpConnection.OP_CLOSE
+        assert reasons == [{"reason": "closed by client"}]
+        with pytest.raises(CdpError, match="closed"):
+            connection.send("A")
+    
+    def test_lost_connection_fails_commands(self, connection, devtools):
+        """Test that a dropped connection marks the client closed and notifies listeners"""
+        lost = threading.Event()
+        connection.on("close", lambda params: lost.set())
+        connection.send("A")
+        devtools.drop()
+        assert lost.wait(5)
+        assert connection.closed
+        with pytest.raises(CdpError):
+            connection.send("A")
@@ -0,0 +1,55 @@
+import threading
+import pytest
+
+# Setup Python path using PathManager
+from utils.path_manager import PathManager
+PathManager.setup_python_path()
+
+from utils.command_recorder import CommandRecorder
+from utils.test_context import TestContext
+
+
+class TestCommandRecorder:
+    """Unit tests for command aggregation and attribution"""
+    
+    @pytest.fixture(autouse=True)
+    def clean_recorder(self):
+        """Start and end every test with an empty recorder"""
+        CommandRecorder.reset()
+        yield
+        CommandRecorder.reset()
+    
+    @staticmethod
+    def record(duration_ms, command="findElement"):
+        """Record one successful command"""
+        CommandRecorder.record(command, {}, duration_ms / 1000, {"status": 0, "value": None})
+    
+    def test_percentiles_are_bucket_estimates(self):
+        """Test that histogram percentiles are close above the exact nearest-rank values"""
+        for duration_ms in range(1, 1001):
+            self.record(duration_ms)
+        stats = CommandRecorder.summary()["commands"]["findElement"]
+        assert stats["count"] == 1000
+        assert stats["total_ms"] == pytest.approx(500500, rel=1e-6)
+        assert stats["max_ms"] == 1000
+        for name, exact in (("p50_ms", 500), ("p95_ms", 950), ("p99_ms", 990)):
+            assert exact <= stats[name] <= exact * 1.1
+    
+    def test_memory_does_not_grow_with_calls(self):
+        """Test that repeated durations share buckets instead of being stored one by one"""
+        for _ in range(10000):
+            self.record(12.5)
+        sample = CommandRecorder._samples[("commands", "findElement")]
+        assert sample["count"] == 10000
+        assert len(sample["buckets"]) == 1
+    
+    def test_helper_threads_are_not_attributed_to_the_test(self):
+        """Test that commands from other threads (e.g. pool pre-warming) are not charged to the test"""
+        self.record(5)
+        thread = threading.Thread(target=self.record, args=(50, "newSession"))
+        thread.start()
+        thread.join()
+        tests = CommandRecorder.summary()["tests"]
+        assert list(tests) == [TestContext.current_test]
+        assert list(tests[TestContext.current_test]["commands"]) == ["findElement"]
+        assert [entry["test"] for entry in CommandRecorder.get_history()] == [TestContext.current_test, None]
@@ -0,0 +1,73 @@
+import json
+import os
+import time
+import pytest
+
+# Setup Python path using PathManager
+from utils.path_manager import PathManager
+PathManager.setup_python_path()
+
+from config.config import TestConfig
+from utils.driver_resolver import DriverBinaryResolver, _LockFile
+
+
+class TestLockFile:
+    """Unit tests for the download lock shared by xdist workers"""
+    
+    def test_lock_of_a_dead_process_is_taken_over(self, tmp_path, monkeypatch):
+        """Test that a lock left behind by an exited process does not block"""
+        monkeypatch.setattr(_LockFile, "_pid_exists", staticmethod(lambda pid: False))
+        lock_path = tmp_path / "manifest.lock"
+        lock_path.write_text("12345")
+        with _LockFile(lock_path, timeout=1):
+            assert lock_path.read_text() == str(os.getpid())
+        assert not lock_path.exists()
+    
+    def test_timeout_leaves_a_live_owner_its_lock(self, tmp_path):
+        """Test that waiting past the timeout raises instead of deleting the lock"""
+        lock_path = tmp_path / "manifest.lock"
+        lock_path.write_text(str(os.getpid()))
+        with pytest.raises(TimeoutError):
+            with _LockFile(lock_path, timeout=0.2, poll_interval=0.05):
+                pass
+        assert lock_path.read_text() == str(os.getpid())
+
+
+class TestDriverBinaryResolver:
+    """Unit tests for manifest validity and the expired-entry fallback"""
+    
+    @pytest.fixture
+    def manifest_path(self, tmp_path, monkeypatch):
+        """An isolated manifest with a downloaded chrome driver entry resolved two days ago"""
+        binary = tmp_path / "chromedriver"
+        binary.write_text("")
+        manifest_path = tmp_path / "manifest.json"
+        manifest_path.write_text(json.dumps({"chrome": {
+            "path": str(binary), "resolved_at": time.time() - 48 * 3600, "pinned": False,
+            "browser_version": "120.0.6099", "driver_version": "120.0.6099.109",
+        }}))
+        monkeypatch.setattr(DriverBinaryResolver, "get_manifest_path", classmethod(lambda cls: manifest_path))
+        monkeypatch.setattr(DriverBinaryResolver, "_resolved", {})
+        monkeypatch.setattr(DriverBinaryResolver, "_browser_versions", {})
+        monkeypatch.setattr(TestConfig, "DRIVER_MANIFEST", "")
+        monkeypatch.setattr(TestConfig, "DRIVER_CACHE_TTL_HOURS", 24)
+        monkeypatch.delenv("CHROMEDRIVER_PATH", raising=False)
+        return manifest_path
+    
+    @pytest.mark.parametrize("browser_version, valid", [
+        ("120.0.6099", True),     # Same browser: valid past the TTL
+        ("121.0.6167", False),    # Browser updated
+        (None, False),            # Version unknown: the TTL decides
+    ])
+    def test_entry_follows_the_browser_version(self, manifest_path, browser_version, valid):
+        """Test that the recorded browser version, not only the TTL, decides whether an entry is reused"""
+        DriverBinaryResolver._browser_versions["chrome"] = browser_version
+        assert bool(DriverBinaryResolver._from_manifest(manifest_path, "chrome")) == valid
+    
+    def test_failed_download_falls_back_to_the_expired_binary(self, manifest_path, monkeypatch):
+        """Test that an expired binary still on disk is used when the download fails"""
+        DriverBinaryResolver._browser_versions["chrome"] = "121.0.6167"
+        monkeypatch.setattr(TestConfig, "DRIVER_OFFLINE", False)
+        monkeypatch.setattr(DriverBinaryResolver, "_download", classmethod(lambda cls, browser: None))
+        expected = json.loads(manifest_path.read_text())["chrome"]["path"]
+        assert DriverBinaryResolver.resolve("chrome") == expected
@@ -0,0 +1,117 @@
+import json
+from types import SimpleNamespace
+import pytest
+
+# Setup Python path using PathManager
+from utils.path_manager import PathManager
+PathManager.setup_python_path()
+
+from utils.duration_scheduler import DurationScheduling
+from utils.duration_store import DurationSchedulingPlugin, DurationStore
+
+
+class FakeNode:
+    """Stands in for an xdist WorkerController: records the test indexes it is sent"""
+    
+    def __init__(self, name):
+        self.gateway = SimpleNamespace(id=name)
+        self.shutting_down = False
+        self.received = []
+    
+    def send_runtest_some(self, indices):
+        """Record the tests sent to this worker"""
+        self.received.extend(indices)
+    
+    def shutdown(self):
+        """Note that the worker was told to stop"""
+        self.shutting_down = True
+
+
+def fake_config(tx=("popen", "popen"), dist="load", workerinput=None):
+    """A config exposing the xdist options the scheduler and the plugin read"""
+    options = {"tx": list(tx), "dist": dist, "maxschedchunk": None}
+    config = SimpleNamespace(
+        getoption=lambda name, default=None: options.get(name, default),
+        getvalue=lambda name: options[name],
+    )
+    if workerinput is not None:
+        config.workerinput = workerinput
+    return config
+
+
+class TestDurationStore:
+    """Unit tests for the smoothed durations and the estimates built on them"""
+    
+    @pytest.fixture
+    def store(self, tmp_path):
+        """A store with three timed tests"""
+        store = DurationStore(tmp_path / "durations.json")
+        for nodeid, seconds in (("e2e", 30.0), ("cart", 6.0), ("login", 2.0)):
+            store.record(nodeid, seconds)
+        return store
+    
+    def test_record_smooths_outliers(self, store):
+        """Test that a new measurement only moves the duration halfway"""
+        store.record("login", 10.0)
+        assert store.get("login") == 6.0
+        assert store.durations["login"] == {"duration": 6.0, "last": 10.0, "runs": 2}
+    
+    def test_unknown_tests_are_estimated_at_the_median(self, store, tmp_path):
+        """Test that a new test is expected to take the median known duration, or the default without history"""
+        assert store.estimate("new") == 6.0
+        assert DurationStore(tmp_path / "missing.json").estimate("new") == DurationStore.DEFAULT_DURATION
+    
+    def test_order_is_longest_first_and_stable(self, store):
+        """Test that tests are ordered longest first and ties keep their collection order"""
+        assert store.order(["login", "new-b", "e2e", "new-a", "cart"]) == ["e2e", "new-b", "new-a", "cart", "login"]
+    
+    def test_predicted_makespan(self, store):
+        """Test the makespan of greedy longest-first placement on one and two workers"""
+        assert store.predict_makespan(["e2e", "cart", "login"], 1) == 38.0
+        assert store.predict_makespan(["e2e", "cart", "login"], 2) == 30.0
+    
+    def test_save_and_read_round_trip(self, store):
+        """Test that saved durations are read back unchanged"""
+        store.save()
+        assert DurationStore(store.path).durations == store.durations
+        assert json.loads(store.path.read_text())["e2e"]["runs"] == 1
+
+
+class TestDurationScheduling:
+    """Unit tests for the longest-first ordering on workers and the one-at-a-time deal"""
+    
+    @pytest.mark.parametrize("config, parallel", [
+        (fake_config(), True),
+        (fake_config(tx=("popen",)), False),                     # -n 1
+        (fake_config(tx=(), dist="no"), False),                  # No xdist
+        (fake_config(workerinput={"workercount": 4}), True),
+        (fake_config(workerinput={"workercount": 1}), False),
+    ])
+    def test_is_parallel(self, config, parallel):
+        """Test that the scheduler is only wanted with more than one worker"""
+        assert DurationSchedulingPlugin.is_parallel(config) == parallel
+    
+    def test_workers_sort_the_collection_longest_first(self, tmp_path):
+        """Test that every worker orders its collection the same way, longest first"""
+        plugin = DurationSchedulingPlugin(fake_config(workerinput={"workercount": 2}))
+        plugin.store = DurationStore(tmp_path / "durations.json")
+        for nodeid, seconds in (("a", 1.0), ("b", 9.0), ("c", 4.0)):
+            plugin.store.record(nodeid, seconds)
+        items = [SimpleNamespace(nodeid=nodeid) for nodeid in ("a", "b", "c")]
+        plugin.pytest_collection_modifyitems(None, None, items)
+        assert [item.nodeid for item in items] == ["b", "c", "a"]
+    
+    def test_tests_are_dealt_one_at_a_time(self):
+        """Test that workers get alternating tests of the sorted collection and refill one at a time"""
+        scheduler = DurationScheduling(fake_config())
+        nodes = [FakeNode("gw0"), FakeNode("gw1")]
+        collection = ["e2e-1", "e2e-2", "checkout", "cart", "login-1", "login-2"]
+        for node in nodes:
+            scheduler.add_node(node)
+            scheduler.add_node_collection(node, collection)
+        scheduler.schedule()
+        assert [node.received for node in nodes] == [[0, 2], [1, 3]]
+        
+        scheduler.mark_test_complete(nodes[1], 1)
+        assert nodes[1].received == [1, 3, 4]
+        assert scheduler.pending == [5]
@@ -0,0 +1,79 @@
+import random
+import pytest
+
+# Setup Python path using PathManager
+from utils.path_manager import PathManager
+PathManager.setup_python_path()
+
+from config.config import TestConfig
+from config.latency_profiles import LatencyProfiles
+from utils.fault_injection import FaultInjector
+
+
+GLITCH_USER = "performance_glitch_user"
+
+
+class TestLatencyProfiles:
+    """Unit tests for the delay each profile injects, by route and user"""
+    
+    def test_default_profile_only_slows_the_glitch_user(self):
+        """Test that the default profile delays the inventory page by 2.5s for the glitch user only"""
+        injector = FaultInjector("default", seed=1)
+        assert injector.plan("/inventory.html", GLITCH_USER) == {"delay": 2.5, "drop": False}
+        assert injector.plan("/inventory.html", "standard_user") == {"delay": 0.0, "drop": False}
+        assert injector.plan("/cart.html", GLITCH_USER) == {"delay": 0.0, "drop": False}
+    
+    def test_none_profile_injects_nothing(self):
+        """Test that the none profile leaves even the glitch user alone"""
+        assert FaultInjector("none", seed=1).percentile("/inventory.html", GLITCH_USER, 99) == 0.0
+    
+    def test_glitch_p99_percentile_shape(self):
+        """Test the documented heavy tail: p50 ~1.5s and p99 ~4.8s, for the glitch user on the inventory page"""
+        injector = FaultInjector("glitch_p99", seed=1)
+        assert 1.35 < injector.percentile("/inventory.html", GLITCH_USER, 50) < 1.65
+        assert 4.2 < injector.percentile("/inventory.html", GLITCH_USER, 99) < 5.4
+        assert injector.percentile("/inventory.html", "standard_user", 99) == 0.0
+    
+    def test_percentiles_increase(self):
+        """Test that higher percentiles of the same route are never shorter"""
+        injector = FaultInjector("mobile_3g", seed=1)
+        values = [injector.percentile("/cart.html", None, pct) for pct in (50, 90, 95, 99)]
+        assert values == sorted(values)
+        # 5% of responses stall for 1.5s on top of the ~300ms page delay
+        assert 0.25 < values[0] < 0.35
+        assert values[-1] > 1.5
+    
+    def test_drop_rate(self):
+        """Test that the flaky profile drops about a fifth of the image responses and no pages"""
+        injector = FaultInjector("flaky", seed=1)
+        drops = sum(injector.plan("/static/img/backpack.jpg")["drop"] for _ in range(2000))
+        assert 300 < drops < 500
+        assert not any(injector.plan("/inventory.html")["drop"] for _ in range(200))
+    
+    def test_seed_replays_the_same_plans(self):
+        """Test that two injectors with the same seed inject the same delays"""
+        first, second = FaultInjector("flaky", seed=7), FaultInjector("flaky", seed=7)
+        assert [first.plan("/cart.html") for _ in range(50)] == [second.plan("/cart.html") for _ in range(50)]
+    
+    def test_wait_timeout_adds_the_tail_latency(self):
+        """Test that a route's wait covers the explicit wait plus its injected p99"""
+        injector = FaultInjector("default", seed=1)
+        assert injector.get_wait_timeout("/inventory.html", GLITCH_USER) == TestConfig.EXPLICIT_WAIT + 2.5
+    
+    def test_unknown_profile_and_distribution_are_rejected(self):
+        """Test that typos in a profile name or a distribution raise ValueError"""
+        with pytest.raises(ValueError, match="available"):
+            LatencyProfiles.get_profile("mobile_5g")
+        with pytest.raises(ValueError):
+            FaultInjector.sample({"dist": "poisson"})
+    
+    @pytest.mark.parametrize("distribution, low, high", [
+        ({"dist": "fixed", "ms": 100}, 100, 100),
+        ({"dist": "uniform", "min_ms": 50, "max_ms": 150}, 50, 150),
+        ({"dist": "normal", "mean_ms": 10, "stddev_ms": 50}, 0, float("inf")),
+        ({"dist": "pareto", "scale_ms": 20, "alpha": 2}, 20, float("inf")),
+    ])
+    def test_sample_bounds(self, distribution, low, high):
+        """Test that every distribution stays within its bounds and never goes negative"""
+        rng = random.Random(3)
+        assert all(low <= FaultInjector.sample(distribution, rng) <= high for _ in range(500))
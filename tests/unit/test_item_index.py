@@ -0,0 +1,110 @@
+import pytest
+
+# Setup Python path using PathManager
+from utils.path_manager import PathManager
+PathManager.setup_python_path()
+
+from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.common.by import By
+from utils.base_page import BasePage
+from utils.item_index import ItemIndex
+
+
+class FakeListingDriver:
+    """Answers the index scripts like a page whose list rows are the given names"""
+    
+    def __init__(self, names):
+        self.names = list(names)
+        self.tokens = {}
+        self.calls = []
+    
+    def execute_script(self, script, *args):
+        """Build the index or check its token"""
+        if script == ItemIndex.BUILD_SCRIPT:
+            key = args[0]
+            self.calls.append(("build", args[1], key, args[3]))
+            self.tokens[key] = f"token-{len(self.calls)}"
+            index = {name: {"item": f"row:{name}", "index": i, "name": f"name:{name}"}
+                     for i, name in enumerate(self.names)}
+            return {"token": self.tokens[key], "index": index}
+        self.calls.append(("validate",))
+        return self.tokens.get(args[0]) == args[1]
+    
+    def change_rows(self, names):
+        """Replace the rows: the page's MutationObserver drops the token"""
+        self.names = list(names)
+        self.tokens.clear()
+
+
+class FakePage:
+    """The parts of BasePage an ItemIndex uses"""
+    
+    to_css = BasePage.to_css
+    
+    def __init__(self, driver):
+        self.driver = driver
+    
+    def find_element(self, locator):
+        """The list is always present"""
+        return locator
+
+
+class TestItemIndex:
+    """Unit tests for name lookups and cache validation of ItemIndex"""
+    
+    @pytest.fixture
+    def driver(self):
+        """A listing of three products"""
+        return FakeListingDriver(["Sauce Labs Backpack", "Sauce Labs Bike Light", "Sauce Labs Onesie"])
+    
+    @pytest.fixture
+    def index(self, driver):
+        """An index over the inventory list"""
+        return ItemIndex(FakePage(driver), (By.CLASS_NAME, "inventory_list"), (By.CLASS_NAME, "inventory_item"),
+                         {"name": (By.CLASS_NAME, "inventory_item_name"), "button": (By.TAG_NAME, "button")})
+    
+    def test_lookup_by_name(self, index, driver):
+        """Test that a name finds its row and parts, and unknown names find nothing"""
+        assert index.get("Sauce Labs Bike Light") == {
+            "item": "row:Sauce Labs Bike Light", "index": 1, "name": "name:Sauce Labs Bike Light"
+        }
+        assert index.get("Test.allTheThings() T-Shirt") is None
+        assert driver.calls[0] == ("build", ".inventory_list", ".inventory_item",
+                                   {"name": ".inventory_item_name", "button": "button"})
+    
+    def test_later_lookups_only_check_the_token(self, index, driver):
+        """Test that the index is built once and reused while the page-side token is valid"""
+        for name in ("Sauce Labs Backpack", "Sauce Labs Onesie", "Sauce Labs Backpack"):
+            assert index.get(name) is not None
+        assert [call[0] for call in driver.calls] == ["build", "validate", "validate"]
+    
+    def test_changed_rows_rebuild_the_index(self, index, driver):
+        """Test that a list mutation (or navigation) dropping the token triggers a rebuild"""
+        assert index.names() == ["Sauce Labs Backpack", "Sauce Labs Bike Light", "Sauce Labs Onesie"]
+        driver.change_rows(["Sauce Labs Onesie", "Sauce Labs Fleece Jacket"])
+        assert index.names() == ["Sauce Labs Onesie", "Sauce Labs Fleece Jacket"]
+        assert index.get("Sauce Labs Backpack") is None
+        assert [call[0] for call in driver.calls] == ["build", "validate", "build", "validate"]
+    
+    def test_apply_rebuilds_once_on_stale_elements(self, index, driver):
+        """Test that a stale element causes one rebuild and retry, and a second one is raised"""
+        attempts = []
+        
+        def click(entry):
+            attempts.append(entry["item"])
+            if len(attempts) == 1:
+                raise StaleElementReferenceException("re-rendered")
+            return "clicked"
+        
+        assert index.apply("Sauce Labs Backpack", click) == "clicked"
+        assert [call[0] for call in driver.calls].count("build") == 2
+        
+        def always_stale(entry):
+            raise StaleElementReferenceException("re-rendered")
+        
+        with pytest.raises(StaleElementReferenceException):
+            index.apply("Sauce Labs Backpack", always_stale)
+    
+    def test_apply_returns_default_for_unknown_names(self, index):
+        """Test that actions on items not in the listing are not run"""
+        assert index.apply("Unknown", lambda entry: pytest.fail("should not run"), default=False) is False
@@ -0,0 +1,113 @@
+import base64
+import json
+import re
+import zipfile
+from types import SimpleNamespace
+import pytest
+
+# Setup Python path using PathManager
+from utils.path_manager import PathManager
+PathManager.setup_python_path()
+
+from utils.lazy_report import LazyReportPlugin
+
+
+def report(nodeid, when="call", outcome="passed", duration=0.1, longreprtext="", extras=(), sections=(), **kwargs):
+    """A phase report with the attributes the plugin reads"""
+    return SimpleNamespace(
+        nodeid=nodeid, when=when, duration=duration, longreprtext=longreprtext,
+        passed=outcome == "passed", failed=outcome == "failed", skipped=outcome == "skipped",
+        extras=list(extras), sections=list(sections), **kwargs,
+    )
+
+
+def run_test(plugin, nodeid, call_outcome="passed", **kwargs):
+    """Feed the setup, call and teardown reports of one test"""
+    plugin.pytest_runtest_logreport(report(nodeid, "setup"))
+    plugin.pytest_runtest_logreport(report(nodeid, "call", call_outcome, **kwargs))
+    plugin.pytest_runtest_logreport(report(nodeid, "teardown", sections=[("Captured log teardown", "closing")]))
+
+
+def read_script(path):
+    """Parse the JSON arguments of a LAZY_REPORT.page/detail script"""
+    return json.loads("[" + re.fullmatch(r"LAZY_REPORT\.\w+\((.*)\);", path.read_text(), re.S).group(1) + "]")
+
+
+class TestLazyReportPlugin:
+    """Unit tests for the files the lazy report writes"""
+    
+    @pytest.fixture
+    def make_plugin(self, tmp_path):
+        """Factory of plugins writing reports/index.html, optionally next to a pytest-html report"""
+        def make(htmlpath=None, archive=False):
+            config = SimpleNamespace(getoption=lambda name, default=None: htmlpath if name == "htmlpath" else default)
+            return LazyReportPlugin(config, tmp_path / "reports" / "index.html", archive)
+        return make
+    
+    def test_index_holds_only_the_summary(self, make_plugin, monkeypatch):
+        """Test that results are split into pages per outcome and the index only holds counts"""
+        monkeypatch.setattr(LazyReportPlugin, "PAGE_SIZE", 2)
+        plugin = make_plugin()
+        for number in range(5):
+            run_test(plugin, f"tests/test_a.py::test_{number}")
+        run_test(plugin, "tests/test_b.py::test_broken", "failed", longreprtext="AssertionError")
+        plugin.pytest_sessionfinish(None, 1)
+        
+        summary = json.loads(re.search(r"var summary = (.*);", plugin.path.read_text()).group(1))
+        assert summary["counts"] == {"failed": 1, "passed": 5}
+        assert summary["pages"] == {"failed": 1, "passed": 3}
+        assert "tests/test_a.py" not in plugin.path.read_text()
+        outcome, page, rows = read_script(plugin.files_dir / "passed-2.js")
+        assert (outcome, page, [row[1] for row in rows]) == ("passed", 2, ["tests/test_a.py::test_4"])
+    
+    def test_phases_fold_into_one_outcome(self, make_plugin):
+        """Test that the worst phase decides a test's outcome: a setup failure is an error"""
+        plugin = make_plugin()
+        plugin.pytest_runtest_logreport(report("t::error", "setup", "failed", longreprtext="fixture broke"))
+        plugin.pytest_runtest_logreport(report("t::error", "teardown"))
+        run_test(plugin, "t::xfail", "skipped", wasxfail="known bug")
+        assert plugin.tests["t::error"]["outcome"] == "error"
+        assert plugin.tests["t::error"]["longrepr"] == ["[setup] fixture broke"]
+        assert plugin.tests["t::xfail"]["outcome"] == "xfailed"
+    
+    def test_details_are_written_per_test(self, make_plugin):
+        """Test that failure text, output and extras go into the test's own detail file"""
+        plugin = make_plugin()
+        run_test(plugin, "t::broken", "failed", longreprtext="AssertionError: 1 != 2")
+        plugin.pytest_sessionfinish(None, 1)
+        index, detail = read_script(plugin.files_dir / "details" / "0.js")
+        assert index == 0
+        assert detail["longrepr"] == "[call] AssertionError: 1 != 2"
+        assert detail["sections"] == [["Captured log teardown", "closing"]]
+    
+    def test_embedded_images_are_written_out(self, make_plugin):
+        """Test that a base64 screenshot from pytest-html extras becomes a file next to the index"""
+        png = b"\x89PNG\r\n\x1a\n" + bytes(400)
+        extra = {"name": "Screenshot", "format_type": "image", "content": base64.b64encode(png).decode()}
+        plugin = make_plugin()
+        run_test(plugin, "t::broken", "failed", longreprtext="boom", extras=[extra])
+        plugin.pytest_sessionfinish(None, 1)
+        _, detail = read_script(plugin.files_dir / "details" / "0.js")
+        assert detail["extras"] == [{"name": "Screenshot", "format_type": "image",
+                                     "content": "index_files/details/0-0.png"}]
+        assert (plugin.files_dir / "details" / "0-0.png").read_bytes() == png
+    
+    def test_failure_bundle_link_is_relative_to_the_index(self, make_plugin, tmp_path):
+        """Test that links made relative to the pytest-html report are re-anchored on the lazy index"""
+        bundle = tmp_path / "reports" / "failures" / "t_broken.zip"
+        bundle.parent.mkdir(parents=True)
+        bundle.write_bytes(b"PK")
+        extra = {"name": "Failure bundle", "format_type": "url", "content": "../failures/t_broken.zip"}
+        plugin = make_plugin(htmlpath=str(tmp_path / "reports" / "html" / "report.html"), archive=True)
+        run_test(plugin, "t::broken", "failed", longreprtext="boom", extras=[extra])
+        plugin.pytest_sessionfinish(None, 1)
+        _, detail = read_script(plugin.files_dir / "details" / "0.js")
+        assert detail["extras"][0]["content"] == "failures/t_broken.zip"
+        with zipfile.ZipFile(plugin.path.with_suffix(".zip")) as archive:
+            assert {"index.html", "index_files/details/0.js", "failures/t_broken.zip"} <= set(archive.namelist())
+    
+    def test_nothing_is_written_without_tests(self, make_plugin):
+        """Test that an empty run leaves no report behind"""
+        plugin = make_plugin()
+        plugin.pytest_sessionfinish(None, 5)
+        assert not plugin.path.exists()
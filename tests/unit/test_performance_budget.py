@@ -0,0 +1,88 @@
+import pytest
+
+# Setup Python path using PathManager
+from utils.path_manager import PathManager
+PathManager.setup_python_path()
+
+from config.performance_budgets import PerformanceBudgets
+from utils.performance_budget import PerformanceBudgetChecker
+from utils.test_context import TestContext
+
+
+TEST = "tests/test_login.py::TestLogin::test_successful_login_with_valid_credentials"
+
+
+def runs(*per_run_values, page="LoginPage", user="standard_user", metric="load", test=TEST):
+    """Page timing entries for earlier runs (oldest first) and the current run (last)"""
+    entries = []
+    for index, values in enumerate(per_run_values):
+        current = index == len(per_run_values) - 1
+        run_id = TestContext.get_run_id() if current else f"earlier-{index}"
+        for value in values:
+            entries.append({"ts": 1000 + index, "run": run_id, "test": test, "page": page, "user": user,
+                            metric: value})
+    return entries
+
+
+class TestPerformanceBudgetChecker:
+    """Unit tests for the rolling-window budget verdicts"""
+    
+    def test_fast_runs_pass(self):
+        """Test that a page under its budget in every run is ok"""
+        result = PerformanceBudgetChecker(runs([900, 1000], [950], [1100])).check("LoginPage", "standard_user")
+        assert result["status"] == "ok"
+        assert (result["runs"], result["samples"], result["runs_over"]) == (3, 4, 0)
+        assert result["value_ms"] == 1000
+    
+    def test_slow_runs_fail(self):
+        """Test that a page over its budget in most runs is over"""
+        result = PerformanceBudgetChecker(runs([1600], [1700], [1200])).check("LoginPage", "standard_user")
+        assert result["status"] == "over"
+        assert result["runs_over"] == 2
+        assert result["value_ms"] == 1600
+    
+    def test_one_noisy_run_does_not_fail(self):
+        """Test that the median of the per-run percentiles absorbs a single slow run"""
+        result = PerformanceBudgetChecker(runs([900], [5000], [1000])).check("LoginPage", "standard_user")
+        assert result["status"] == "ok"
+        assert result["runs_over"] == 1
+    
+    def test_warm_up_never_fails(self):
+        """Test that with fewer than MIN_RUNS runs even a very slow page is only reported"""
+        assert PerformanceBudgets.MIN_RUNS == 3
+        result = PerformanceBudgetChecker(runs([9000], [9000])).check("LoginPage", "standard_user")
+        assert result["status"] == "insufficient"
+        assert result["value_ms"] == 9000
+    
+    def test_only_recent_runs_count(self):
+        """Test that runs older than the last WINDOW_RUNS are ignored"""
+        slow_history = [[9000]] * 3
+        fast_recent = [[1000]] * (PerformanceBudgets.WINDOW_RUNS - 1)
+        result = PerformanceBudgetChecker(runs(*slow_history, *fast_recent, [1000])).check("LoginPage", "standard_user")
+        assert result["status"] == "ok"
+        assert result["runs"] == PerformanceBudgets.WINDOW_RUNS
+    
+    @pytest.mark.parametrize("user, status", [("performance_glitch_user", "ok"), ("standard_user", "over")])
+    def test_user_budgets(self, user, status):
+        """Test that the glitch user is held to its own, looser budget on the inventory ready step"""
+        entries = runs([5000], [5200], [4900], page="InventoryPage", user=user, metric="ready")
+        result = PerformanceBudgetChecker(entries).check("InventoryPage", user)
+        assert result["metric"] == "ready"
+        assert result["status"] == status
+    
+    def test_inventory_load_samples_are_not_the_inventory_budget(self):
+        """Test that document load timings do not count towards the InventoryPage ready budget"""
+        entries = runs([100], [100], [100], page="InventoryPage", metric="load")
+        assert PerformanceBudgetChecker(entries).check("InventoryPage", "standard_user")["status"] == "insufficient"
+    
+    def test_page_without_budget(self):
+        """Test that pages without a budget are reported as such"""
+        assert PerformanceBudgetChecker([]).check("AboutPage")["status"] == "no-budget"
+    
+    def test_check_test_covers_the_pages_of_this_run(self):
+        """Test that a test is checked for the pages it loaded in the current run, optionally one page only"""
+        entries = (runs([900], [900], [900]) + runs([1000], [1000], [1000], page="InventoryPage", metric="ready")
+                   + runs([100], [100], [100], page="CartPage", test="tests/test_cart.py::test_other"))
+        checker = PerformanceBudgetChecker(entries)
+        assert [result["page"] for result in checker.check_test(TEST)] == ["InventoryPage", "LoginPage"]
+        assert [result["page"] for result in checker.check_test(TEST, "InventoryPage")] == ["InventoryPage"]
@@ -0,0 +1,123 @@
+import pytest
+from types import SimpleNamespace
+
+# Setup Python path using PathManager
+from utils.path_manager import PathManager
+PathManager.setup_python_path()
+
+from utils.result_cache import ResultCache
+
+
+CONFTEST = '''
+import pytest
+from .utils.path_manager import PathManager
+from utils.driver_factory import DriverFactory
+from pages.cart_page import CartPage
+
+
+@pytest.fixture
+def driver():
+    return DriverFactory.get_driver()
+
+
+@pytest.fixture
+def cart_page(driver):
+    return CartPage(driver)
+'''
+
+E2E_TEST = '''
+class TestEndToEnd:
+    def test_checkout(self, driver):
+        from pages.login_page import LoginPage
+        from pages.checkout_page import CheckoutPage
+'''
+
+
+class TestResultCache:
+    """Unit tests for the dependency hashing of the result cache"""
+    
+    E2E = ("tests/test_e2e.py", "tests/test_e2e.py::TestEndToEnd::test_checkout", ["driver"])
+    CART = ("tests/test_cart.py", "tests/test_cart.py::TestCart::test_empty_cart", ["driver", "cart_page"])
+    
+    @pytest.fixture
+    def project(self, tmp_path, monkeypatch):
+        """A minimal project tree used as the project root"""
+        for source, content in {
+            "conftest.py": CONFTEST,
+            "utils/__init__.py": "",
+            "utils/path_manager.py": "class PathManager: pass\n",
+            "utils/driver_factory.py": "from .logger import Logger\n",
+            "utils/logger.py": "class Logger: pass\n",
+            "utils/base_page.py": "from .action_backends import WebDriverActions\n",
+            "utils/action_backends.py": "from .cdp_client import CdpConnection\n",
+            "utils/cdp_client.py": "class CdpConnection: pass\n",
+            "config/test_data.py": "class TestData: pass\n",
+            "pages/__init__.py": "",
+            "pages/login_page.py": "from utils.base_page import BasePage\n",
+            "pages/checkout_page.py": "from utils.base_page import BasePage\n",
+            "pages/cart_page.py": "from utils.base_page import BasePage\nfrom utils.item_index import ItemIndex\n",
+            "utils/item_index.py": "class ItemIndex: pass\n",
+            "tests/test_e2e.py": E2E_TEST,
+            "tests/test_cart.py": "class TestCart:\n    def test_empty_cart(self, cart_page):\n        pass\n",
+        }.items():
+            (tmp_path / source).parent.mkdir(parents=True, exist_ok=True)
+            (tmp_path / source).write_text(content)
+        monkeypatch.setattr(PathManager, "_project_root", tmp_path)
+        return tmp_path
+    
+    @staticmethod
+    def classify_after_pass(project, test, edited_source):
+        """Record a pass of a test, edit one source file and classify the test again"""
+        test_file, nodeid, fixturenames = test
+        item = SimpleNamespace(path=project / test_file, fixturenames=fixturenames)
+        cache = ResultCache(project / ".cache/results.json")
+        cache.record(nodeid, "passed", cache.get_dependency_hash(item))
+        cache.save()
+        with open(project / edited_source, "a") as f:
+            f.write("\nEDITED = True\n")
+        cache = ResultCache(project / ".cache/results.json")
+        return cache.classify(nodeid, cache.get_dependency_hash(item))
+    
+    def test_sources_include_modules_imported_in_test_bodies(self, project):
+        """Test that page objects imported inside a test are dependencies of it"""
+        item = SimpleNamespace(path=project / "tests/test_e2e.py", fixturenames=["driver"])
+        sources = ResultCache(project / "results.json").get_sources(item)
+        assert "pages/checkout_page.py" in sources
+        assert "pages/login_page.py" in sources
+        assert "pages/cart_page.py" not in sources
+    
+    def test_sources_follow_relative_imports_transitively(self, project):
+        """Test that modules reached through relative imports of base_page and conftest are dependencies"""
+        item = SimpleNamespace(path=project / "tests/test_e2e.py", fixturenames=["driver"])
+        sources = ResultCache(project / "results.json").get_sources(item)
+        for source in ("conftest.py", "utils/action_backends.py", "utils/cdp_client.py",
+                       "utils/path_manager.py", "utils/driver_factory.py", "utils/logger.py"):
+            assert source in sources
+    
+    def test_fixture_sources_come_from_conftest(self, project):
+        """Test that the page objects a fixture uses are read from conftest.py"""
+        fixture_sources = ResultCache(project / "results.json").get_fixture_sources()
+        assert fixture_sources["cart_page"] == ["pages/cart_page.py"]
+        assert fixture_sources["driver"] == ["utils/driver_factory.py"]
+    
+    @pytest.mark.parametrize("test, edited_source, expected", [
+        (E2E, "pages/checkout_page.py", "changed"),   # Imported inside the test body
+        (E2E, "utils/cdp_client.py", "changed"),      # base_page -> .action_backends -> .cdp_client
+        (E2E, "utils/logger.py", "changed"),          # conftest -> driver_factory -> .logger
+        (E2E, "pages/cart_page.py", "passed"),        # Only behind the cart_page fixture
+        (CART, "pages/cart_page.py", "changed"),
+        (CART, "utils/item_index.py", "changed"),     # cart_page fixture -> CartPage -> ItemIndex
+        (CART, "pages/login_page.py", "passed"),
+    ])
+    def test_editing_a_dependency_invalidates_the_result(self, project, test, edited_source, expected):
+        """Test that only edits to a test's direct or transitive dependencies invalidate its result"""
+        assert self.classify_after_pass(project, test, edited_source) == expected
+    
+    def test_page_fixtures_of_the_real_conftest(self):
+        """Test that every page fixture in conftest.py is attributed to its page module"""
+        fixture_sources = ResultCache(PathManager.get_cache_path() / "unused.json").get_fixture_sources()
+        assert fixture_sources["login_page"] == ["pages/login_page.py"]
+        assert fixture_sources["inventory_page"] == ["pages/inventory_page.py"]
+        assert fixture_sources["cart_page"] == ["pages/cart_page.py"]
+        for name in ("checkout_page", "checkout_overview_page", "checkout_complete_page"):
+            assert fixture_sources[name] == ["pages/checkout_page.py"]
@@ -0,0 +1,53 @@
+import pytest
+
+# Setup Python path using PathManager
+from utils.path_manager import PathManager
+PathManager.setup_python_path()
+
+from config.config import TestConfig
+from utils.session_state import SessionStateCache
+
+
+class FakeDriver:
+    """Records cookies and opens any URL, like a browser on a site without redirects"""
+    
+    def __init__(self, app_username=None):
+        self.current_url = None
+        self.cookies = {}
+        # The user the app itself logs the session in as, overriding injected cookies
+        self.app_username = app_username
+    
+    def get(self, url):
+        """Open a URL"""
+        self.current_url = url
+        if self.app_username is not None:
+            self.cookies[SessionStateCache.USERNAME_COOKIE] = self.app_username
+    
+    def add_cookie(self, cookie):
+        """Set a cookie"""
+        self.cookies[cookie["name"]] = cookie["value"]
+    
+    def get_cookie(self, name):
+        """Read a cookie"""
+        return {"name": name, "value": self.cookies[name]} if name in self.cookies else None
+    
+    def execute_script(self, script, *args):
+        """Ignore localStorage scripts"""
+        return None
+
+
+class TestSessionStateCache:
+    """Unit tests for the checks made before an injected session is trusted"""
+    
+    STATE = {"cookies": [{"name": "session-username", "value": "standard_user"}], "local_storage": {}}
+    
+    @pytest.mark.parametrize("app_username, username, accepted", [
+        (None, "standard_user", True),
+        (None, "problem_user", False),                # Captured for another user
+        ("locked_out_user", "standard_user", False),  # The app switched the session to another user
+    ])
+    def test_injected_session_must_name_the_requested_user(self, app_username, username, accepted):
+        """Test that landing on the page is not enough: the session-username cookie must match the user"""
+        driver = FakeDriver(app_username)
+        assert SessionStateCache._inject(driver, self.STATE, username, "inventory.html") == accepted
+        assert driver.current_url == TestConfig.BASE_URL + "inventory.html"
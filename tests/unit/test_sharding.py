@@ -0,0 +1,79 @@
+import json
+import random
+from types import SimpleNamespace
+import pytest
+
+# Setup Python path using PathManager
+from utils.path_manager import PathManager
+PathManager.setup_python_path()
+
+from utils.sharding import ShardPlanner
+
+
+DURATIONS = {
+    "tests/test_e2e.py::TestEndToEnd::test_complete_purchase": 40.0,
+    "tests/test_e2e.py::TestEndToEnd::test_multiple_items": 30.0,
+    "tests/test_checkout.py::TestCheckout::test_overview": 12.0,
+    "tests/test_cart.py::TestCart::test_remove_item": 8.0,
+    "tests/test_cart.py::TestCart::test_add_item": 6.0,
+    "tests/test_login.py::TestLogin::test_valid_login": 3.0,
+    "tests/test_login.py::TestLogin::test_locked_out": 2.0,
+    "tests/test_login.py::TestLogin::test_empty_fields": 1.0,
+}
+
+
+class TestShardPlanner:
+    """Unit tests for the split of the collection across CI machines"""
+    
+    @pytest.fixture
+    def durations_path(self, tmp_path):
+        """A durations file as DurationStore writes it"""
+        path = tmp_path / "durations.json"
+        path.write_text(json.dumps({
+            nodeid: {"duration": seconds, "last": seconds, "runs": 1} for nodeid, seconds in DURATIONS.items()
+        }))
+        return path
+    
+    @pytest.mark.parametrize("shard_count", [1, 2, 3, 5, 10])
+    def test_shards_are_disjoint_and_cover_the_collection(self, durations_path, shard_count):
+        """Test that every test lands in exactly one shard, unknown tests included"""
+        nodeids = list(DURATIONS) + ["tests/test_new.py::test_not_yet_timed"]
+        shards = ShardPlanner(shard_count, durations_path).plan(nodeids)
+        assigned = [nodeid for tests, _ in shards for nodeid in tests]
+        assert len(shards) == shard_count
+        assert sorted(assigned) == sorted(nodeids)
+    
+    def test_plan_does_not_depend_on_collection_order(self, durations_path):
+        """Test that machines collecting the tests in different orders compute the same shards"""
+        nodeids = list(DURATIONS)
+        expected = ShardPlanner(3, durations_path).plan(nodeids)
+        for seed in range(5):
+            shuffled = nodeids[:]
+            random.Random(seed).shuffle(shuffled)
+            assert ShardPlanner(3, durations_path).plan(shuffled) == expected
+    
+    def test_longest_tests_are_spread_first(self, durations_path):
+        """Test that the two e2e flows go to different shards and the quick tests fill the lighter one"""
+        shards = ShardPlanner(2, durations_path).plan(list(DURATIONS))
+        assert [tests[0] for tests, _ in shards] == [
+            "tests/test_e2e.py::TestEndToEnd::test_complete_purchase",
+            "tests/test_e2e.py::TestEndToEnd::test_multiple_items",
+        ]
+        assert sorted(load for _, load in shards) == [51.0, 51.0]
+    
+    def test_select_splits_items(self, durations_path):
+        """Test that select keeps the shard's items in collection order and deselects the rest"""
+        items = [SimpleNamespace(nodeid=nodeid) for nodeid in DURATIONS]
+        planner = ShardPlanner(2, durations_path)
+        selected, deselected = planner.select(items, 1)
+        assert [item.nodeid for item in selected] == [
+            nodeid for nodeid in DURATIONS if nodeid in planner.plan(list(DURATIONS))[1][0]
+        ]
+        assert len(selected) + len(deselected) == len(items)
+        assert not {item.nodeid for item in selected} & {item.nodeid for item in deselected}
+    
+    @pytest.mark.parametrize("shard_count, shard_index", [(0, 0), (2, 2), (2, -1)])
+    def test_invalid_shards_are_rejected(self, durations_path, shard_count, shard_index):
+        """Test that a shard count below 1 or an index outside the shards raises ValueError"""
+        with pytest.raises(ValueError):
+            ShardPlanner(shard_count, durations_path).select([], shard_index)
@@ -0,0 +1,31 @@
+import pytest
+
+# Setup Python path using PathManager
+from utils.path_manager import PathManager
+PathManager.setup_python_path()
+
+from utils.stats import Stats
+
+
+class TestStats:
+    """Unit tests for the shared nearest-rank percentile"""
+    
+    @pytest.mark.parametrize("pct, expected", [(0, 1), (1, 1), (50, 50), (95, 95), (99, 99), (99.5, 100), (100, 100)])
+    def test_percentile_of_one_to_hundred(self, pct, expected):
+        """Test that the percentile is always one of the values, taken at rank ceil(pct * n)"""
+        assert Stats.percentile(list(range(1, 101)), pct) == expected
+    
+    def test_small_samples(self):
+        """Test that few values round up to the next rank instead of interpolating"""
+        assert Stats.percentile([10, 20, 30], 50) == 20
+        assert Stats.percentile([10, 20, 30], 67) == 30
+        assert Stats.percentile([10, 20], 50) == 10
+        assert Stats.percentile([7], 99) == 7
+    
+    def test_no_values(self):
+        """Test that the percentile of nothing is None"""
+        assert Stats.percentile([], 95) is None
+    
+    def test_rank_is_one_based_and_at_least_one(self):
+        """Test the rank used for histogram percentiles, which only know the count"""
+        assert [Stats.rank(1000, pct) for pct in (0, 50, 95, 99)] == [1, 500, 950, 990]
@@ -0,0 +1,272 @@
+"""Backends that perform BasePage's element actions: WebDriver, or CDP on Chromium"""
+
+import json
+import threading
+import time
+from urllib.parse import quote
+from selenium.common.exceptions import ElementClickInterceptedException, TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from config.config import TestConfig
+from .cdp_client import CdpConnection, CdpError
+from .logger import Logger
+
+
+class WebDriverActions:
+    """Element actions as W3C WebDriver commands (wait, then act on the WebElement)"""
+    
+    def __init__(self, driver, waits):
+        self.driver = driver
+        self.waits = waits
+    
+    def click(self, locator, timeout, label):
+        """Wait until the element is clickable, then click it"""
+        element = self.waits.until(EC.element_to_be_clickable(locator), timeout, label)
+        element.click()
+    
+    def type_text(self, locator, text, timeout, label):
+        """Wait for the element, clear it and type text"""
+        element = self.waits.until(EC.presence_of_element_located(locator), timeout, label)
+        element.clear()
+        element.send_keys(text)
+    
+    def get_text(self, locator, timeout, label):
+        """Wait for the element and read its rendered text"""
+        element = self.waits.until(EC.presence_of_element_located(locator), timeout, label)
+        return element.text
+
+
+class CdpPageSession:
+    """A DevTools connection to the page a WebDriver session controls, shared by its page objects
+    
+    Tracks main-frame navigations from Page events, so an action that
+    follows a navigating click waits for the new document's
+    DOMContentLoaded instead of polling document.readyState. Each window is
+    its own DevTools target, so sessions are kept per WebDriver session and
+    window handle.
+    """
+    
+    # (WebDriver session id, window handle) -> session, or None when CDP is not reachable
+    _sessions = {}
+    _lock = threading.Lock()
+    
+    def __init__(self, connection):
+        self.connection = connection
+        self.main_frame_id = None
+        self._loaded = threading.Event()
+        self._loaded.set()
+        connection.on("Page.frameRequestedNavigation", self._on_navigation_started)
+        connection.on("Page.frameStartedLoading", self._on_navigation_started)
+        connection.on("Page.domContentEventFired", lambda params: self._loaded.set())
+        connection.on("Page.loadEventFired", lambda params: self._loaded.set())
+        # Same-document and aborted navigations fire no DOMContentLoaded
+        connection.on("Page.navigatedWithinDocument", self._on_navigation_finished)
+        connection.on("Page.frameStoppedLoading", self._on_navigation_finished)
+        _, frame_tree = connection.send_batch([("Page.enable", None), ("Page.getFrameTree", None)])
+        self.main_frame_id = frame_tree["frameTree"]["frame"]["id"]
+    
+    @classmethod
+    def for_driver(cls, driver):
+        """Get the session of the window a Chromium driver is switched to, or None if CDP is not reachable"""
+        try:
+            key = (driver.session_id, driver.current_window_handle)
+        except WebDriverException:
+            # The current window was closed: there is no target to act on
+            return None
+        with cls._lock:
+            if key in cls._sessions:
+                session = cls._sessions[key]
+                if session is None or not session.connection.closed:
+                    return session
+            cls._sessions[key] = cls._open(driver, key)
+            return cls._sessions[key]
+    
+    @classmethod
+    def _open(cls, driver, key):
+        """Connect to the DevTools endpoint chromedriver/msedgedriver started the browser with"""
+        capabilities = getattr(driver, "capabilities", {}) or {}
+        address = (capabilities.get("goog:chromeOptions") or capabilities.get("ms:edgeOptions") or {}).get(
+            "debuggerAddress")
+        if not address or not hasattr(driver, "execute_cdp_cmd"):
+            Logger().get_logger().warning("CDP action backend needs Chrome or Edge, using WebDriver actions")
+            return None
+        try:
+            target_id = driver.execute_cdp_cmd("Target.getTargetInfo", {})["targetInfo"]["targetId"]
+            connection = CdpConnection(f"ws://{address}/devtools/page/{quote(target_id)}", TestConfig.PAGE_LOAD_TIMEOUT)
+            session = cls(connection)
+        except (WebDriverException, OSError, KeyError) as e:
+            Logger().get_logger().warning(f"Could not open a CDP connection ({e}), using WebDriver actions")
+            return None
+        # The browser closes the websocket when the window closes or the session quits
+        connection.on("close", lambda params: cls._forget(key, session))
+        return session
+    
+    @classmethod
+    def _forget(cls, key, session):
+        """Drop a session whose connection has closed"""
+        with cls._lock:
+            if cls._sessions.get(key) is session:
+                del cls._sessions[key]
+    
+    def wait_for_navigation(self, timeout):
+        """Wait until a navigation started by the last action has reached DOMContentLoaded"""
+        self._loaded.wait(timeout)
+    
+    def _on_navigation_started(self, params):
+        """Note that the main frame is loading a new document"""
+        if params.get("frameId") == self.main_frame_id:
+            self._loaded.clear()
+    
+    def _on_navigation_finished(self, params):
+        """Note that the main frame is no longer loading"""
+        if params.get("frameId") == self.main_frame_id:
+            self._loaded.set()
+
+
+class CdpActions:
+    """Element actions over one persistent DevTools websocket
+    
+    Each action is a single Runtime.evaluate that waits for the element
+    inside the page with a MutationObserver (no polling round-trips) and
+    prepares it; clicks and typing then go out as one batch of Input
+    events. Locators that cannot be expressed as CSS, and sessions without
+    CDP, fall back to WebDriverActions. Every action first looks up the
+    window the driver is switched to (one WebDriver call), so page objects
+    follow switch_to.window() onto the new window's target.
+    """
+    
+    # Resolves with the action's result once the element is in the requested state
+    WAIT_SCRIPT = """
+        (function (selector, state, timeout, action) {
+            function find() {
+                var element = document.querySelector(selector);
+                if (!element || state === "present") { return element; }
+                var style = window.getComputedStyle(element);
+                var visible = element.getClientRects().length > 0 && style.visibility !== "hidden";
+                return visible && !element.disabled ? element : null;
+            }
+            function act(element) {
+                if (action === "text") { return element.innerText.trim(); }
+                if (action === "focus") {
+                    element.focus();
+                    if (typeof element.select === "function") { element.select(); }
+                    return true;
+                }
+                element.scrollIntoView({block: "center", inline: "center"});
+                var rect = element.getBoundingClientRect();
+                var x = rect.left + rect.width / 2, y = rect.top + rect.height / 2;
+                var hit = document.elementFromPoint(x, y);
+                if (!hit || (hit !== element && !element.contains(hit))) {
+                    throw new Error("cdp-click-intercepted by " + (hit ? hit.outerHTML.slice(0, 80) : "nothing"));
+                }
+                return {x: x, y: y};
+            }
+            return new Promise(function (resolve, reject) {
+                var element = find();
+                if (element) { resolve(act(element)); return; }
+                var observer = new MutationObserver(function () {
+                    var element = find();
+                    if (element) { observer.disconnect(); clearTimeout(timer); resolve(act(element)); }
+                });
+                observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+                var timer = setTimeout(function () {
+                    observer.disconnect();
+                    reject(new Error("cdp-wait-timeout"));
+                }, timeout);
+            });
+        })
+    """
+    
+    # Same mapping as BasePage.to_css
+    CSS_PREFIXES = {By.CLASS_NAME: ".", By.ID: "#", By.CSS_SELECTOR: "", By.TAG_NAME: ""}
+    
+    # Runtime.evaluate errors meaning the document went away mid-wait
+    NAVIGATED_ERRORS = ("Execution context was destroyed", "Cannot find context", "Inspected target navigated")
+    
+    def __init__(self, driver, waits, session):
+        self.driver = driver
+        self.waits = waits
+        self.session = session
+        self.fallback = WebDriverActions(driver, waits)
+    
+    @classmethod
+    def for_driver(cls, driver, waits):
+        """Get CDP actions for a Chromium driver, or WebDriver actions when CDP is unavailable"""
+        session = CdpPageSession.for_driver(driver)
+        return cls(driver, waits, session) if session is not None else WebDriverActions(driver, waits)
+    
+    def click(self, locator, timeout, label):
+        """Wait until the element is clickable, then send a trusted mouse click at its centre"""
+        if locator[0] not in self.CSS_PREFIXES or not self._follow_window():
+            return self.fallback.click(locator, timeout, label)
+        point = self._wait_and_act(locator, "clickable", "click", timeout, label)
+        mouse = {"x": point["x"], "y": point["y"], "button": "left", "clickCount": 1}
+        self.session.connection.send_batch([
+            ("Input.dispatchMouseEvent", dict(mouse, type="mouseMoved", button="none", clickCount=0)),
+            ("Input.dispatchMouseEvent", dict(mouse, type="mousePressed")),
+            ("Input.dispatchMouseEvent", dict(mouse, type="mouseReleased")),
+        ])
+    
+    def type_text(self, locator, text, timeout, label):
+        """Wait for the element, select its content and replace it with text"""
+        if locator[0] not in self.CSS_PREFIXES or not self._follow_window():
+            return self.fallback.type_text(locator, text, timeout, label)
+        self._wait_and_act(locator, "present", "focus", timeout, label)
+        if text:
+            self.session.connection.send("Input.insertText", {"text": text})
+        else:
+            backspace = {"key": "Backspace", "code": "Backspace", "windowsVirtualKeyCode": 8}
+            self.session.connection.send_batch([
+                ("Input.dispatchKeyEvent", dict(backspace, type="rawKeyDown")),
+                ("Input.dispatchKeyEvent", dict(backspace, type="keyUp")),
+            ])
+    
+    def get_text(self, locator, timeout, label):
+        """Wait for the element and read its rendered text"""
+        if locator[0] not in self.CSS_PREFIXES or not self._follow_window():
+            return self.fallback.get_text(locator, timeout, label)
+        return self._wait_and_act(locator, "present", "text", timeout, label)
+    
+    def _follow_window(self):
+        """Switch to the session of the driver's current window (False when it has none)"""
+        self.session = CdpPageSession.for_driver(self.driver)
+        return self.session is not None
+    
+    def _wait_and_act(self, locator, state, action, timeout, label):
+        """Run WAIT_SCRIPT in the current document, retrying when a navigation replaces it"""
+        timeout = timeout if timeout is not None else self.waits.timeout
+        selector = self.CSS_PREFIXES[locator[0]] + locator[1]
+        start = time.perf_counter()
+        deadline = start + timeout
+        timed_out = False
+        try:
+            while True:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    timed_out = True
+                    raise TimeoutException(f"{label}: {selector} not {state} after {timeout}s")
+                self.session.wait_for_navigation(remaining)
+                remaining = max(deadline - time.perf_counter(), 0)
+                expression = (f"({self.WAIT_SCRIPT})({json.dumps(selector)}, {json.dumps(state)}, "
+                              f"{int(remaining * 1000)}, {json.dumps(action)})")
+                try:
+                    result = self.session.connection.send("Runtime.evaluate", {
+                        "expression": expression, "awaitPromise": True, "returnByValue": True,
+                    }, timeout=remaining + TestConfig.PAGE_LOAD_TIMEOUT)
+                except CdpError as e:
+                    # The document was replaced while waiting: try again in the new one
+                    if any(text in str(e) for text in self.NAVIGATED_ERRORS):
+                        continue
+                    raise
+                details = result.get("exceptionDetails")
+                if details is None:
+                    return result["result"].get("value")
+                description = (details.get("exception") or {}).get("description") or details.get("text", "")
+                if "cdp-wait-timeout" in description:
+                    timed_out = True
+                    raise TimeoutException(f"{label}: {selector} not {state} after {timeout}s")
+                if "cdp-click-intercepted" in description:
+                    raise ElementClickInterceptedException(f"{label}: {description.splitlines()[0]}")
+                raise CdpError(f"{label}: {description}")
+        finally:
+            self.waits.record(label, time.perf_counter() - start, timed_out)
@@ -1,23 +1,185 @@
+from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
+import json
+import threading
 import time
 from datetime import datetime
+from config.config import TestConfig
+from .action_backends import CdpActions, WebDriverActions
+from .logger import Logger
+from .page_timing import PageTimingCollector
 from .path_manager import PathManager
+from .screenshot_writer import ScreenshotWriter
+from .test_context import TestContext
+
+
+class WaitStats:
+    """Per-process timing statistics for every wait performed by WaitEngine"""
+    
+    _records = {}
+    _lock = threading.Lock()
+    
+    @classmethod
+    def record(cls, label, elapsed, timed_out=False):
+        """Record the duration of a single wait"""
+        with cls._lock:
+            stats = cls._records.setdefault(label, {"count": 0, "total": 0.0, "max": 0.0, "timeouts": 0})
+            stats["count"] += 1
+            stats["total"] += elapsed
+            stats["max"] = max(stats["max"], elapsed)
+            if timed_out:
+                stats["timeouts"] += 1
+    
+    @classmethod
+    def summary(cls):
+        """Get wait statistics sorted by total time spent waiting"""
+        with cls._lock:
+            items = sorted(cls._records.items(), key=lambda item: item[1]["total"], reverse=True)
+        return {
+            label: {
+                "count": stats["count"],
+                "total_s": round(stats["total"], 3),
+                "avg_s": round(stats["total"] / stats["count"], 3),
+                "max_s": round(stats["max"], 3),
+                "timeouts": stats["timeouts"],
+            }
+            for label, stats in items
+        }
+    
+    @classmethod
+    def reset(cls):
+        """Clear all recorded statistics"""
+        with cls._lock:
+            cls._records.clear()
+    
+    @classmethod
+    def write_report(cls, filename=None):
+        """Write the statistics as JSON into the reports directory"""
+        if not cls._records:
+            return None
+        reports_dir = PathManager.ensure_directory_exists(PathManager.get_reports_path())
+        filepath = reports_dir / (filename or f"wait_stats{TestContext.get_worker_suffix()}.json")
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(cls.summary(), f, indent=2)
+        return str(filepath)
+
+
+class WaitEngine:
+    """Single owner of all waiting done by page objects
+    
+    Drivers run with an implicit wait of zero, so every wait is an explicit,
+    measured poll with a known timeout instead of implicit and explicit waits
+    multiplying each other.
+    """
+    
+    def __init__(self, driver, timeout=None, poll_frequency=None):
+        self.driver = driver
+        self.timeout = timeout if timeout is not None else TestConfig.EXPLICIT_WAIT
+        self.poll_frequency = poll_frequency if poll_frequency is not None else TestConfig.POLL_FREQUENCY
+    
+    def until(self, condition, timeout=None, label="until"):
+        """Wait until the condition returns a truthy value"""
+        return self._timed(label, timeout, lambda wait: wait.until(condition))
+    
+    def until_not(self, condition, timeout=None, label="until_not"):
+        """Wait until the condition returns a falsy value"""
+        return self._timed(label, timeout, lambda wait: wait.until_not(condition))
+    
+    def record(self, label, elapsed, timed_out=False):
+        """Record a wait performed outside WebDriverWait (e.g. inside the page by the CDP backend)"""
+        WaitStats.record(label, elapsed, timed_out)
+    
+    def find_now(self, locator, label="find_now"):
+        """Find elements without waiting; an empty list means absent right now"""
+        start = time.perf_counter()
+        try:
+            return self.driver.find_elements(*locator)
+        finally:
+            WaitStats.record(label, time.perf_counter() - start)
+    
+    def is_absent(self, locator, timeout=None, label="is_absent"):
+        """Fast-fail check that an element is (or becomes) absent
+        
+        Uses TestConfig.ABSENT_TIMEOUT by default, so checks that are expected
+        to find nothing return straight away instead of burning a full timeout.
+        """
+        timeout = timeout if timeout is not None else TestConfig.ABSENT_TIMEOUT
+        if not self.find_now(locator, label):
+            return True
+        try:
+            self.until_not(lambda driver: driver.find_elements(*locator), timeout, label)
+            return True
+        except TimeoutException:
+            return False
+    
+    def _timed(self, label, timeout, action):
+        """Run a WebDriverWait action and record how long it took"""
+        timeout = timeout if timeout is not None else self.timeout
+        wait = WebDriverWait(self.driver, timeout, poll_frequency=self.poll_frequency)
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            return action(wait)
+        except TimeoutException:
+            timed_out = True
+            raise
+        finally:
+            WaitStats.record(label, time.perf_counter() - start, timed_out)
 
 
 class BasePage:
     """Base page class that provides common functionality for all page objects"""
     
+    # Reads every item of a listing in one round-trip instead of one per element
+    LISTING_SNAPSHOT_SCRIPT = """
+        var items = document.querySelectorAll(arguments[0]);
+        var fields = arguments[1];
+        var records = [];
+        for (var i = 0; i < items.length; i++) {
+            var record = {index: i};
+            for (var key in fields) {
+                var element = items[i].querySelector(fields[key]);
+                record[key] = element ? element.innerText.trim() : null;
+            }
+            var button = items[i].querySelector("button");
+            record.button_text = button ? button.innerText.trim() : null;
+            record.button_class = button ? button.className : null;
+            records.push(record);
+        }
+        return records;
+    """
+    
+    CSS_PREFIXES = {By.CLASS_NAME: ".", By.ID: "#", By.CSS_SELECTOR: "", By.TAG_NAME: ""}
+    
     def __init__(self, driver):
         self.driver = driver
-        self.wait = WebDriverWait(driver, 10)
+        self.logger = Logger().get_logger()
+        self.waits = WaitEngine(driver)
+        self.wait = WebDriverWait(driver, self.waits.timeout, poll_frequency=self.waits.poll_frequency)
         self.actions = ActionChains(driver)
+        # Performs click_element, send_keys_to_element and get_element_text
+        if TestConfig.ACTION_BACKEND == "cdp":
+            self.backend = CdpActions.for_driver(driver, self.waits)
+        else:
+            self.backend = WebDriverActions(driver, self.waits)
+    
+    def _label(self, action, locator=None):
+        """Build the label used to aggregate wait statistics"""
+        label = f"{type(self).__name__}.{action}"
+        return f"{label}[{locator[1]}]" if locator else label
+    
+    def _capture_page_timing(self, trigger):
+        """Record load timings of the current document when PAGE_TIMING is enabled"""
+        if TestConfig.PAGE_TIMING:
+            PageTimingCollector.capture(self.driver, trigger, type(self).__name__)
     
     def navigate_to(self, url):
         """Navigate to a specific URL"""
         self.driver.get(url)
+        self._capture_page_timing("navigate")
     
     def get_title(self):
         """Get the page title"""
@@ -27,42 +189,65 @@ class BasePage:
         """Get the current URL"""
         return self.driver.current_url
     
-    def find_element(self, locator, timeout=10):
+    def find_element(self, locator, timeout=None):
         """Find element with explicit wait"""
-        wait = WebDriverWait(self.driver, timeout)
-        return wait.until(EC.presence_of_element_located(locator))
+        return self.waits.until(EC.presence_of_element_located(locator), timeout,
+                                self._label("find_element", locator))
     
-    def find_elements(self, locator, timeout=10):
+    def find_elements(self, locator, timeout=None):
         """Find elements with explicit wait"""
-        wait = WebDriverWait(self.driver, timeout)
-        return wait.until(EC.presence_of_all_elements_located(locator))
+        return self.waits.until(EC.presence_of_all_elements_located(locator), timeout,
+                                self._label("find_elements", locator))
     
-    def click_element(self, locator, timeout=10):
+    def find_elements_now(self, locator):
+        """Find elements without waiting (empty list when none are present)"""
+        return self.waits.find_now(locator, self._label("find_elements_now", locator))
+    
+    def get_listing_snapshot(self, list_locator, item_locator, field_locators, timeout=None):
+        """
+        Read a whole listing (inventory, cart, checkout overview) in one script call
+        
+        Args:
+            list_locator (tuple): Locator of the list container to wait for
+            item_locator (tuple): Locator of a single item row
+            field_locators (dict): Record key -> locator of a text element in the row
+            timeout (int): Seconds to wait for the list container
+            
+        Returns:
+            list: One dict per item with index, the requested fields,
+                  button_text and button_class
+        """
+        self.find_element(list_locator, timeout)
+        fields = {key: self.to_css(locator) for key, locator in field_locators.items()}
+        return self.driver.execute_script(self.LISTING_SNAPSHOT_SCRIPT, self.to_css(item_locator), fields)
+    
+    @classmethod
+    def to_css(cls, locator):
+        """Convert a simple (By, value) locator to a CSS selector"""
+        by, value = locator
+        if by not in cls.CSS_PREFIXES:
+            raise ValueError(f"Locator cannot be expressed as CSS: {locator}")
+        return cls.CSS_PREFIXES[by] + value
+    
+    def click_element(self, locator, timeout=None):
         """Click element with explicit wait"""
-        wait = WebDriverWait(self.driver, timeout)
-        element = wait.until(EC.element_to_be_clickable(locator))
-        element.click()
+        self.backend.click(locator, timeout, self._label("click_element", locator))
+        self._capture_page_timing("click")
     
-    def send_keys_to_element(self, locator, text, timeout=10):
+    def send_keys_to_element(self, locator, text, timeout=None):
         """Send keys to element with explicit wait"""
-        wait = WebDriverWait(self.driver, timeout)
-        element = wait.until(EC.presence_of_element_located(locator))
-        element.clear()
-        element.send_keys(text)
+        self.backend.type_text(locator, text, timeout, self._label("send_keys_to_element", locator))
     
-    def get_element_text(self, locator, timeout=10):
+    def get_element_text(self, locator, timeout=None):
         """Get element text with explicit wait"""
-        wait = WebDriverWait(self.driver, timeout)
-        element = wait.until(EC.presence_of_element_located(locator))
-        return element.text
+        return self.backend.get_text(locator, timeout, self._label("get_element_text", locator))
     
-    def get_element_attribute(self, locator, attribute, timeout=10):
+    def get_element_attribute(self, locator, attribute, timeout=None):
         """Get element attribute with explicit wait"""
-        wait = WebDriverWait(self.driver, timeout)
-        element = wait.until(EC.presence_of_element_located(locator))
+        element = self.find_element(locator, timeout)
         return element.get_attribute(attribute)
     
-    def is_element_present(self, locator, timeout=10):
+    def is_element_present(self, locator, timeout=None):
         """Check if element is present"""
         try:
             self.find_element(locator, timeout)
@@ -70,24 +255,35 @@ class BasePage:
         except TimeoutException:
             return False
     
-    def is_element_visible(self, locator, timeout=10):
-        """Check if element is visible"""
+    def is_element_visible(self, locator, timeout=None):
+        """Check if element is visible, waiting up to timeout for it
+        
+        A False result costs the full timeout: check for absence with
+        is_element_absent() or is_element_visible_now() instead.
+        """
         try:
-            wait = WebDriverWait(self.driver, timeout)
-            wait.until(EC.visibility_of_element_located(locator))
+            self.wait_for_element_visible(locator, timeout)
             return True
         except TimeoutException:
             return False
     
-    def wait_for_element_visible(self, locator, timeout=10):
+    def is_element_visible_now(self, locator):
+        """Check if element is visible right now, without waiting"""
+        return any(element.is_displayed() for element in self.find_elements_now(locator))
+    
+    def is_element_absent(self, locator, timeout=None):
+        """Fast-fail check that an element is not (or no longer) present"""
+        return self.waits.is_absent(locator, timeout, self._label("is_element_absent", locator))
+    
+    def wait_for_element_visible(self, locator, timeout=None):
         """Wait for element to be visible"""
-        wait = WebDriverWait(self.driver, timeout)
-        return wait.until(EC.visibility_of_element_located(locator))
+        return self.waits.until(EC.visibility_of_element_located(locator), timeout,
+                                self._label("wait_for_element_visible", locator))
     
-    def wait_for_element_invisible(self, locator, timeout=10):
+    def wait_for_element_invisible(self, locator, timeout=None):
         """Wait for element to be invisible"""
-        wait = WebDriverWait(self.driver, timeout)
-        return wait.until(EC.invisibility_of_element_located(locator))
+        return self.waits.until(EC.invisibility_of_element_located(locator), timeout,
+                                self._label("wait_for_element_invisible", locator))
     
     def scroll_to_element(self, locator):
         """Scroll to element"""
@@ -99,39 +295,49 @@ class BasePage:
         element = self.find_element(locator)
         self.actions.move_to_element(element).perform()
     
-    def take_screenshot(self, filename=None):
-        """Take screenshot and save it"""
-        if not filename:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"screenshot_{timestamp}.png"
-        
-        # Create screenshots directory if it doesn't exist
-        screenshot_dir = PathManager.ensure_directory_exists(PathManager.get_screenshots_path())
+    def take_screenshot(self, filename=None, wait=True):
+        """Take screenshot and save it through the background writer
         
-        filepath = screenshot_dir / filename
-        self.driver.save_screenshot(str(filepath))
-        return str(filepath)
+        The file is named by content hash; filename is recorded in the
+        screenshots manifest. Returns the file path once the file is written,
+        or right away with wait=False (the file exists after
+        ScreenshotWriter.flush()).
+        """
+        name = filename or f"{type(self).__name__}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        filepath = ScreenshotWriter.submit(self.driver.get_screenshot_as_png(), name)
+        if wait:
+            ScreenshotWriter.flush()
+        return filepath
     
-    def wait_for_page_load(self, timeout=30):
-        """Wait for page to load completely"""
+    def wait_for_page_load(self, timeout=None):
+        """Wait for page to load completely (to DOMContentLoaded in eager, lean sessions)"""
+        timeout = timeout if timeout is not None else TestConfig.PAGE_LOAD_TIMEOUT
+        ready_states = ("complete",)
+        if self.driver.capabilities.get("pageLoadStrategy") == "eager":
+            ready_states = ("interactive", "complete")
         try:
-            WebDriverWait(self.driver, timeout).until(
-                lambda driver: driver.execute_script("return document.readyState") == "complete"
+            self.waits.until(
+                lambda driver: driver.execute_script("return document.readyState") in ready_states,
+                timeout,
+                self._label("wait_for_page_load")
             )
         except TimeoutException:
-            print(f"Page load timeout after {timeout} seconds")
+            self.logger.warning(f"Page load timeout after {timeout} seconds")
     
     def refresh_page(self):
         """Refresh the current page"""
         self.driver.refresh()
         self.wait_for_page_load()
+        self._capture_page_timing("refresh")
     
     def go_back(self):
         """Go back to previous page"""
         self.driver.back()
         self.wait_for_page_load()
+        self._capture_page_timing("back")
     
     def go_forward(self):
         """Go forward to next page"""
         self.driver.forward()
-        self.wait_for_page_load() 
\ No newline at end of file
+        self.wait_for_page_load()
+        self._capture_page_timing("forward")
\ No newline at end of file
@@ -0,0 +1,72 @@
+"""Per-browser results of a run that parametrises the driver over several browsers"""
+
+import json
+from .path_manager import PathManager
+
+
+class BrowserMatrixPlugin:
+    """Collects (test x browser) cell results and summarises them per browser
+    
+    With --browsers, every test using the driver fixture runs once per
+    browser; the cells are ordinary test items, so xdist spreads them over
+    the workers like any other test. The browser of a cell travels to the
+    reporting process as a user property.
+    """
+    
+    # Set by the driver fixture on each test it serves
+    PROPERTY = "browser"
+    
+    def __init__(self, config, browsers):
+        self.is_worker = hasattr(config, "workerinput")
+        self.browsers = browsers
+        self.cells = {}
+    
+    def pytest_runtest_logreport(self, report):
+        """Fold a test's phase reports into one outcome for its browser"""
+        if self.is_worker:
+            return
+        browser = dict(report.user_properties).get(self.PROPERTY)
+        if browser is None:
+            return
+        cell = self.cells.setdefault(report.nodeid, {"browser": browser, "outcome": "passed", "duration": 0.0})
+        cell["duration"] += report.duration
+        if report.failed and cell["outcome"] != "failed":
+            cell["outcome"] = "failed" if report.when == "call" else "error"
+        elif report.skipped and cell["outcome"] == "passed":
+            cell["outcome"] = "skipped"
+    
+    def summary(self):
+        """Get counts, test time and failed tests per browser"""
+        summary = {browser: self._empty_stats() for browser in self.browsers}
+        for nodeid, cell in sorted(self.cells.items()):
+            stats = summary.setdefault(cell["browser"], self._empty_stats())
+            stats[cell["outcome"]] += 1
+            stats["duration_s"] = round(stats["duration_s"] + cell["duration"], 3)
+            if cell["outcome"] in ("failed", "error"):
+                stats["failed_tests"].append(nodeid)
+        return summary
+    
+    @staticmethod
+    def _empty_stats():
+        """Counters for one browser"""
+        return {"passed": 0, "failed": 0, "error": 0, "skipped": 0, "duration_s": 0.0, "failed_tests": []}
+    
+    def pytest_sessionfinish(self, session, exitstatus):
+        """Write reports/browser_matrix.json"""
+        if self.is_worker or not self.cells:
+            return
+        reports_dir = PathManager.ensure_directory_exists(PathManager.get_reports_path())
+        with open(reports_dir / "browser_matrix.json", "w", encoding="utf-8") as f:
+            json.dump(self.summary(), f, indent=2)
+    
+    def pytest_terminal_summary(self, terminalreporter):
+        """Print one line per browser"""
+        if self.is_worker or not self.cells:
+            return
+        terminalreporter.write_sep("-", "browser matrix")
+        terminalreporter.write_line(f"{'browser':<10}{'passed':>8}{'failed':>8}{'error':>8}{'skipped':>9}{'time':>10}")
+        for browser, stats in self.summary().items():
+            terminalreporter.write_line(
+                f"{browser:<10}{stats['passed']:>8}{stats['failed']:>8}{stats['error']:>8}"
+                f"{stats['skipped']:>9}{stats['duration_s']:>9.1f}s"
+            )
@@ -0,0 +1,64 @@
+import json
+from config.test_data import TestData
+from utils.session_state import SessionStateCache
+
+
+class CartStateBuilder:
+    """Build cart contents directly in the app's client-side storage
+    
+    Sauce Demo keeps the cart as a JSON list of product ids in localStorage,
+    so a test can start on the cart or a checkout step without clicking
+    through the inventory first.
+    
+    Example:
+        CartStateBuilder(driver).with_products("Sauce Labs Backpack").open("checkout_step_one")
+    """
+    
+    CART_STORAGE_KEY = "cart-contents"
+    
+    LANDING_PAGES = {
+        "inventory": "inventory.html",
+        "cart": "cart.html",
+        "checkout_step_one": "checkout-step-one.html",
+        "checkout_step_two": "checkout-step-two.html",
+    }
+    
+    def __init__(self, driver, user_type="valid"):
+        self.driver = driver
+        self.user_type = user_type
+        self.products = []
+    
+    def as_user(self, user_type):
+        """Use another TestData.USERS user type"""
+        self.user_type = user_type
+        return self
+    
+    def with_products(self, *product_names):
+        """Add products (names from TestData.PRODUCTS) to the cart being built"""
+        for product_name in product_names:
+            if TestData.get_product_id(product_name) is None:
+                raise ValueError(f"Unknown product: {product_name}")
+            self.products.append(product_name)
+        return self
+    
+    def get_storage(self):
+        """Get the localStorage entries describing the cart"""
+        product_ids = [TestData.get_product_id(product_name) for product_name in self.products]
+        return {self.CART_STORAGE_KEY: json.dumps(product_ids)}
+    
+    def open(self, page="cart"):
+        """
+        Log in, seed the cart and land directly on a page of the purchase funnel
+        
+        Args:
+            page (str): One of LANDING_PAGES (inventory, cart, checkout_step_one, checkout_step_two)
+        """
+        if page not in self.LANDING_PAGES:
+            raise ValueError(f"Unknown landing page: {page}")
+        SessionStateCache.login(
+            self.driver,
+            self.user_type,
+            landing_path=self.LANDING_PAGES[page],
+            local_storage=self.get_storage(),
+        )
+        return self.driver
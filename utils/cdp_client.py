@@ -0,0 +1,238 @@
+"""Minimal Chrome DevTools Protocol client over a stdlib RFC 6455 websocket"""
+
+import base64
+import hashlib
+import json
+import os
+import socket
+import struct
+import threading
+from urllib.parse import urlsplit
+from selenium.common.exceptions import WebDriverException
+
+
+class CdpError(WebDriverException):
+    """Raised when a CDP command fails or the connection to the browser is lost"""
+
+
+class CdpConnection:
+    """One persistent websocket to a DevTools target
+    
+    Commands are JSON messages matched to their responses by id; a reader
+    thread resolves them and hands events to the callbacks registered with
+    on(). send_batch() writes several commands in one go and then waits for
+    all the responses, so a batch costs a single round-trip.
+    """
+    
+    GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+    
+    OP_CONTINUATION, OP_TEXT, OP_BINARY, OP_CLOSE, OP_PING, OP_PONG = 0x0, 0x1, 0x2, 0x8, 0x9, 0xA
+    
+    def __init__(self, ws_url, timeout=10):
+        self.ws_url = ws_url
+        self.timeout = timeout
+        self.closed = False
+        self._next_id = 0
+        self._pending = {}
+        self._listeners = {}
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._sock = self._connect(ws_url, timeout)
+        self._reader = threading.Thread(target=self._read_loop, name="cdp-reader", daemon=True)
+        self._reader.start()
+    
+    def send(self, method, params=None, timeout=None):
+        """Send one command and return its result"""
+        return self.send_batch([(method, params)], timeout)[0]
+    
+    def send_batch(self, commands, timeout=None):
+        """
+        Send several commands at once and wait for all of their results
+        
+        Args:
+            commands (list): (method, params) pairs, executed by the browser in order
+            timeout (float): Seconds to wait for the responses
+        
+        Returns:
+            list: The result of each command
+        
+        Raises:
+            CdpError: If a command fails, times out or the connection is lost
+        """
+        timeout = timeout if timeout is not None else self.timeout
+        waiters = []
+        frames = []
+        with self._lock:
+            if self.closed:
+                raise CdpError(f"CDP connection to {self.ws_url} is closed")
+            for method, params in commands:
+                self._next_id += 1
+                waiter = {"event": threading.Event(), "method": method}
+                self._pending[self._next_id] = waiter
+                waiters.append(waiter)
+                message = json.dumps({"id": self._next_id, "method": method, "params": params or {}})
+                frames.append(self._encode_frame(self.OP_TEXT, message.encode("utf-8")))
+        self._write(b"".join(frames))
+        
+        results = []
+        for waiter in waiters:
+            if not waiter["event"].wait(timeout):
+                raise CdpError(f"No response to {waiter['method']} within {timeout}s")
+            if "error" in waiter:
+                raise CdpError(f"{waiter['method']} failed: {waiter['error']}")
+            results.append(waiter["result"])
+        return results
+    
+    def on(self, event, callback):
+        """Call callback(params) on the reader thread for every `event` the browser sends"""
+        self._listeners.setdefault(event, []).append(callback)
+    
+    def close(self):
+        """Close the websocket"""
+        if self.closed:
+            return
+        try:
+            self._write(self._encode_frame(self.OP_CLOSE, b""))
+        except CdpError:
+            pass  # Already lost
+        self._shutdown("closed by client")
+    
+    @classmethod
+    def _connect(cls, ws_url, timeout):
+        """Open the TCP connection and perform the websocket opening handshake"""
+        parts = urlsplit(ws_url)
+        sock = socket.create_connection((parts.hostname, parts.port or 80), timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        key = base64.b64encode(os.urandom(16)).decode("ascii")
+        request = (
+            f"GET {parts.path or '/'} HTTP/1.1\r\n"
+            f"Host: {parts.netloc}\r\n"
+            "Upgrade: websocket\r\n"
+            "Connection: Upgrade\r\n"
+            f"Sec-WebSocket-Key: {key}\r\n"
+            "Sec-WebSocket-Version: 13\r\n\r\n"
+        )
+        sock.sendall(request.encode("ascii"))
+        
+        response = b""
+        while b"\r\n\r\n" not in response:
+            chunk = sock.recv(4096)
+            if not chunk:
+                sock.close()
+                raise CdpError(f"Websocket handshake with {ws_url} failed: connection closed")
+            response += chunk
+        head, _, rest = response.partition(b"\r\n\r\n")
+        lines = head.decode("latin-1").split("\r\n")
+        headers = {name.strip().lower(): value.strip() for name, _, value in (line.partition(":") for line in lines[1:])}
+        expected = base64.b64encode(hashlib.sha1((key + cls.GUID).encode("ascii")).digest()).decode("ascii")
+        if " 101 " not in f"{lines[0]} " or headers.get("sec-websocket-accept") != expected:
+            sock.close()
+            raise CdpError(f"Websocket handshake with {ws_url} failed: {lines[0]}")
+        if rest:
+            sock.close()
+            raise CdpError(f"Websocket handshake with {ws_url} failed: unexpected data after upgrade")
+        sock.settimeout(None)
+        return sock
+    
+    @classmethod
+    def _encode_frame(cls, opcode, payload):
+        """Build a final, masked client frame"""
+        header = bytes([0x80 | opcode])
+        length = len(payload)
+        if length < 126:
+            header += bytes([0x80 | length])
+        elif length < 1 << 16:
+            header += bytes([0x80 | 126]) + struct.pack("!H", length)
+        else:
+            header += bytes([0x80 | 127]) + struct.pack("!Q", length)
+        mask = os.urandom(4)
+        masked = bytes(byte ^ mask[index % 4] for index, byte in enumerate(payload))
+        return header + mask + masked
+    
+    def _write(self, data):
+        """Write raw frames, one writer at a time"""
+        try:
+            with self._write_lock:
+                self._sock.sendall(data)
+        except OSError as e:
+            self._shutdown(f"write failed: {e}")
+            raise CdpError(f"CDP connection to {self.ws_url} lost: {e}") from e
+    
+    def _recv_exact(self, size):
+        """Read exactly size bytes"""
+        data = b""
+        while len(data) < size:
+            chunk = self._sock.recv(size - len(data))
+            if not chunk:
+                raise ConnectionResetError("websocket closed by the browser")
+            data += chunk
+        return data
+    
+    def _read_frame(self):
+        """Read one frame; return (fin, opcode, payload)"""
+        first, second = self._recv_exact(2)
+        length = second & 0x7F
+        if length == 126:
+            length = struct.unpack("!H", self._recv_exact(2))[0]
+        elif length == 127:
+            length = struct.unpack("!Q", self._recv_exact(8))[0]
+        mask = self._recv_exact(4) if second & 0x80 else None
+        payload = self._recv_exact(length)
+        if mask:
+            payload = bytes(byte ^ mask[index % 4] for index, byte in enumerate(payload))
+        return bool(first & 0x80), first & 0x0F, payload
+    
+    def _read_loop(self):
+        """Reassemble messages, answer pings and dispatch responses and events"""
+        reason = "closed by the browser"
+        fragments = []
+        try:
+            while True:
+                fin, opcode, payload = self._read_frame()
+                if opcode == self.OP_PING:
+                    self._write(self._encode_frame(self.OP_PONG, payload))
+                    continue
+                if opcode == self.OP_CLOSE:
+                    break
+                if opcode == self.OP_PONG:
+                    continue
+                fragments.append(payload)
+                if fin:
+                    self._dispatch(json.loads(b"".join(fragments).decode("utf-8")))
+                    fragments = []
+        except (OSError, ValueError, CdpError) as e:
+            reason = str(e)
+        self._shutdown(reason)
+    
+    def _dispatch(self, message):
+        """Resolve the waiter of a response or call the listeners of an event"""
+        if "id" in message:
+            with self._lock:
+                waiter = self._pending.pop(message["id"], None)
+            if waiter is None:
+                return
+            if "error" in message:
+                waiter["error"] = message["error"].get("message", message["error"])
+            else:
+                waiter["result"] = message.get("result", {})
+            waiter["event"].set()
+            return
+        for callback in self._listeners.get(message.get("method"), ()):
+            callback(message.get("params", {}))
+    
+    def _shutdown(self, reason):
+        """Mark the connection closed and fail every command still waiting"""
+        with self._lock:
+            if self.closed:
+                return
+            self.closed = True
+            pending, self._pending = self._pending, {}
+        for waiter in pending.values():
+            waiter["error"] = f"connection {reason}"
+            waiter["event"].set()
+        try:
+            self._sock.close()
+        except OSError:
+            pass
+        for callback in self._listeners.get("close", ()):
+            callback({"reason": reason})
@@ -0,0 +1,234 @@
+"""Timing of every WebDriver command, attributed to the running test and page-object method"""
+
+import json
+import math
+import os
+import sys
+import threading
+import time
+from collections import deque
+from config.config import TestConfig
+from .base_page import BasePage
+from .path_manager import PathManager
+from .stats import Stats
+from .test_context import TestContext
+
+
+class CommandRecorder:
+    """Per-process record of the commands sent by instrumented drivers
+    
+    DriverFactory wraps each driver's command executor so every command is
+    timed where it leaves the client. A command is attributed to the test
+    running at the time and to the page-object call that issued it: the
+    outermost BasePage method (e.g. BasePage.click_element) and the
+    outermost page-object method (e.g. InventoryPage.add_item_to_cart).
+    Only commands sent from the test's own thread are attributed to it.
+    
+    Durations are aggregated into a log-scale histogram per key, so memory
+    stays bounded however long a process runs; percentiles are the upper
+    bound of their bucket (at most ~9% high).
+    """
+    
+    # Bucket i holds durations up to BUCKET_BASE_MS * 2 ** (i / BUCKETS_PER_DOUBLING)
+    BUCKET_BASE_MS = 0.01
+    BUCKETS_PER_DOUBLING = 8
+    
+    BASE_PAGE_FILE = os.path.normcase(str(PathManager.get_project_root() / "utils" / "base_page.py"))
+    PAGES_DIR = os.path.normcase(str(PathManager.get_project_root() / "pages")) + os.sep
+    
+    _samples = {}
+    _history = deque(maxlen=TestConfig.COMMAND_HISTORY_SIZE)
+    _code_owners = {}
+    _lock = threading.Lock()
+    
+    @classmethod
+    def install(cls, driver):
+        """Wrap a driver's command executor so every command is recorded"""
+        executor = driver.command_executor
+        if getattr(executor, "_command_recorder_installed", False):
+            return driver
+        execute = executor.execute
+        
+        def recorded_execute(command, params):
+            start = time.perf_counter()
+            response = None
+            try:
+                response = execute(command, params)
+                return response
+            finally:
+                cls.record(command, params, time.perf_counter() - start, response)
+        
+        executor.execute = recorded_execute
+        executor._command_recorder_installed = True
+        return driver
+    
+    @classmethod
+    def record(cls, command, params, elapsed, response):
+        """Record one command with its locator, duration, result size and caller"""
+        method, page_method = cls._find_caller(sys._getframe(2))
+        entry = {
+            "test": TestContext.get_thread_test(),
+            "command": command,
+            "locator": cls._get_locator(params),
+            "method": method,
+            "page_method": page_method,
+            "duration_ms": round(elapsed * 1000, 3),
+            "bytes": cls._get_result_size(response),
+            "ok": cls._is_ok(response),
+        }
+        keys = [("commands", command)]
+        if method:
+            keys.append(("methods", method))
+        if page_method:
+            keys.append(("page_methods", page_method))
+        if entry["test"]:
+            keys.append(("tests", entry["test"]))
+            keys.append(("test_commands", (entry["test"], command)))
+        
+        bucket = cls._get_bucket(entry["duration_ms"])
+        with cls._lock:
+            cls._history.append(entry)
+            for key in keys:
+                sample = cls._samples.get(key)
+                if sample is None:
+                    sample = cls._samples[key] = {
+                        "count": 0, "errors": 0, "bytes": 0, "total_ms": 0.0, "max_ms": 0.0, "buckets": {}
+                    }
+                sample["count"] += 1
+                sample["total_ms"] += entry["duration_ms"]
+                sample["max_ms"] = max(sample["max_ms"], entry["duration_ms"])
+                sample["buckets"][bucket] = sample["buckets"].get(bucket, 0) + 1
+                sample["bytes"] += entry["bytes"]
+                if not entry["ok"]:
+                    sample["errors"] += 1
+    
+    @classmethod
+    def get_history(cls, test=None):
+        """Get the most recent commands, optionally only those of one test"""
+        with cls._lock:
+            history = list(cls._history)
+        return [entry for entry in history if test is None or entry["test"] == test]
+    
+    @classmethod
+    def summary(cls):
+        """Get p50/p95/p99 and call counts per command, BasePage method, page method and test"""
+        with cls._lock:
+            samples = {key: dict(sample, buckets=dict(sample["buckets"])) for key, sample in cls._samples.items()}
+        
+        report = {"commands": {}, "methods": {}, "page_methods": {}, "tests": {}}
+        for (scope, name), sample in samples.items():
+            if scope in report:
+                report[scope][name] = cls._get_stats(sample)
+        for (scope, name), sample in samples.items():
+            if scope == "test_commands":
+                test, command = name
+                report["tests"][test].setdefault("commands", {})[command] = cls._get_stats(sample)
+        for scope in ("commands", "methods", "page_methods"):
+            report[scope] = dict(sorted(report[scope].items(), key=lambda item: item[1]["total_ms"], reverse=True))
+        return report
+    
+    @classmethod
+    def reset(cls):
+        """Clear all recorded commands"""
+        with cls._lock:
+            cls._samples.clear()
+            cls._history.clear()
+    
+    @classmethod
+    def write_report(cls, filename=None):
+        """Write the command statistics as JSON into the reports directory"""
+        if not cls._samples:
+            return None
+        reports_dir = PathManager.ensure_directory_exists(PathManager.get_reports_path())
+        filepath = reports_dir / (filename or f"webdriver_metrics{TestContext.get_worker_suffix()}.json")
+        with open(filepath, "w", encoding="utf-8") as f:
+            json.dump(cls.summary(), f, indent=2)
+        return str(filepath)
+    
+    @classmethod
+    def _find_caller(cls, frame):
+        """Get the outermost BasePage method and page-object method on the call stack"""
+        method = page_method = None
+        while frame is not None:
+            owner = cls._get_code_owner(frame.f_code)
+            page = frame.f_locals.get("self") if owner else None
+            # Walking outwards, so the last match is the outermost call
+            if isinstance(page, BasePage):
+                if owner == "base":
+                    method = f"BasePage.{frame.f_code.co_name}"
+                page_method = f"{type(page).__name__}.{frame.f_code.co_name}"
+            frame = frame.f_back
+        return method, page_method
+    
+    @classmethod
+    def _get_code_owner(cls, code):
+        """Classify a code object as BasePage code, page-object code or neither (memoised)"""
+        owner = cls._code_owners.get(code)
+        if owner is None:
+            filename = os.path.normcase(code.co_filename)
+            if filename == cls.BASE_PAGE_FILE:
+                owner = "base"
+            elif filename.startswith(cls.PAGES_DIR):
+                owner = "page"
+            else:
+                owner = ""
+            cls._code_owners[code] = owner
+        return owner
+    
+    @staticmethod
+    def _get_locator(params):
+        """Get the locator of a find command as 'strategy=value'"""
+        if params and "using" in params:
+            return f"{params['using']}={params.get('value')}"
+        return None
+    
+    @staticmethod
+    def _get_result_size(response):
+        """Get the size of a command's JSON result in bytes"""
+        if not isinstance(response, dict) or response.get("value") is None:
+            return 0
+        return len(json.dumps(response["value"], default=str))
+    
+    @staticmethod
+    def _is_ok(response):
+        """Check whether the remote end answered a command without an error"""
+        if not isinstance(response, dict):
+            return False
+        if response.get("status", 0) not in (0, 200):
+            return False
+        value = response.get("value")
+        return not (isinstance(value, dict) and "error" in value)
+    
+    @classmethod
+    def _get_bucket(cls, duration_ms):
+        """Get the histogram bucket of a duration"""
+        if duration_ms <= cls.BUCKET_BASE_MS:
+            return 0
+        return math.ceil(math.log2(duration_ms / cls.BUCKET_BASE_MS) * cls.BUCKETS_PER_DOUBLING)
+    
+    @classmethod
+    def _get_stats(cls, sample):
+        """Summarise the histogram of one sample"""
+        buckets = sorted(sample["buckets"].items())
+        
+        def percentile(pct):
+            # Nearest-rank percentile, reported as the upper bound of its bucket
+            rank = Stats.rank(sample["count"], pct)
+            seen = 0
+            for bucket, count in buckets:
+                seen += count
+                if seen >= rank:
+                    break
+            upper = cls.BUCKET_BASE_MS * 2 ** (bucket / cls.BUCKETS_PER_DOUBLING)
+            return round(min(upper, sample["max_ms"]), 3)
+        
+        return {
+            "count": sample["count"],
+            "errors": sample["errors"],
+            "total_ms": round(sample["total_ms"], 3),
+            "p50_ms": percentile(50),
+            "p95_ms": percentile(95),
+            "p99_ms": percentile(99),
+            "max_ms": sample["max_ms"],
+            "bytes": sample["bytes"],
+        }
@@ -0,0 +1,165 @@
+"""Local stand-in for the Sauce Demo site used for offline, low-latency runs"""
+
+import argparse
+import json
+import threading
+import time
+from functools import partial
+from http.cookies import SimpleCookie
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+from config.latency_profiles import LatencyProfiles
+from config.test_data import TestData
+from .fault_injection import FaultInjector
+
+
+class DemoRequestHandler(SimpleHTTPRequestHandler):
+    """Serves the static demo site plus the generated catalogue script"""
+    
+    protocol_version = "HTTP/1.1"  # Keep-alive, the browser reuses connections
+    
+    APP_DATA_PATH = "/app-data.js"
+    SESSION_COOKIE = "session-username"
+    
+    def do_GET(self):
+        """Serve a page after applying the injected latency and faults"""
+        path = urlsplit(self.path).path
+        plan = self.server.fault_injector.plan(path, self._get_username())
+        if plan["drop"]:
+            # Lost response: the client sees the connection close without an answer
+            self.close_connection = True
+            return
+        if plan["delay"]:
+            time.sleep(plan["delay"])
+        if path == self.APP_DATA_PATH:
+            return self._send_app_data()
+        return super().do_GET()
+    
+    def end_headers(self):
+        """Never let the browser serve a stale page between tests"""
+        self.send_header("Cache-Control", "no-store")
+        super().end_headers()
+    
+    def log_message(self, format, *args):
+        """Keep the test output quiet"""
+        pass
+    
+    def _get_username(self):
+        """Get the logged in user from the session cookie, if any"""
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        morsel = cookie.get(self.SESSION_COOKIE)
+        return morsel.value if morsel else None
+    
+    def _send_app_data(self):
+        """Send the catalogue and accepted users as a script"""
+        body = f"window.SWAG_LABS_DATA = {json.dumps(DemoServer.get_app_data())};".encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/javascript; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class DemoServer:
+    """Threaded HTTP server serving a faithful copy of the pages the framework touches
+    
+    Login, inventory, item details, cart and the three checkout steps use the
+    same ids and classes as the locators in pages/. State lives where the real
+    app keeps it: the "session-username" cookie and the "cart-contents"
+    localStorage entry. Port 0 binds a free port, so every xdist worker gets
+    its own server. Latency and faults, including the performance_glitch_user
+    delay, come from a FaultInjector profile (config/latency_profiles.py).
+    
+    Example:
+        with DemoServer() as server:
+            TestConfig.BASE_URL = server.base_url
+    """
+    
+    SITE_DIR = Path(__file__).parent / "demo_site"
+    
+    PASSWORD = "secret_sauce"
+    ACCEPTED_USERS = ("standard_user", "locked_out_user", "problem_user", "performance_glitch_user")
+    LOCKED_USER = "locked_out_user"
+    PROBLEM_USER = "problem_user"
+    
+    def __init__(self, host="127.0.0.1", port=0, latency_profile=None, seed=None):
+        self.host = host
+        self.port = port
+        self.fault_injector = FaultInjector(latency_profile, seed)
+        self._httpd = None
+        self._thread = None
+    
+    @classmethod
+    def get_app_data(cls):
+        """Get the catalogue and user rules the site's scripts run on"""
+        return {
+            "products": [
+                {key: product[key] for key in ("id", "name", "description", "price_value")}
+                for product in TestData.PRODUCTS.values()
+            ],
+            "users": list(cls.ACCEPTED_USERS),
+            "password": cls.PASSWORD,
+            "locked_users": [cls.LOCKED_USER],
+            "problem_users": [cls.PROBLEM_USER],
+            "tax_rate": TestData.TAX_RATE,
+        }
+    
+    @property
+    def base_url(self):
+        """URL of the site root, usable as TestConfig.BASE_URL"""
+        if self._httpd is None:
+            raise RuntimeError("Demo server is not running")
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+    
+    def start(self):
+        """Bind the port and serve from a daemon thread"""
+        if self._httpd is not None:
+            return self
+        handler = partial(DemoRequestHandler, directory=str(self.SITE_DIR))
+        self._httpd = ThreadingHTTPServer((self.host, self.port), handler)
+        self._httpd.daemon_threads = True
+        self._httpd.fault_injector = self.fault_injector
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="demo-server", daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        """Stop serving and release the port"""
+        if self._httpd is None:
+            return
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        self._thread.join()
+        self._httpd = None
+        self._thread = None
+    
+    def __enter__(self):
+        return self.start()
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+def main():
+    """Serve the demo site in the foreground for manual browsing"""
+    parser = argparse.ArgumentParser(description="Local Sauce Demo stand-in server")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000, help="Port to bind, 0 for any free port (default: 8000)")
+    parser.add_argument("--latency-profile", choices=LatencyProfiles.get_profile_names(),
+                        help="Latency/fault profile (default: LATENCY_PROFILE or 'default')")
+    args = parser.parse_args()
+    
+    with DemoServer(args.host, args.port, args.latency_profile) as server:
+        print(f"Serving Sauce Demo stand-in at {server.base_url} "
+              f"with latency profile '{server.fault_injector.profile}' (Ctrl+C to stop)")
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,399 @@
+/* Sauce Demo stand-in: client-side behaviour of the pages served by utils/demo_server.py */
+(function () {
+    "use strict";
+
+    var SESSION_COOKIE = "session-username";
+    var CART_KEY = "cart-contents";
+    var DATA = window.SWAG_LABS_DATA;
+
+    var SORTERS = {
+        az: function (a, b) { return a.name.localeCompare(b.name); },
+        za: function (a, b) { return b.name.localeCompare(a.name); },
+        lohi: function (a, b) { return a.price_value - b.price_value || a.name.localeCompare(b.name); },
+        hilo: function (a, b) { return b.price_value - a.price_value || a.name.localeCompare(b.name); }
+    };
+
+    // ---- session -----------------------------------------------------------
+
+    function getUsername() {
+        var match = document.cookie.match(new RegExp("(?:^|; )" + SESSION_COOKIE + "=([^;]*)"));
+        return match ? decodeURIComponent(match[1]) : null;
+    }
+
+    function setUsername(username) {
+        document.cookie = SESSION_COOKIE + "=" + encodeURIComponent(username) + "; path=/";
+    }
+
+    function clearUsername() {
+        document.cookie = SESSION_COOKIE + "=; path=/; expires=Thu, 01 Jan 1970 00:00:00 GMT";
+    }
+
+    function isProblemUser() {
+        return DATA.problem_users.indexOf(getUsername()) !== -1;
+    }
+
+    // ---- cart --------------------------------------------------------------
+
+    function getCart() {
+        try {
+            return JSON.parse(window.localStorage.getItem(CART_KEY)) || [];
+        } catch (e) {
+            return [];
+        }
+    }
+
+    function setCart(ids) {
+        if (ids.length) {
+            window.localStorage.setItem(CART_KEY, JSON.stringify(ids));
+        } else {
+            window.localStorage.removeItem(CART_KEY);
+        }
+        renderBadge();
+    }
+
+    function addToCart(id) {
+        var cart = getCart();
+        if (cart.indexOf(id) === -1) {
+            cart.push(id);
+        }
+        setCart(cart);
+    }
+
+    function removeFromCart(id) {
+        setCart(getCart().filter(function (itemId) { return itemId !== id; }));
+    }
+
+    function getProduct(id) {
+        for (var i = 0; i < DATA.products.length; i++) {
+            if (DATA.products[i].id === id) {
+                return DATA.products[i];
+            }
+        }
+        return null;
+    }
+
+    function getCartProducts() {
+        return getCart().map(getProduct).filter(Boolean);
+    }
+
+    function formatPrice(value) {
+        return "$" + value.toFixed(2);
+    }
+
+    // ---- DOM helpers -------------------------------------------------------
+
+    function el(tag, className, text) {
+        var element = document.createElement(tag);
+        if (className) {
+            element.className = className;
+        }
+        if (text !== undefined) {
+            element.textContent = text;
+        }
+        return element;
+    }
+
+    function itemLink(product, child, suffix) {
+        var link = el("a");
+        link.href = "inventory-item.html?id=" + product.id;
+        link.id = "item_" + product.id + "_" + suffix + "_link";
+        link.appendChild(child);
+        return link;
+    }
+
+    function itemImage(product, className) {
+        var image = el("img", className);
+        image.alt = product.name;
+        image.src = isProblemUser() ? "static/img/sl-404.svg" : "static/img/product.svg";
+        return image;
+    }
+
+    function cartButton(product, onChange) {
+        var button = el("button");
+        button.type = "button";
+        function render() {
+            var inCart = getCart().indexOf(product.id) !== -1;
+            button.textContent = inCart ? "Remove" : "Add to cart";
+            button.className = (inCart ? "btn_secondary" : "btn_primary") + " btn_small btn_inventory";
+        }
+        button.addEventListener("click", function () {
+            var inCart = getCart().indexOf(product.id) !== -1;
+            // Like the real app, problem_user can only change every other product
+            if (isProblemUser() && product.id % 2) {
+                return;
+            }
+            if (inCart) {
+                removeFromCart(product.id);
+            } else {
+                addToCart(product.id);
+            }
+            render();
+            if (onChange) {
+                onChange();
+            }
+        });
+        render();
+        button.refresh = render;
+        return button;
+    }
+
+    function renderBadge() {
+        var link = document.querySelector(".shopping_cart_link");
+        if (!link) {
+            return;
+        }
+        var badge = link.querySelector(".shopping_cart_badge");
+        var count = getCart().length;
+        if (!count) {
+            if (badge) {
+                link.removeChild(badge);
+            }
+            return;
+        }
+        if (!badge) {
+            badge = el("span", "shopping_cart_badge");
+            link.appendChild(badge);
+        }
+        badge.textContent = String(count);
+    }
+
+    // ---- shared header and burger menu -------------------------------------
+
+    function initMenu(onReset) {
+        var wrap = document.querySelector(".bm-menu-wrap");
+        if (!wrap) {
+            return;
+        }
+        function setOpen(open) {
+            wrap.classList.toggle("bm-menu-open", open);
+            wrap.setAttribute("aria-hidden", open ? "false" : "true");
+        }
+        document.getElementById("react-burger-menu-btn").addEventListener("click", function () { setOpen(true); });
+        document.getElementById("react-burger-cross-btn").addEventListener("click", function () { setOpen(false); });
+        document.getElementById("logout_sidebar_link").addEventListener("click", function (event) {
+            event.preventDefault();
+            clearUsername();
+            window.location.href = "index.html";
+        });
+        document.getElementById("reset_sidebar_link").addEventListener("click", function (event) {
+            event.preventDefault();
+            setCart([]);
+            if (onReset) {
+                onReset();
+            }
+        });
+        renderBadge();
+    }
+
+    function requireLogin() {
+        if (getUsername()) {
+            return true;
+        }
+        var page = window.location.pathname.split("/").pop();
+        window.sessionStorage.setItem("login-error", "Epic sadface: You can only access '/" + page + "' when you are logged in.");
+        window.location.replace("index.html");
+        return false;
+    }
+
+    // ---- pages -------------------------------------------------------------
+
+    function showError(container, message) {
+        container.innerHTML = "";
+        container.appendChild(el("h3", null, message)).setAttribute("data-test", "error");
+        container.classList.add("error");
+    }
+
+    function initLogin() {
+        var form = document.getElementById("login_form");
+        var error = form.querySelector(".error-message-container");
+        var pending = window.sessionStorage.getItem("login-error");
+        if (pending) {
+            window.sessionStorage.removeItem("login-error");
+            showError(error, pending);
+        }
+        form.addEventListener("submit", function (event) {
+            event.preventDefault();
+            var username = document.getElementById("user-name").value;
+            var password = document.getElementById("password").value;
+            if (!username) {
+                return showError(error, "Epic sadface: Username is required");
+            }
+            if (!password) {
+                return showError(error, "Epic sadface: Password is required");
+            }
+            if (DATA.users.indexOf(username) === -1 || password !== DATA.password) {
+                return showError(error, "Epic sadface: Username and password do not match any user in this service");
+            }
+            if (DATA.locked_users.indexOf(username) !== -1) {
+                return showError(error, "Epic sadface: Sorry, this user has been locked out.");
+            }
+            setUsername(username);
+            window.location.href = "inventory.html";
+        });
+    }
+
+    function initInventory() {
+        var list = document.querySelector(".inventory_list");
+        var select = document.querySelector(".product_sort_container");
+        var activeOption = document.querySelector(".active_option");
+        var buttons = [];
+
+        function render() {
+            var products = DATA.products.slice();
+            // problem_user's sort control does nothing, as on the real site
+            products.sort(SORTERS[isProblemUser() ? "az" : select.value] || SORTERS.az);
+            list.innerHTML = "";
+            buttons = [];
+            products.forEach(function (product) {
+                var item = el("div", "inventory_item");
+                var imageWrapper = el("div", "inventory_item_img");
+                imageWrapper.appendChild(itemLink(product, itemImage(product, "inventory_item_img"), "img"));
+                item.appendChild(imageWrapper);
+
+                var label = el("div", "inventory_item_label");
+                label.appendChild(itemLink(product, el("div", "inventory_item_name", product.name), "title"));
+                label.appendChild(el("div", "inventory_item_desc", product.description));
+                item.appendChild(label);
+
+                var pricebar = el("div", "pricebar");
+                pricebar.appendChild(el("div", "inventory_item_price", formatPrice(product.price_value)));
+                var button = cartButton(product);
+                buttons.push(button);
+                pricebar.appendChild(button);
+                item.appendChild(pricebar);
+
+                list.appendChild(item);
+            });
+            activeOption.textContent = select.options[select.selectedIndex].text;
+        }
+
+        select.addEventListener("change", render);
+        initMenu(function () {
+            buttons.forEach(function (button) { button.refresh(); });
+        });
+        render();
+    }
+
+    function initInventoryItem() {
+        var container = document.querySelector(".inventory_details_container");
+        var id = parseInt(new URLSearchParams(window.location.search).get("id"), 10);
+        var product = getProduct(id);
+        document.getElementById("back-to-products").addEventListener("click", function () {
+            window.location.href = "inventory.html";
+        });
+        initMenu();
+        if (!product) {
+            container.appendChild(el("div", "inventory_details_name", "ITEM NOT FOUND"));
+            return;
+        }
+        container.appendChild(itemImage(product, "inventory_details_img"));
+        var description = el("div", "inventory_details_desc_container");
+        description.appendChild(el("div", "inventory_details_name", product.name));
+        description.appendChild(el("div", "inventory_details_desc", product.description));
+        description.appendChild(el("div", "inventory_details_price", formatPrice(product.price_value)));
+        description.appendChild(cartButton(product));
+        container.appendChild(description);
+    }
+
+    function renderCartItems(list, removable) {
+        getCartProducts().forEach(function (product) {
+            var item = el("div", "cart_item");
+            item.appendChild(el("div", "cart_quantity", "1"));
+            var label = el("div", "cart_item_label");
+            label.appendChild(itemLink(product, el("div", "inventory_item_name", product.name), "title"));
+            label.appendChild(el("div", "inventory_item_desc", product.description));
+            var pricebar = el("div", "item_pricebar");
+            pricebar.appendChild(el("div", "inventory_item_price", formatPrice(product.price_value)));
+            if (removable) {
+                var button = el("button", "btn_secondary btn_small cart_button", "Remove");
+                button.type = "button";
+                button.addEventListener("click", function () {
+                    removeFromCart(product.id);
+                    list.removeChild(item);
+                    updateCheckoutButton();
+                });
+                pricebar.appendChild(button);
+            }
+            label.appendChild(pricebar);
+            item.appendChild(label);
+            list.appendChild(item);
+        });
+    }
+
+    function updateCheckoutButton() {
+        var checkout = document.getElementById("checkout");
+        if (checkout) {
+            checkout.disabled = getCart().length === 0;
+        }
+    }
+
+    function initCart() {
+        renderCartItems(document.querySelector(".cart_list"), true);
+        document.getElementById("checkout").addEventListener("click", function () {
+            window.location.href = "checkout-step-one.html";
+        });
+        updateCheckoutButton();
+        initMenu(function () { window.location.reload(); });
+    }
+
+    function initCheckoutStepOne() {
+        var form = document.getElementById("checkout_form");
+        var error = form.querySelector(".error-message-container");
+        var firstName = document.getElementById("first-name");
+        var lastName = document.getElementById("last-name");
+        var postalCode = document.getElementById("postal-code");
+        if (isProblemUser()) {
+            // The real problem_user types its last name into the first name field
+            lastName.addEventListener("input", function () {
+                firstName.value = lastName.value.slice(-1);
+                lastName.value = "";
+            });
+        }
+        form.addEventListener("submit", function (event) {
+            event.preventDefault();
+            if (!firstName.value) {
+                return showError(error, "Error: First Name is required");
+            }
+            if (!lastName.value) {
+                return showError(error, "Error: Last Name is required");
+            }
+            if (!postalCode.value) {
+                return showError(error, "Error: Postal Code is required");
+            }
+            window.location.href = "checkout-step-two.html";
+        });
+        initMenu();
+    }
+
+    function initCheckoutStepTwo() {
+        renderCartItems(document.querySelector(".cart_list"), false);
+        var subtotal = getCartProducts().reduce(function (sum, product) { return sum + product.price_value; }, 0);
+        var tax = Math.round(subtotal * DATA.tax_rate * 100) / 100;
+        document.querySelector(".summary_subtotal_label").textContent = "Item total: " + formatPrice(subtotal);
+        document.querySelector(".summary_tax_label").textContent = "Tax: " + formatPrice(tax);
+        document.querySelector(".summary_total_label").textContent = "Total: " + formatPrice(subtotal + tax);
+        document.getElementById("finish").addEventListener("click", function () {
+            setCart([]);
+            window.location.href = "checkout-complete.html";
+        });
+        initMenu();
+    }
+
+    var PAGES = {
+        "login": initLogin,
+        "inventory": initInventory,
+        "inventory-item": initInventoryItem,
+        "cart": initCart,
+        "checkout-step-one": initCheckoutStepOne,
+        "checkout-step-two": initCheckoutStepTwo,
+        "checkout-complete": initMenu
+    };
+
+    document.addEventListener("DOMContentLoaded", function () {
+        var page = document.body.getAttribute("data-page");
+        if (page !== "login" && !requireLogin()) {
+            return;
+        }
+        PAGES[page]();
+    });
+})();
@@ -1,32 +1,73 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.service import Service as FirefoxService
-from selenium.webdriver.edge.service import Service as EdgeService
-from selenium.webdriver.chrome.options import Options as ChromeOptions
-from selenium.webdriver.firefox.options import Options as FirefoxOptions
-from selenium.webdriver.edge.options import Options as EdgeOptions
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
+import importlib
+from selenium.common.exceptions import WebDriverException
 from config.config import TestConfig
 from utils.logger import Logger
-import os
+from utils.driver_resolver import DriverBinaryResolver
+from utils.command_recorder import CommandRecorder
 
 
 class DriverFactory:
     """Factory class for creating WebDriver instances"""
     
+    # Selenium package of each browser; imported on the first launch of that browser
+    BROWSERS = {
+        "chrome": "selenium.webdriver.chrome",
+        "firefox": "selenium.webdriver.firefox",
+        "edge": "selenium.webdriver.edge",
+    }
+    
+    _browser_classes = {}
+    
+    # full: load everything; lean: skip images, fonts, media and analytics, return at DOMContentLoaded
+    PROFILES = ("full", "lean")
+    
+    # Blocked through CDP in lean Chromium sessions
+    LEAN_BLOCKED_URLS = [
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+        "*.woff", "*.woff2", "*.ttf", "*.otf",
+        "*.mp4", "*.webm", "*.mp3", "*.ogg",
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+        "*backtrace.io*", "*hotjar.com*", "*segment.io*",
+    ]
+    
+    # Background services and first-run machinery a test browser never needs
+    LEAN_CHROMIUM_ARGUMENTS = [
+        "--disable-extensions",
+        "--disable-background-networking",
+        "--disable-component-update",
+        "--disable-default-apps",
+        "--disable-sync",
+        "--no-first-run",
+        "--no-default-browser-check",
+        "--mute-audio",
+        "--blink-settings=imagesEnabled=false",
+    ]
+    
+    LEAN_FIREFOX_PREFERENCES = {
+        "permissions.default.image": 2,
+        "gfx.downloadable_fonts.enabled": False,
+        "media.autoplay.default": 5,
+        "app.update.enabled": False,
+        "extensions.update.enabled": False,
+        "browser.shell.checkDefaultBrowser": False,
+        "datareporting.healthreport.uploadEnabled": False,
+        "datareporting.policy.dataSubmissionEnabled": False,
+        "toolkit.telemetry.enabled": False,
+        "network.prefetch-next": False,
+    }
+    
     def __init__(self):
         self.logger = Logger().get_logger()
     
     @staticmethod
-    def get_driver(browser_name=None, headless=None):
+    def get_driver(browser_name=None, headless=None, profile=None):
         """
         Create and return a WebDriver instance based on browser configuration
         
         Args:
             browser_name (str): Browser name (chrome, firefox, edge)
             headless (bool): Whether to run in headless mode
+            profile (str): Browser profile (full, lean; default: BROWSER_PROFILE)
             
         Returns:
             WebDriver: Configured WebDriver instance
@@ -37,22 +78,39 @@ class DriverFactory:
         factory = DriverFactory()
         browser = browser_name or TestConfig.BROWSER
         headless_mode = headless if headless is not None else TestConfig.HEADLESS
+        profile = profile or TestConfig.BROWSER_PROFILE
+        if profile not in DriverFactory.PROFILES:
+            raise ValueError(f"Unsupported browser profile: {profile}")
+        lean = profile == "lean"
         
-        factory.logger.info(f"Creating {browser} driver (headless: {headless_mode})")
+        factory.logger.info(f"Creating {browser} driver (headless: {headless_mode}, profile: {profile})")
         
         if browser == "chrome":
-            return factory._create_chrome_driver(headless_mode)
+            return factory._create_chrome_driver(headless_mode, lean)
         elif browser == "firefox":
-            return factory._create_firefox_driver(headless_mode)
+            return factory._create_firefox_driver(headless_mode, lean)
         elif browser == "edge":
-            return factory._create_edge_driver(headless_mode)
+            return factory._create_edge_driver(headless_mode, lean)
         else:
             factory.logger.error(f"Unsupported browser: {browser}")
             raise ValueError(f"Unsupported browser: {browser}")
     
-    def _create_chrome_driver(self, headless=False):
+    @classmethod
+    def get_browser_classes(cls, browser):
+        """Import a browser's WebDriver, Service and Options classes on first use"""
+        if browser not in cls._browser_classes:
+            package = cls.BROWSERS[browser]
+            cls._browser_classes[browser] = (
+                importlib.import_module(f"{package}.webdriver").WebDriver,
+                importlib.import_module(f"{package}.service").Service,
+                importlib.import_module(f"{package}.options").Options,
+            )
+        return cls._browser_classes[browser]
+    
+    def _create_chrome_driver(self, headless=False, lean=False):
         """Create Chrome WebDriver instance"""
-        options = ChromeOptions()
+        driver_class, service_class, options_class = self.get_browser_classes("chrome")
+        options = options_class()
         
         if headless:
             options.add_argument("--headless=new")
@@ -64,90 +122,34 @@ class DriverFactory:
         options.add_argument("--disable-blink-features=AutomationControlled")
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
+        # Keep console messages readable through get_log("browser") for failure bundles
+        options.set_capability("goog:loggingPrefs", {"browser": "ALL"})
+        if lean:
+            self._apply_lean_chromium_options(options)
         
-        # Try multiple approaches to create Chrome driver
-        driver = None
-        
-        # Attempt 1: ChromeDriverManager
-        try:
-            self.logger.info("Attempting to create Chrome driver using ChromeDriverManager")
-            service = ChromeService(ChromeDriverManager(version="latest").install())
-            driver = webdriver.Chrome(service=service, options=options)
-            self.logger.info("Chrome driver created successfully using ChromeDriverManager")
-        except Exception as e:
-            self.logger.warning(f"ChromeDriverManager failed: {e}")
-            
-            # Attempt 2: System ChromeDriver
-            try:
-                self.logger.info("Attempting to create Chrome driver using system ChromeDriver")
-                driver = webdriver.Chrome(options=options)
-                self.logger.info("Chrome driver created successfully using system ChromeDriver")
-            except Exception as e2:
-                self.logger.warning(f"System ChromeDriver failed: {e2}")
-                
-                # Attempt 3: Last resort - try without service
-                try:
-                    self.logger.info("Attempting to create Chrome driver without service")
-                    driver = webdriver.Chrome(options=options)
-                    self.logger.info("Chrome driver created successfully without service")
-                except Exception as e3:
-                    self.logger.error(f"All Chrome driver creation attempts failed: {e3}")
-                    raise RuntimeError(f"Failed to create Chrome driver after all attempts: {e3}")
-        
-        # Set timeouts
-        driver.implicitly_wait(TestConfig.IMPLICIT_WAIT)
-        driver.set_page_load_timeout(TestConfig.PAGE_LOAD_TIMEOUT)
-        
-        return driver
+        return self._start_driver("chrome", driver_class, service_class, options, lean)
     
-    def _create_firefox_driver(self, headless=False):
+    def _create_firefox_driver(self, headless=False, lean=False):
         """Create Firefox WebDriver instance"""
-        options = FirefoxOptions()
+        driver_class, service_class, options_class = self.get_browser_classes("firefox")
+        options = options_class()
         
         if headless:
             options.add_argument("--headless")
         
         options.add_argument("--width=1920")
         options.add_argument("--height=1080")
+        if lean:
+            for name, value in self.LEAN_FIREFOX_PREFERENCES.items():
+                options.set_preference(name, value)
+            options.page_load_strategy = "eager"
         
-        # Try multiple approaches to create Firefox driver
-        driver = None
-        
-        # Attempt 1: GeckoDriverManager
-        try:
-            self.logger.info("Attempting to create Firefox driver using GeckoDriverManager")
-            service = FirefoxService(GeckoDriverManager(version="latest").install())
-            driver = webdriver.Firefox(service=service, options=options)
-            self.logger.info("Firefox driver created successfully using GeckoDriverManager")
-        except Exception as e:
-            self.logger.warning(f"GeckoDriverManager failed: {e}")
-            
-            # Attempt 2: System GeckoDriver
-            try:
-                self.logger.info("Attempting to create Firefox driver using system GeckoDriver")
-                driver = webdriver.Firefox(options=options)
-                self.logger.info("Firefox driver created successfully using system GeckoDriver")
-            except Exception as e2:
-                self.logger.warning(f"System GeckoDriver failed: {e2}")
-                
-                # Attempt 3: Last resort - try without service
-                try:
-                    self.logger.info("Attempting to create Firefox driver without service")
-                    driver = webdriver.Firefox(options=options)
-                    self.logger.info("Firefox driver created successfully without service")
-                except Exception as e3:
-                    self.logger.error(f"All Firefox driver creation attempts failed: {e3}")
-                    raise RuntimeError(f"Failed to create Firefox driver after all attempts: {e3}")
-        
-        # Set timeouts
-        driver.implicitly_wait(TestConfig.IMPLICIT_WAIT)
-        driver.set_page_load_timeout(TestConfig.PAGE_LOAD_TIMEOUT)
-        
-        return driver
+        return self._start_driver("firefox", driver_class, service_class, options, lean)
     
-    def _create_edge_driver(self, headless=False):
+    def _create_edge_driver(self, headless=False, lean=False):
         """Create Edge WebDriver instance"""
-        options = EdgeOptions()
+        driver_class, service_class, options_class = self.get_browser_classes("edge")
+        options = options_class()
         
         if headless:
             options.add_argument("--headless")
@@ -155,38 +157,62 @@ class DriverFactory:
         options.add_argument("--no-sandbox")
         options.add_argument("--disable-dev-shm-usage")
         options.add_argument("--window-size=1920,1080")
+        options.set_capability("ms:loggingPrefs", {"browser": "ALL"})
+        if lean:
+            self._apply_lean_chromium_options(options)
         
-        # Try multiple approaches to create Edge driver
+        return self._start_driver("edge", driver_class, service_class, options, lean)
+    
+    def _apply_lean_chromium_options(self, options):
+        """Turn off images, background services and first-run machinery; return at DOMContentLoaded"""
+        for argument in self.LEAN_CHROMIUM_ARGUMENTS:
+            options.add_argument(argument)
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+            "profile.default_content_setting_values.media_stream": 2,
+        })
+        # Page objects wait for the elements they use, so the load event is not needed
+        options.page_load_strategy = "eager"
+    
+    def _block_lean_urls(self, browser, driver):
+        """Block fonts, media and analytics that prefs cannot turn off (Chromium only)"""
+        if not hasattr(driver, "execute_cdp_cmd"):
+            return
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.LEAN_BLOCKED_URLS})
+        except WebDriverException as e:
+            self.logger.warning(f"Could not block resources in lean {browser} session: {e}")
+    
+    def _start_driver(self, browser, driver_class, service_class, options, lean=False):
+        """Start a driver using the cached binary, falling back to Selenium Manager"""
+        driver_path = DriverBinaryResolver.resolve(browser)
         driver = None
         
-        # Attempt 1: EdgeChromiumDriverManager
-        try:
-            self.logger.info("Attempting to create Edge driver using EdgeChromiumDriverManager")
-            service = EdgeService(EdgeChromiumDriverManager(version="latest").install())
-            driver = webdriver.Edge(service=service, options=options)
-            self.logger.info("Edge driver created successfully using EdgeChromiumDriverManager")
-        except Exception as e:
-            self.logger.warning(f"EdgeChromiumDriverManager failed: {e}")
-            
-            # Attempt 2: System EdgeDriver
+        if driver_path:
+            try:
+                driver = driver_class(service=service_class(driver_path), options=options)
+                self.logger.info(f"{browser} driver created using cached binary")
+            except Exception as e:
+                self.logger.warning(f"Cached {browser} driver binary failed to start: {e}")
+                DriverBinaryResolver.invalidate(browser)
+        
+        if driver is None:
             try:
-                self.logger.info("Attempting to create Edge driver using system EdgeDriver")
-                driver = webdriver.Edge(options=options)
-                self.logger.info("Edge driver created successfully using system EdgeDriver")
-            except Exception as e2:
-                self.logger.warning(f"System EdgeDriver failed: {e2}")
-                
-                # Attempt 3: Last resort - try without service
-                try:
-                    self.logger.info("Attempting to create Edge driver without service")
-                    driver = webdriver.Edge(options=options)
-                    self.logger.info("Edge driver created successfully without service")
-                except Exception as e3:
-                    self.logger.error(f"All Edge driver creation attempts failed: {e3}")
-                    raise RuntimeError(f"Failed to create Edge driver after all attempts: {e3}")
+                driver = driver_class(options=options)
+                self.logger.info(f"{browser} driver created using Selenium Manager / system driver")
+            except Exception as e:
+                self.logger.error(f"All {browser} driver creation attempts failed: {e}")
+                raise RuntimeError(f"Failed to create {browser} driver after all attempts: {e}")
         
         # Set timeouts
         driver.implicitly_wait(TestConfig.IMPLICIT_WAIT)
         driver.set_page_load_timeout(TestConfig.PAGE_LOAD_TIMEOUT)
+        if lean:
+            self._block_lean_urls(browser, driver)
+        
+        if TestConfig.COMMAND_METRICS:
+            CommandRecorder.install(driver)
         
-        return driver 
\ No newline at end of file
+        return driver
\ No newline at end of file
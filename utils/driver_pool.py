@@ -0,0 +1,225 @@
+import threading
+from selenium.common.exceptions import WebDriverException
+from config.config import TestConfig
+from utils.driver_factory import DriverFactory
+from utils.logger import Logger
+
+# psutil is optional: without it memory is read from /proc/meminfo (Linux only)
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+
+class DriverPool:
+    """Per-process pool of reusable WebDriver sessions
+    
+    Each pytest-xdist worker is its own process, so a pool created once per
+    session gives every worker its own small set of browsers. Sessions are
+    cleaned between tests instead of being quit and relaunched.
+    
+    When no idle session is left (first test, crashed or recycled session)
+    a pre-warmed spare is handed out if one is ready, and a replacement
+    spare is launched on a background thread. Spares are not launched while
+    system memory use is above DRIVER_SPARE_MEMORY_CEILING percent.
+    """
+    
+    RESET_STORAGE_SCRIPT = """
+        try { window.localStorage && window.localStorage.clear(); } catch (e) {}
+        try { window.sessionStorage && window.sessionStorage.clear(); } catch (e) {}
+    """
+    
+    def __init__(self, browser_name=None, headless=None, size=None, max_reuse=None, spares=None, profile=None):
+        self.logger = Logger().get_logger()
+        self.browser_name = browser_name
+        self.headless = headless
+        self.profile = profile
+        self.size = size if size is not None else TestConfig.DRIVER_POOL_SIZE
+        self.max_reuse = max_reuse if max_reuse is not None else TestConfig.DRIVER_MAX_REUSE
+        self.spares = spares if spares is not None else TestConfig.DRIVER_SPARES
+        self.launches = 0
+        self.spares_used = 0
+        self._idle = []
+        self._ready = []
+        self._warming = []
+        self._uses = {}
+        self._closed = False
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Get a clean, healthy driver from the pool, a spare or a new launch"""
+        while True:
+            with self._lock:
+                driver = self._idle.pop() if self._idle else None
+            if driver is None:
+                driver = self._take_spare() or self._launch()
+                self._prewarm()
+                return driver
+            if self._is_healthy(driver):
+                return driver
+            self.logger.warning("Discarding unhealthy pooled driver session")
+            self._discard(driver)
+    
+    def release(self, driver):
+        """Return a driver to the pool after cleaning its state"""
+        uses = self._uses.get(id(driver), 0) + 1
+        self._uses[id(driver)] = uses
+        
+        if uses >= self.max_reuse:
+            self.logger.info(f"Recycling driver after {uses} uses")
+            self._discard(driver)
+            return
+        
+        if not self._reset(driver):
+            self.logger.warning("Driver reset failed, discarding session")
+            self._discard(driver)
+            return
+        
+        with self._lock:
+            if len(self._idle) < self.size:
+                self._idle.append(driver)
+                return
+        self._discard(driver)
+    
+    def shutdown(self):
+        """Quit every idle and spare driver held by the pool"""
+        with self._lock:
+            self._closed = True
+            drivers, self._idle, self._ready = self._idle + self._ready, [], []
+            warming = list(self._warming)
+        for driver in drivers:
+            self._discard(driver)
+        # Spares still launching quit themselves once they are up
+        for thread in warming:
+            thread.join(TestConfig.PAGE_LOAD_TIMEOUT)
+        self.logger.info(f"Driver pool shut down after {self.launches} browser launch(es), "
+                         f"{self.spares_used} served from pre-warmed spares")
+    
+    def _launch(self):
+        """Launch a fresh browser session"""
+        driver = DriverFactory.get_driver(self.browser_name, self.headless, self.profile)
+        with self._lock:
+            self.launches += 1
+            self._uses[id(driver)] = 0
+        return driver
+    
+    def _take_spare(self):
+        """Get a ready spare browser, or None if none is ready"""
+        while True:
+            with self._lock:
+                driver = self._ready.pop() if self._ready else None
+            if driver is None:
+                return None
+            if self._is_healthy(driver):
+                with self._lock:
+                    self.spares_used += 1
+                return driver
+            self.logger.warning("Discarding unhealthy spare driver session")
+            self._discard(driver)
+    
+    def _prewarm(self):
+        """Start launching spares in the background until `spares` are ready or launching"""
+        with self._lock:
+            missing = self.spares - len(self._ready) - len(self._warming)
+            if self._closed or missing <= 0:
+                return
+            memory_used = self._get_memory_used_percent()
+            if memory_used is not None and memory_used > TestConfig.DRIVER_SPARE_MEMORY_CEILING:
+                self.logger.info(f"Not pre-warming a spare browser: memory use {memory_used:.0f}% is above "
+                                 f"{TestConfig.DRIVER_SPARE_MEMORY_CEILING}%")
+                return
+            for _ in range(missing):
+                thread = threading.Thread(target=self._launch_spare, name="driver-prewarm", daemon=True)
+                self._warming.append(thread)
+                thread.start()
+    
+    def _launch_spare(self):
+        """Launch one spare browser on a background thread"""
+        try:
+            driver = self._launch()
+        except Exception as e:
+            self.logger.warning(f"Failed to pre-warm a spare browser: {e}")
+            driver = None
+        with self._lock:
+            self._warming.remove(threading.current_thread())
+            if driver is not None and not self._closed:
+                self._ready.append(driver)
+                return
+        if driver is not None:
+            self._discard(driver)
+    
+    @staticmethod
+    def _get_memory_used_percent():
+        """Get the system memory in use as a percentage, or None if it cannot be read"""
+        if PSUTIL_AVAILABLE:
+            return psutil.virtual_memory().percent
+        try:
+            with open("/proc/meminfo", encoding="utf-8") as f:
+                meminfo = dict(line.split(":", 1) for line in f)
+            total = int(meminfo["MemTotal"].split()[0])
+            available = int(meminfo["MemAvailable"].split()[0])
+            return 100.0 * (total - available) / total
+        except (OSError, KeyError, ValueError):
+            return None
+    
+    def _discard(self, driver):
+        """Quit a driver, ignoring errors from already dead sessions"""
+        self._uses.pop(id(driver), None)
+        try:
+            driver.quit()
+        except WebDriverException as e:
+            self.logger.debug(f"Ignoring error while quitting driver: {e}")
+    
+    def _is_healthy(self, driver):
+        """Check that the browser session still answers commands"""
+        try:
+            return driver.execute_script("return 1;") == 1
+        except WebDriverException:
+            return False
+    
+    def _reset(self, driver):
+        """Clear cookies, storage and extra windows, then load a blank page"""
+        try:
+            handles = driver.window_handles
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(handles[0])
+            
+            driver.execute_script(self.RESET_STORAGE_SCRIPT)
+            if hasattr(driver, "execute_cdp_cmd"):
+                # Chromium can drop cookies for every domain in one call
+                driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            driver.delete_all_cookies()
+            
+            driver.get("about:blank")
+            driver.set_window_size(TestConfig.WINDOW_WIDTH, TestConfig.WINDOW_HEIGHT)
+            return True
+        except WebDriverException as e:
+            self.logger.warning(f"Failed to reset driver state: {e}")
+            return False
+
+
+class DriverPools:
+    """One DriverPool per browser and profile, created when a test first needs that combination"""
+    
+    def __init__(self, headless=None):
+        self.headless = headless
+        self._pools = {}
+        self._lock = threading.Lock()
+    
+    def get(self, browser_name=None, profile=None):
+        """Get the pool of a browser (default: BROWSER) and profile (default: BROWSER_PROFILE)"""
+        key = (browser_name or TestConfig.BROWSER, profile or TestConfig.BROWSER_PROFILE)
+        with self._lock:
+            if key not in self._pools:
+                self._pools[key] = DriverPool(key[0], self.headless, profile=key[1])
+            return self._pools[key]
+    
+    def shutdown(self):
+        """Shut down every browser's pool"""
+        with self._lock:
+            pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            pool.shutdown()
@@ -0,0 +1,265 @@
+import importlib
+import json
+import os
+import time
+from pathlib import Path
+from config.config import TestConfig
+from utils.logger import Logger
+from utils.path_manager import PathManager
+
+# psutil is optional: without it lock owners are checked with os.kill (POSIX only)
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+
+class DriverBinaryResolver:
+    """Resolve WebDriver binary paths from a local cache before touching the network
+    
+    Resolution order for a browser:
+        1. Path already resolved by this process
+        2. Explicit override (CHROMEDRIVER_PATH, GECKODRIVER_PATH, EDGEDRIVER_PATH)
+        3. Pinned manifest (TestConfig.DRIVER_MANIFEST)
+        4. Shared on-disk manifest in .cache/ written by an earlier run or worker
+        5. webdriver-manager download, guarded by a lock file so only one
+           xdist worker hits the network
+        6. An expired manifest entry whose binary is still on disk, when the
+           download fails, times out on the lock or is disabled (DRIVER_OFFLINE)
+    A downloaded entry records the browser and driver versions. It stays valid
+    while the installed browser version matches, and for
+    DRIVER_CACHE_TTL_HOURS when the browser version cannot be read.
+    When nothing resolves, None is returned and Selenium Manager / PATH is used.
+    """
+    
+    MANAGERS = {
+        "chrome": ("webdriver_manager.chrome", "ChromeDriverManager"),
+        "firefox": ("webdriver_manager.firefox", "GeckoDriverManager"),
+        "edge": ("webdriver_manager.microsoft", "EdgeChromiumDriverManager"),
+    }
+    
+    ENV_OVERRIDES = {
+        "chrome": "CHROMEDRIVER_PATH",
+        "firefox": "GECKODRIVER_PATH",
+        "edge": "EDGEDRIVER_PATH",
+    }
+    
+    LOCK_TIMEOUT = 120
+    
+    _resolved = {}
+    _browser_versions = {}
+    
+    @classmethod
+    def resolve(cls, browser):
+        """
+        Return a local driver binary path for the browser
+        
+        Args:
+            browser (str): Browser name (chrome, firefox, edge)
+        
+        Returns:
+            str: Path to the driver binary, or None to let Selenium locate it
+        """
+        logger = Logger().get_logger()
+        
+        if browser in cls._resolved:
+            return cls._resolved[browser]
+        
+        path = cls._from_env(browser) or cls._from_manifest(cls.get_pinned_manifest_path(), browser, pinned=True)
+        if not path:
+            path = cls._from_manifest(cls.get_manifest_path(), browser)
+        
+        if not path and not TestConfig.DRIVER_OFFLINE:
+            try:
+                with _LockFile(cls.get_manifest_path().with_suffix(".lock"), cls.LOCK_TIMEOUT):
+                    # Another worker may have finished the download while we waited
+                    path = cls._from_manifest(cls.get_manifest_path(), browser)
+                    if not path:
+                        path = cls._download(browser)
+            except TimeoutError as e:
+                logger.warning(f"Skipping the {browser} driver download: {e}")
+        
+        if not path:
+            # An outdated binary beats none: Selenium Manager would hit the network as well
+            path = cls._from_manifest(cls.get_manifest_path(), browser, expired_ok=True)
+        
+        if path:
+            logger.info(f"Using cached {browser} driver binary: {path}")
+        else:
+            logger.info(f"No cached {browser} driver binary, deferring to Selenium Manager")
+        cls._resolved[browser] = path
+        return path
+    
+    @classmethod
+    def invalidate(cls, browser):
+        """Forget a resolved path, e.g. after the binary failed to start"""
+        cls._resolved.pop(browser, None)
+        manifest_path = cls.get_manifest_path()
+        try:
+            with _LockFile(manifest_path.with_suffix(".lock"), cls.LOCK_TIMEOUT):
+                manifest = cls._read_manifest(manifest_path)
+                if manifest.pop(browser, None) is not None:
+                    cls._write_manifest(manifest_path, manifest)
+        except TimeoutError as e:
+            Logger().get_logger().warning(f"Could not remove the {browser} driver from the manifest: {e}")
+    
+    @classmethod
+    def get_manifest_path(cls):
+        """Get the shared on-disk driver manifest path"""
+        return PathManager.ensure_directory_exists(PathManager.get_cache_path() / "drivers") / "manifest.json"
+    
+    @classmethod
+    def get_pinned_manifest_path(cls):
+        """Get the pinned manifest path configured through DRIVER_MANIFEST"""
+        if not TestConfig.DRIVER_MANIFEST:
+            return None
+        path = Path(TestConfig.DRIVER_MANIFEST)
+        return path if path.is_absolute() else PathManager.get_project_root() / path
+    
+    @classmethod
+    def _from_env(cls, browser):
+        """Get the driver path from an environment override"""
+        path = os.getenv(cls.ENV_OVERRIDES.get(browser, ""), "")
+        return path if path and os.path.isfile(path) else None
+    
+    @classmethod
+    def _from_manifest(cls, manifest_path, browser, pinned=False, expired_ok=False):
+        """Get a still valid driver path from a manifest (any path still on disk with expired_ok)"""
+        if manifest_path is None:
+            return None
+        entry = cls._read_manifest(manifest_path).get(browser)
+        if not entry or not os.path.isfile(entry.get("path", "")):
+            return None
+        if pinned or entry.get("pinned") or expired_ok:
+            return entry["path"]
+        browser_version = cls._get_browser_version(browser) if entry.get("browser_version") else None
+        if browser_version:
+            # The driver matches the browser it was downloaded for until the browser updates
+            return entry["path"] if browser_version == entry["browser_version"] else None
+        age_hours = (time.time() - entry.get("resolved_at", 0)) / 3600
+        return entry["path"] if age_hours < TestConfig.DRIVER_CACHE_TTL_HOURS else None
+    
+    @classmethod
+    def _download(cls, browser):
+        """Resolve the binary through webdriver-manager and record it in the manifest"""
+        logger = Logger().get_logger()
+        module_name, class_name = cls.MANAGERS[browser]
+        try:
+            manager = getattr(importlib.import_module(module_name), class_name)()
+            path = manager.install()
+        except Exception as e:
+            logger.warning(f"{class_name} could not resolve a driver binary: {e}")
+            return None
+        
+        manifest_path = cls.get_manifest_path()
+        manifest = cls._read_manifest(manifest_path)
+        manifest[browser] = {
+            "path": path,
+            "resolved_at": time.time(),
+            "pinned": False,
+            "browser_version": cls._get_browser_version(browser, manager),
+            # webdriver-manager installs into .../<driver name>/<os>/<driver version>/
+            "driver_version": Path(path).parent.name,
+        }
+        cls._write_manifest(manifest_path, manifest)
+        return path
+    
+    @classmethod
+    def _get_browser_version(cls, browser, manager=None):
+        """Get the installed browser version as webdriver-manager detects it (memoised, None when unknown)"""
+        if browser not in cls._browser_versions:
+            module_name, class_name = cls.MANAGERS[browser]
+            try:
+                if manager is None:
+                    manager = getattr(importlib.import_module(module_name), class_name)()
+                cls._browser_versions[browser] = manager.driver.get_browser_version_from_os() or None
+            except Exception:
+                cls._browser_versions[browser] = None
+        return cls._browser_versions[browser]
+    
+    @staticmethod
+    def _read_manifest(manifest_path):
+        """Read a manifest file, treating a missing or corrupt file as empty"""
+        try:
+            with open(manifest_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    @staticmethod
+    def _write_manifest(manifest_path, manifest):
+        """Atomically replace the manifest file"""
+        tmp_path = manifest_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2)
+        os.replace(tmp_path, manifest_path)
+
+
+class _LockFile:
+    """Cross-process lock based on exclusive creation of a lock file holding the owner's PID
+    
+    A lock is only taken over when its owner process is gone. Waiting longer
+    than the timeout raises TimeoutError and leaves the lock to its owner.
+    """
+    
+    def __init__(self, path, timeout, poll_interval=0.1):
+        self.path = str(path)
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+    
+    def __enter__(self):
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(fd, str(os.getpid()).encode())
+                os.close(fd)
+                return self
+            except FileExistsError:
+                if self._is_abandoned():
+                    self._remove()
+                    continue
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"lock {self.path} still held after {self.timeout}s")
+                time.sleep(self.poll_interval)
+    
+    def __exit__(self, exc_type, exc, tb):
+        self._remove()
+    
+    def _is_abandoned(self):
+        """Check whether the process that created the lock has exited"""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                pid = int(f.read().strip())
+        except ValueError:
+            # Owner died between creating the file and writing its PID
+            try:
+                return time.time() - os.path.getmtime(self.path) > self.timeout
+            except OSError:
+                return False
+        except OSError:
+            return False
+        return not self._pid_exists(pid)
+    
+    @staticmethod
+    def _pid_exists(pid):
+        """Check whether a process is running"""
+        if PSUTIL_AVAILABLE:
+            return psutil.pid_exists(pid)
+        if os.name == "nt":
+            # os.kill would terminate the process on Windows: assume the owner is alive
+            return True
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            return False
+        except OSError:
+            return True
+        return True
+    
+    def _remove(self):
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
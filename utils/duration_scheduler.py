@@ -0,0 +1,43 @@
+"""xdist scheduler that deals tests out longest first (imported only when xdist runs)"""
+
+from xdist.scheduler import LoadScheduling
+
+
+class DurationScheduling(LoadScheduling):
+    """Longest-processing-time-first variant of xdist's load scheduling
+    
+    Workers already hold the collection sorted longest first. Instead of
+    handing each worker a consecutive block of that order, which would put
+    all slow e2e flows on the first worker, the tests are dealt out one at a
+    time and refilled one at a time as workers finish.
+    """
+    
+    def __init__(self, config, log=None, plugin=None):
+        super().__init__(config, log)
+        # A worker keeps at most two tests queued, so it always picks up the next longest one
+        self.maxschedchunk = 1
+        self.plugin = plugin
+    
+    def schedule(self):
+        """Initial distribution: one test per worker per round, longest first"""
+        assert self.collection_is_completed
+        if self.collection is not None or not self._check_nodes_have_same_collection():
+            return super().schedule()
+        
+        self.collection = next(iter(self.node2collection.values()))
+        self.pending[:] = range(len(self.collection))
+        if not self.collection:
+            return
+        
+        if self.plugin is not None:
+            self.plugin.workers = len(self.nodes)
+            self.plugin.predicted = self.plugin.store.predict_makespan(self.collection, len(self.nodes))
+        
+        # xdist workers need the next test queued to finish the current one, so deal two rounds
+        for _ in range(2):
+            for node in self.nodes:
+                self._send_tests(node, 1)
+        
+        if not self.pending:
+            for node in self.nodes:
+                node.shutdown()
@@ -0,0 +1,156 @@
+"""Historical test durations and the longest-first scheduling built on them"""
+
+import heapq
+import json
+import os
+import statistics
+import time
+import pytest
+from utils.path_manager import PathManager
+
+
+class DurationStore:
+    """Per-test durations from earlier runs, kept in .cache/durations.json
+    
+    Each entry holds an exponentially smoothed duration (setup + call +
+    teardown) so one slow outlier does not reorder the whole suite.
+    """
+    
+    # Weight of the latest run in the smoothed duration
+    SMOOTHING = 0.5
+    
+    # Estimate for tests that have never run, used until one is recorded
+    DEFAULT_DURATION = 5.0
+    
+    def __init__(self, path=None):
+        self.path = path or PathManager.get_cache_path() / "durations.json"
+        self.durations = self._read()
+    
+    def get(self, nodeid):
+        """Get the recorded duration of a test in seconds, or None"""
+        entry = self.durations.get(nodeid)
+        return entry["duration"] if entry else None
+    
+    def estimate(self, nodeid):
+        """Get the expected duration of a test, falling back to the median of known tests"""
+        duration = self.get(nodeid)
+        if duration is not None:
+            return duration
+        if self.durations:
+            return statistics.median(entry["duration"] for entry in self.durations.values())
+        return self.DEFAULT_DURATION
+    
+    def record(self, nodeid, seconds):
+        """Fold a new measurement into the smoothed duration of a test"""
+        entry = self.durations.get(nodeid)
+        if entry is None:
+            self.durations[nodeid] = {"duration": seconds, "last": seconds, "runs": 1}
+            return
+        entry["duration"] = self.SMOOTHING * seconds + (1 - self.SMOOTHING) * entry["duration"]
+        entry["last"] = seconds
+        entry["runs"] += 1
+    
+    def order(self, nodeids):
+        """Sort node ids longest first (ties keep their collection order)"""
+        return sorted(nodeids, key=lambda nodeid: -self.estimate(nodeid))
+    
+    def predict_makespan(self, nodeids, workers):
+        """Predict the wall time of running the tests longest-first on a number of workers"""
+        finish_times = [0.0] * max(1, workers)
+        for nodeid in self.order(nodeids):
+            # The next test goes to whichever worker becomes free first
+            heapq.heapreplace(finish_times, finish_times[0] + self.estimate(nodeid))
+        return max(finish_times)
+    
+    def save(self):
+        """Atomically write the store"""
+        PathManager.ensure_directory_exists(self.path.parent)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.durations, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+    
+    def _read(self):
+        """Read the store, treating a missing or corrupt file as empty"""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+
+class DurationSchedulingPlugin:
+    """Records test durations and runs xdist workers longest-processing-time first
+    
+    Durations are recorded by the process that sees every report (the xdist
+    controller, or the only process without xdist). Workers sort their
+    collection longest first and the controller deals the tests out one at a
+    time, so expensive e2e flows start first and quick checks fill the gaps.
+    """
+    
+    def __init__(self, config):
+        self.config = config
+        self.store = DurationStore()
+        self.is_worker = hasattr(config, "workerinput")
+        self.run_durations = {}
+        self.worker_busy = {}
+        self.predicted = None
+        self.workers = 1
+        self.started = time.perf_counter()
+    
+    @staticmethod
+    def is_parallel(config):
+        """Check whether this run distributes tests over more than one xdist worker"""
+        if hasattr(config, "workerinput"):
+            return config.workerinput.get("workercount", 1) > 1
+        # xdist turns -n N / -n auto into N "popen" gateways before pytest_configure
+        tx = config.getoption("tx", None) or []
+        return config.getoption("dist", "no") != "no" and len(tx) > 1
+    
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_make_scheduler(self, config, log):
+        """Replace the default load scheduler with the longest-first one"""
+        if config.getoption("dist") != "load":
+            return None
+        from utils.duration_scheduler import DurationScheduling
+        return DurationScheduling(config, log, self)
+    
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, session, config, items):
+        """Order the collection longest first (identically on every worker)"""
+        if not self.is_worker:
+            if items:
+                self.predicted = self.store.predict_makespan([item.nodeid for item in items], 1)
+            return
+        estimates = {item.nodeid: self.store.estimate(item.nodeid) for item in items}
+        items.sort(key=lambda item: -estimates[item.nodeid])
+    
+    def pytest_runtest_logreport(self, report):
+        """Add up setup, call and teardown time per test"""
+        if self.is_worker or report.skipped:
+            return
+        self.run_durations[report.nodeid] = self.run_durations.get(report.nodeid, 0.0) + report.duration
+        node = getattr(report, "node", None)
+        worker_id = node.gateway.id if node is not None else "main"
+        self.worker_busy[worker_id] = self.worker_busy.get(worker_id, 0.0) + report.duration
+    
+    def pytest_sessionfinish(self, session, exitstatus):
+        """Store this run's durations for the next run"""
+        if self.is_worker or not self.run_durations:
+            return
+        for nodeid, seconds in self.run_durations.items():
+            self.store.record(nodeid, seconds)
+        self.store.save()
+    
+    def pytest_terminal_summary(self, terminalreporter):
+        """Report predicted versus actual makespan"""
+        if self.is_worker or self.predicted is None or not self.run_durations:
+            return
+        actual = time.perf_counter() - self.started
+        busiest = max(self.worker_busy.values()) if self.worker_busy else 0.0
+        terminalreporter.write_sep("-", "duration-aware scheduling")
+        terminalreporter.write_line(
+            f"{len(self.run_durations)} tests on {self.workers} worker(s): "
+            f"predicted makespan {self.predicted:.1f}s, actual {actual:.1f}s wall "
+            f"(busiest worker {busiest:.1f}s, total test time {sum(self.run_durations.values()):.1f}s)"
+        )
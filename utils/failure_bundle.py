@@ -0,0 +1,102 @@
+"""Everything needed to debug a failed test, captured from its browser into one zip"""
+
+import json
+import re
+import time
+import zipfile
+from .command_recorder import CommandRecorder
+from .path_manager import PathManager
+from .test_context import TestContext
+
+
+class FailureBundle:
+    """Writes reports/failures/<test>.zip when a test fails
+    
+    The bundle holds the screenshot, the serialized DOM, URL, title, cookies
+    and localStorage, the browser console log (Chrome/Edge) and the test's
+    most recent WebDriver commands from CommandRecorder. Each part is
+    captured on its own, so a dead browser still yields the parts that
+    could be read. Nothing runs for passing tests.
+    """
+    
+    STORAGE_SCRIPT = """
+        var storage = {};
+        try {
+            for (var i = 0; i < window.localStorage.length; i++) {
+                var key = window.localStorage.key(i);
+                storage[key] = window.localStorage.getItem(key);
+            }
+        } catch (e) {}
+        return storage;
+    """
+    
+    @classmethod
+    def get_failures_path(cls):
+        """Get the directory failure bundles are written to"""
+        return PathManager.get_reports_path() / "failures"
+    
+    @classmethod
+    def capture(cls, driver, nodeid, when, longrepr=None):
+        """
+        Capture the browser state of a failed test into a compressed bundle
+        
+        Args:
+            driver: WebDriver the test used
+            nodeid (str): Node id of the failed test
+            when (str): Phase that failed (setup, call, teardown)
+            longrepr (str): Failure text shown by pytest
+        
+        Returns:
+            Path: The written zip file
+        """
+        errors = {}
+        # Read before capturing, which sends commands of its own
+        files = {"commands.json": json.dumps(CommandRecorder.get_history(nodeid), indent=2).encode("utf-8")}
+        meta = {
+            "test": nodeid,
+            "when": when,
+            "worker": TestContext.get_worker_id(),
+            "captured_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        }
+        
+        png = cls._read(errors, "screenshot", driver.get_screenshot_as_png)
+        if png:
+            files["screenshot.png"] = png
+        dom = cls._read(errors, "dom", lambda: driver.page_source)
+        if dom is not None:
+            files["dom.html"] = dom.encode("utf-8")
+        meta["url"] = cls._read(errors, "url", lambda: driver.current_url)
+        meta["title"] = cls._read(errors, "title", lambda: driver.title)
+        meta["cookies"] = cls._read(errors, "cookies", driver.get_cookies)
+        meta["local_storage"] = cls._read(errors, "local_storage", lambda: driver.execute_script(cls.STORAGE_SCRIPT))
+        console = cls._read(errors, "console", lambda: driver.get_log("browser"))
+        if console is not None:
+            files["console.json"] = json.dumps(console, indent=2).encode("utf-8")
+        if longrepr:
+            files["failure.txt"] = str(longrepr).encode("utf-8")
+        meta["capture_errors"] = errors
+        files["meta.json"] = json.dumps(meta, indent=2, default=str).encode("utf-8")
+        
+        directory = PathManager.ensure_directory_exists(cls.get_failures_path())
+        filepath = directory / f"{cls._get_safe_name(nodeid)}{TestContext.get_worker_suffix()}_{int(time.time())}.zip"
+        with zipfile.ZipFile(filepath, "w", compression=zipfile.ZIP_DEFLATED) as bundle:
+            for name, data in files.items():
+                # The PNG is already compressed
+                compression = zipfile.ZIP_STORED if name.endswith(".png") else zipfile.ZIP_DEFLATED
+                bundle.writestr(name, data, compress_type=compression)
+        return filepath
+    
+    @staticmethod
+    def _read(errors, part, read):
+        """Read one part of the browser state, recording why it could not be read"""
+        try:
+            return read()
+        except Exception as e:  # A dead session fails in many ways (MaxRetryError, ConnectionRefusedError, ...)
+            errors[part] = str(e).splitlines()[0] if str(e) else type(e).__name__
+            return None
+    
+    @staticmethod
+    def _get_safe_name(nodeid):
+        """Turn a node id into a short file name"""
+        name = re.sub(r"[^A-Za-z0-9_.-]+", "_", nodeid.split("/")[-1]).strip("_")
+        return name[:120]
@@ -0,0 +1,96 @@
+"""Latency and fault injection in front of the local stand-in app"""
+
+import fnmatch
+import math
+import random
+import threading
+from config.config import TestConfig
+from config.latency_profiles import LatencyProfiles
+from .stats import Stats
+from .test_context import TestContext
+
+
+class FaultInjector:
+    """Decides, per request, how late a response is sent and whether it is sent at all
+    
+    Rules come from a LatencyProfiles profile. Sampling uses a private random
+    generator, seeded from TestConfig.LATENCY_SEED and the worker id when a
+    seed is set, so a run can be replayed exactly.
+    """
+    
+    PERCENTILE_SAMPLES = 5000
+    
+    def __init__(self, profile=None, seed=None):
+        self.profile = profile or TestConfig.LATENCY_PROFILE
+        self.rules = LatencyProfiles.get_profile(self.profile)
+        seed = TestConfig.LATENCY_SEED if seed is None else seed
+        self._random = random.Random(None if seed is None else f"{seed}:{TestContext.get_worker_id()}")
+        self._lock = threading.Lock()
+    
+    def plan(self, path, username=None):
+        """
+        Work out the faults for one request
+        
+        Args:
+            path (str): Request path, e.g. "/inventory.html"
+            username (str): User named by the session cookie, if any
+        
+        Returns:
+            dict: "delay" (seconds before responding) and "drop" (close without a response)
+        """
+        with self._lock:
+            return self._plan(path, username, self._random)
+    
+    def percentile(self, path, username=None, percentile=99):
+        """Estimate a percentile of the injected delay (seconds) for a route and user"""
+        rng = random.Random(0)
+        delays = sorted(self._plan(path, username, rng)["delay"] for _ in range(self.PERCENTILE_SAMPLES))
+        return Stats.percentile(delays, percentile)
+    
+    def get_wait_timeout(self, path, username=None, percentile=99):
+        """Timeout for waiting on a route: the usual explicit wait plus its injected tail latency"""
+        return TestConfig.EXPLICIT_WAIT + self.percentile(path, username, percentile)
+    
+    @classmethod
+    def get_route_timeout(cls, path, username=None, percentile=99):
+        """Timeout for a route under the configured profile; plain EXPLICIT_WAIT against the real site"""
+        if not TestConfig.LOCAL_APP:
+            return TestConfig.EXPLICIT_WAIT
+        return cls().get_wait_timeout(path, username, percentile)
+    
+    def _plan(self, path, username, rng):
+        """Combine every matching rule into a single plan"""
+        route = path.lstrip("/") or "index.html"
+        delay_ms = 0.0
+        drop = False
+        for rule in self.rules:
+            if not fnmatch.fnmatch(route, rule.get("route", "*")):
+                continue
+            if "users" in rule and username not in rule["users"]:
+                continue
+            if "delay" in rule:
+                delay_ms += self.sample(rule["delay"], rng)
+            if rule.get("jitter_ms"):
+                delay_ms += rng.uniform(-rule["jitter_ms"], rule["jitter_ms"])
+            slow_first_byte = rule.get("slow_first_byte")
+            if slow_first_byte and rng.random() < slow_first_byte["rate"]:
+                delay_ms += slow_first_byte["ms"]
+            if rule.get("drop_rate") and rng.random() < rule["drop_rate"]:
+                drop = True
+        return {"delay": max(0.0, delay_ms) / 1000, "drop": drop}
+    
+    @staticmethod
+    def sample(distribution, rng=random):
+        """Draw one delay in milliseconds from a distribution spec"""
+        kind = distribution["dist"]
+        if kind == "fixed":
+            return distribution["ms"]
+        if kind == "uniform":
+            return rng.uniform(distribution["min_ms"], distribution["max_ms"])
+        if kind == "normal":
+            return max(0.0, rng.gauss(distribution["mean_ms"], distribution["stddev_ms"]))
+        if kind == "lognormal":
+            return rng.lognormvariate(math.log(distribution["median_ms"]), distribution["sigma"])
+        if kind == "pareto":
+            return distribution["scale_ms"] * rng.paretovariate(distribution["alpha"])
+        raise ValueError(f"Unknown delay distribution: {kind}")
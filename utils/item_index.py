@@ -0,0 +1,110 @@
+from selenium.common.exceptions import StaleElementReferenceException
+
+
+class ItemIndex:
+    """Name -> element index for a listing, built with a single script call
+    
+    The index is tagged with a token stored on the page's window object. A
+    navigation replaces the window (dropping the token) and a MutationObserver
+    on the list container clears it when rows are added, removed or reordered,
+    so one cheap token check tells whether the cached elements are still valid.
+    """
+    
+    BUILD_SCRIPT = """
+        var key = arguments[0];
+        var list = document.querySelector(arguments[1]);
+        var items = document.querySelectorAll(arguments[2]);
+        var parts = arguments[3];
+        var index = {};
+        for (var i = 0; i < items.length; i++) {
+            var entry = {item: items[i], index: i};
+            for (var part in parts) {
+                entry[part] = items[i].querySelector(parts[part]);
+            }
+            if (entry.name) {
+                index[entry.name.innerText.trim()] = entry;
+            }
+        }
+        window.__itemIndexTokens = window.__itemIndexTokens || {};
+        window.__itemIndexObservers = window.__itemIndexObservers || {};
+        if (window.__itemIndexObservers[key]) {
+            window.__itemIndexObservers[key].disconnect();
+        }
+        if (list && window.MutationObserver) {
+            var observer = new MutationObserver(function () {
+                delete window.__itemIndexTokens[key];
+            });
+            observer.observe(list, {childList: true});
+            window.__itemIndexObservers[key] = observer;
+        }
+        var token = Date.now() + ":" + Math.random();
+        window.__itemIndexTokens[key] = token;
+        return {token: token, index: index};
+    """
+    
+    VALIDATE_SCRIPT = """
+        return !!window.__itemIndexTokens && window.__itemIndexTokens[arguments[0]] === arguments[1];
+    """
+    
+    def __init__(self, page, list_locator, item_locator, part_locators):
+        """
+        Args:
+            page (BasePage): Page object owning the listing
+            list_locator (tuple): Locator of the list container
+            item_locator (tuple): Locator of a single item row
+            part_locators (dict): Entry key -> locator inside the row; must contain "name"
+        """
+        self.page = page
+        self.list_locator = list_locator
+        self.item_locator = item_locator
+        self.part_locators = part_locators
+        self.key = page.to_css(item_locator)
+        self._token = None
+        self._index = {}
+    
+    def get(self, name):
+        """Get the entry (item row and its parts) for a name, or None"""
+        if not self._is_valid():
+            self._build()
+        return self._index.get(name)
+    
+    def names(self):
+        """Get the names currently in the index, in page order"""
+        if not self._is_valid():
+            self._build()
+        return sorted(self._index, key=lambda name: self._index[name]["index"])
+    
+    def apply(self, name, action, default=None):
+        """Run action(entry) for the named item, rebuilding once if its elements went stale"""
+        for attempt in range(2):
+            entry = self.get(name)
+            if entry is None:
+                return default
+            try:
+                return action(entry)
+            except StaleElementReferenceException:
+                if attempt:
+                    raise
+                self.invalidate()
+        return default
+    
+    def invalidate(self):
+        """Drop the cached index so the next lookup rebuilds it"""
+        self._token = None
+        self._index = {}
+    
+    def _is_valid(self):
+        """Check the page-side token in one round-trip"""
+        if self._token is None:
+            return False
+        return self.page.driver.execute_script(self.VALIDATE_SCRIPT, self.key, self._token)
+    
+    def _build(self):
+        """Build the index from the current DOM in one round-trip"""
+        self.page.find_element(self.list_locator)
+        parts = {part: self.page.to_css(locator) for part, locator in self.part_locators.items()}
+        result = self.page.driver.execute_script(
+            self.BUILD_SCRIPT, self.key, self.page.to_css(self.list_locator), self.key, parts
+        )
+        self._token = result["token"]
+        self._index = result["index"]
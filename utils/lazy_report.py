@@ -0,0 +1,294 @@
+"""Small HTML report index whose result pages and test details load on demand"""
+
+import base64
+import json
+import os
+import shutil
+import zipfile
+from pathlib import Path
+
+
+class LazyReportPlugin:
+    """Writes <name>.html plus a sibling <name>_files/ directory at the end of the run
+    
+    The index only embeds the summary and the viewer. Results are split into
+    pages of PAGE_SIZE rows per outcome (failures first), and each test's
+    failure text, captured output and extras are in their own file; both
+    are loaded as scripts when a page is shown or a row is expanded, which
+    also works from file://. Embedded images from pytest-html extras are
+    written out as files. The index stays a few KB however many tests ran.
+    """
+    
+    PAGE_SIZE = 200
+    OUTCOMES = ("failed", "error", "xpassed", "xfailed", "skipped", "passed")
+    IMAGE_EXTENSIONS = {"image": "png", "png": "png", "jpg": "jpg", "svg": "svg"}
+    
+    def __init__(self, config, path, archive=False):
+        self.config = config
+        self.path = Path(path).absolute()
+        self.files_dir = self.path.with_name(f"{self.path.stem}_files")
+        self.archive = archive
+        self.tests = {}
+        self.artifacts = []
+        html_path = config.getoption("htmlpath", None)
+        self.html_dir = Path(html_path).absolute().parent if html_path else None
+    
+    def pytest_runtest_logreport(self, report):
+        """Fold setup, call and teardown reports into one result per test"""
+        test = self.tests.setdefault(report.nodeid, {
+            "outcome": "passed", "duration": 0.0, "longrepr": [], "sections": [], "extras": []
+        })
+        test["duration"] += report.duration
+        outcome = self._get_outcome(report)
+        if self.OUTCOMES.index(outcome) < self.OUTCOMES.index(test["outcome"]):
+            test["outcome"] = outcome
+        if report.failed or report.skipped:
+            test["longrepr"].append(f"[{report.when}] {report.longreprtext}")
+        if report.when == "teardown":
+            test["sections"] = [[title, content] for title, content in report.sections if content]
+        test["extras"].extend(getattr(report, "extras", []))
+    
+    def pytest_sessionfinish(self, session, exitstatus):
+        """Write the index, the result pages and the per-test details"""
+        if not self.tests:
+            return
+        if self.files_dir.exists():
+            shutil.rmtree(self.files_dir)
+        (self.files_dir / "details").mkdir(parents=True)
+        
+        grouped = {outcome: [] for outcome in self.OUTCOMES}
+        for index, (nodeid, test) in enumerate(sorted(self.tests.items())):
+            has_detail = self._write_detail(index, test)
+            grouped[test["outcome"]].append([index, nodeid, round(test["duration"], 3), has_detail])
+        
+        pages = {}
+        for outcome, rows in grouped.items():
+            pages[outcome] = (len(rows) + self.PAGE_SIZE - 1) // self.PAGE_SIZE
+            for page in range(pages[outcome]):
+                chunk = rows[page * self.PAGE_SIZE:(page + 1) * self.PAGE_SIZE]
+                self._write_script(self.files_dir / f"{outcome}-{page}.js",
+                                   f"LAZY_REPORT.page({json.dumps(outcome)}, {page}, {json.dumps(chunk)});")
+        
+        summary = {
+            "title": self.path.stem,
+            "files": self.files_dir.name,
+            "counts": {outcome: len(rows) for outcome, rows in grouped.items() if rows},
+            "pages": {outcome: count for outcome, count in pages.items() if count},
+            "duration": round(sum(test["duration"] for test in self.tests.values()), 3),
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(INDEX_TEMPLATE.replace("__SUMMARY__", json.dumps(summary).replace("</", "<\\/")))
+        if self.archive:
+            self.write_archive()
+    
+    def pytest_terminal_summary(self, terminalreporter):
+        """Show where the report was written"""
+        if not self.tests:
+            return
+        terminalreporter.write_sep("-", f"lazy report: {self.path}")
+        if self.archive:
+            terminalreporter.write_line(f"archive: {self.path.with_suffix('.zip')}")
+    
+    def write_archive(self):
+        """Zip the index, its files and the artifacts it links to inside the report directory"""
+        root = self.path.parent
+        entries = [self.path] + sorted(path for path in self.files_dir.rglob("*") if path.is_file())
+        for artifact in self.artifacts:
+            target = (root / artifact).resolve()
+            if target.is_file() and root.resolve() in target.parents:
+                entries.append(target)
+        archive_path = self.path.with_suffix(".zip")
+        with zipfile.ZipFile(archive_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for entry in dict.fromkeys(entries):
+                archive.write(entry, os.path.relpath(entry.resolve(), root.resolve()))
+        return archive_path
+    
+    def _write_detail(self, index, test):
+        """Write the expandable part of a test row; return False if there is nothing to show"""
+        extras = [self._externalize(index, number, extra) for number, extra in enumerate(test["extras"])]
+        extras = [extra for extra in extras if extra]
+        if not (test["longrepr"] or test["sections"] or extras):
+            return False
+        detail = {"longrepr": "\n\n".join(test["longrepr"]), "sections": test["sections"], "extras": extras}
+        self._write_script(self.files_dir / "details" / f"{index}.js",
+                           f"LAZY_REPORT.detail({index}, {json.dumps(detail)});")
+        return True
+    
+    def _externalize(self, index, number, extra):
+        """Turn a pytest-html extra into a link or image path relative to the index"""
+        format_type = extra.get("format_type")
+        content = extra.get("content") or ""
+        name = extra.get("name") or format_type
+        if format_type in self.IMAGE_EXTENSIONS and not self._is_external(content) and len(content) > 260:
+            # Embedded base64 image: store it next to the index instead
+            filename = f"{index}-{number}.{self.IMAGE_EXTENSIONS[format_type]}"
+            with open(self.files_dir / "details" / filename, "wb") as f:
+                f.write(base64.b64decode(content))
+            return {"name": name, "format_type": "image", "content": f"{self.files_dir.name}/details/{filename}"}
+        if format_type not in ("url", "image", "png", "jpg", "svg", "video"):
+            return None
+        if not self._is_external(content) and self.html_dir is not None:
+            # pytest-html extras are relative to the HTML report, re-anchor them on the index
+            content = os.path.relpath(self.html_dir / content, self.path.parent).replace(os.sep, "/")
+        if not self._is_external(content):
+            self.artifacts.append(content)
+        return {"name": name, "format_type": "url" if format_type == "url" else "image", "content": content}
+    
+    @staticmethod
+    def _is_external(content):
+        """Check whether an extra points outside the file system tree (URL or data URI)"""
+        return "://" in content or content.startswith("data:")
+    
+    @staticmethod
+    def _get_outcome(report):
+        """Map one phase report to a test outcome"""
+        if hasattr(report, "wasxfail"):
+            return "xpassed" if report.passed else "xfailed"
+        if report.failed:
+            return "failed" if report.when == "call" else "error"
+        return "skipped" if report.skipped else "passed"
+    
+    @staticmethod
+    def _write_script(path, content):
+        """Write one JSONP file"""
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+
+
+INDEX_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>Test report</title>
+<style>
+body { font-family: Helvetica, Arial, sans-serif; font-size: 13px; margin: 20px; }
+table { border-collapse: collapse; width: 100%; }
+td, th { border: 1px solid #e6e6e6; padding: 4px 10px; text-align: left; vertical-align: top; }
+tr.row.expandable { cursor: pointer; }
+tr.row.expandable td:nth-child(2)::before { content: "\\25B8  "; color: #888; }
+td.failed, td.error { color: #d00; font-weight: bold; }
+td.passed, td.xpassed { color: #080; }
+td.skipped, td.xfailed { color: #888; }
+pre { white-space: pre-wrap; background: #f7f7f7; padding: 8px; margin: 4px 0; max-height: 400px; overflow: auto; }
+img { max-width: 640px; display: block; margin: 4px 0; }
+.tabs button, .pager button { margin: 0 4px 8px 0; }
+.tabs button.active { font-weight: bold; }
+</style>
+</head>
+<body>
+<h1 id="title"></h1>
+<p id="summary"></p>
+<div class="tabs" id="tabs"></div>
+<div class="pager" id="pager"></div>
+<table><thead><tr><th>Result</th><th>Test</th><th>Duration</th></tr></thead><tbody id="results"></tbody></table>
+<script>
+var LAZY_REPORT = (function () {
+    var summary = __SUMMARY__;
+    var pages = {}, details = {}, current = null, waiting = {};
+    
+    function el(tag, text, className) {
+        var node = document.createElement(tag);
+        if (text !== undefined && text !== null) { node.textContent = text; }
+        if (className) { node.className = className; }
+        return node;
+    }
+    function load(src) {
+        var script = document.createElement("script");
+        script.src = summary.files + "/" + src;
+        document.head.appendChild(script);
+    }
+    function show(outcome, page) {
+        current = [outcome, page];
+        var key = outcome + "-" + page;
+        if (pages[key]) { render(); } else { load(key + ".js"); }
+    }
+    function render() {
+        var outcome = current[0], page = current[1];
+        var tabs = document.getElementById("tabs");
+        tabs.innerHTML = "";
+        Object.keys(summary.counts).forEach(function (name) {
+            var button = el("button", name + " (" + summary.counts[name] + ")", name === outcome ? "active" : "");
+            button.onclick = function () { show(name, 0); };
+            tabs.appendChild(button);
+        });
+        var pager = document.getElementById("pager");
+        pager.innerHTML = "";
+        for (var i = 0; i < summary.pages[outcome] && summary.pages[outcome] > 1; i++) {
+            (function (index) {
+                var button = el("button", String(index + 1), index === page ? "active" : "");
+                button.disabled = index === page;
+                button.onclick = function () { show(outcome, index); };
+                pager.appendChild(button);
+            })(i);
+        }
+        var body = document.getElementById("results");
+        body.innerHTML = "";
+        pages[outcome + "-" + page].forEach(function (row) {
+            var tr = el("tr", null, "row" + (row[3] ? " expandable" : ""));
+            tr.appendChild(el("td", outcome, outcome));
+            tr.appendChild(el("td", row[1]));
+            tr.appendChild(el("td", row[2].toFixed(2) + "s"));
+            body.appendChild(tr);
+            if (row[3]) { tr.onclick = function () { toggle(tr, row[0]); }; }
+        });
+    }
+    function toggle(tr, id) {
+        var next = tr.nextSibling;
+        if (next && next.className === "detail") { tr.parentNode.removeChild(next); return; }
+        var detailRow = el("tr", null, "detail");
+        var cell = el("td", "Loading...");
+        cell.colSpan = 3;
+        detailRow.appendChild(cell);
+        tr.parentNode.insertBefore(detailRow, tr.nextSibling);
+        if (details[id]) { fill(cell, details[id]); return; }
+        waiting[id] = cell;
+        load("details/" + id + ".js");
+    }
+    function fill(cell, detail) {
+        cell.textContent = "";
+        detail.extras.forEach(function (extra) {
+            if (extra.format_type === "image") {
+                var image = el("img");
+                image.loading = "lazy";
+                image.src = extra.content;
+                image.alt = extra.name;
+                cell.appendChild(image);
+            } else {
+                var link = el("a", extra.name);
+                link.href = extra.content;
+                link.target = "_blank";
+                cell.appendChild(link);
+                cell.appendChild(el("br"));
+            }
+        });
+        if (detail.longrepr) { cell.appendChild(el("pre", detail.longrepr)); }
+        detail.sections.forEach(function (section) {
+            cell.appendChild(el("strong", section[0]));
+            cell.appendChild(el("pre", section[1]));
+        });
+    }
+    
+    document.getElementById("title").textContent = summary.title;
+    var total = Object.keys(summary.counts).reduce(function (sum, name) { return sum + summary.counts[name]; }, 0);
+    document.getElementById("summary").textContent = total + " tests, " + summary.duration.toFixed(1) + "s of test time";
+    return {
+        start: function () {
+            var first = Object.keys(summary.counts)[0];
+            if (first) { show(first, 0); }
+        },
+        page: function (outcome, index, rows) {
+            pages[outcome + "-" + index] = rows;
+            if (current && current[0] === outcome && current[1] === index) { render(); }
+        },
+        detail: function (id, detail) {
+            details[id] = detail;
+            if (waiting[id]) { fill(waiting[id], detail); delete waiting[id]; }
+        }
+    };
+})();
+LAZY_REPORT.start();
+</script>
+</body>
+</html>
+"""
@@ -0,0 +1,196 @@
+"""Concurrent headless browsers replaying the purchase journey through the page objects"""
+
+import threading
+import time
+from config.config import TestConfig
+from config.test_data import TestData
+from pages.login_page import LoginPage
+from pages.inventory_page import InventoryPage
+from pages.cart_page import CartPage
+from pages.checkout_page import CheckoutPage, CheckoutOverviewPage, CheckoutCompletePage
+from utils.driver_pool import DriverPool
+from utils.logger import Logger
+from utils.stats import Stats
+
+
+class PurchaseJourney:
+    """The test_complete_purchase_flow journey from tests/test_e2e.py, split into timed steps"""
+    
+    STEPS = ("login", "add_to_cart", "checkout", "finish")
+    
+    def __init__(self, driver, items=None, user=None, checkout_data=None):
+        self.items = items or ["Sauce Labs Backpack"]
+        self.user = user or TestData.get_user_credentials("valid")
+        self.checkout_data = checkout_data or TestData.get_checkout_data("valid")
+        self.login_page = LoginPage(driver)
+        self.inventory_page = InventoryPage(driver)
+        self.cart_page = CartPage(driver)
+        self.checkout_page = CheckoutPage(driver)
+        self.checkout_overview_page = CheckoutOverviewPage(driver)
+        self.checkout_complete_page = CheckoutCompletePage(driver)
+    
+    def login(self):
+        """Log in through the form and wait for the inventory"""
+        self.login_page.navigate_to_login_page()
+        self.login_page.wait_for_login_page_to_load()
+        self.login_page.login(self.user["username"], self.user["password"])
+        self.inventory_page.wait_for_inventory_page_to_load()
+        return self.inventory_page.get_inventory_items_count() > 0
+    
+    def add_to_cart(self):
+        """Add the journey's items and check the cart badge"""
+        added = all(self.inventory_page.add_item_to_cart_by_name(item) for item in self.items)
+        return added and self.inventory_page.get_cart_items_count() == len(self.items)
+    
+    def checkout(self):
+        """Open the cart, fill in the checkout form and reach the overview"""
+        self.inventory_page.click_shopping_cart()
+        self.cart_page.wait_for_cart_page_to_load()
+        self.cart_page.click_checkout()
+        self.checkout_page.wait_for_checkout_page_to_load()
+        self.checkout_page.fill_checkout_form(
+            self.checkout_data["first_name"],
+            self.checkout_data["last_name"],
+            self.checkout_data["postal_code"]
+        )
+        self.checkout_page.click_continue()
+        self.checkout_overview_page.wait_for_overview_page_to_load()
+        return self.checkout_overview_page.get_cart_items_count() == len(self.items)
+    
+    def finish(self):
+        """Place the order and wait for the confirmation"""
+        self.checkout_overview_page.click_finish()
+        self.checkout_complete_page.wait_for_complete_page_to_load()
+        return "Thank you for your order!" in self.checkout_complete_page.get_complete_header()
+
+
+class LoadGenerator:
+    """Runs PurchaseJourney with a number of concurrent headless browsers
+    
+    Each virtual user is a thread with its own single-browser DriverPool, so
+    the browser is cleaned and reused between iterations. Users start evenly
+    spread over the ramp-up period and stop after their iteration count or
+    when the duration is over, whichever comes first. A step that raises or
+    whose check fails ends that iteration and is counted as an error.
+    """
+    
+    PERCENTILES = (50, 90, 95, 99)
+    
+    def __init__(self, users=1, duration=None, iterations=None, ramp_up=0.0,
+                 browser_name=None, items=None, checkout_data=None):
+        if duration is None and iterations is None:
+            raise ValueError("Either a duration or an iteration count is required")
+        self.logger = Logger().get_logger()
+        self.users = users
+        self.duration = duration
+        self.iterations = iterations
+        self.ramp_up = ramp_up
+        self.browser_name = browser_name
+        self.items = items
+        self.checkout_data = checkout_data
+        self.step_durations = {step: [] for step in PurchaseJourney.STEPS}
+        self.step_errors = {step: 0 for step in PurchaseJourney.STEPS}
+        self.completed = 0
+        self.started = None
+        self.finished = None
+        self._deadline = None
+        self._lock = threading.Lock()
+    
+    def run(self):
+        """
+        Run every virtual user to completion
+        
+        Returns:
+            dict: Throughput and per-step latency summary (see summary())
+        """
+        # Steps are timed here; recording every command of every user would only add overhead
+        command_metrics, TestConfig.COMMAND_METRICS = TestConfig.COMMAND_METRICS, False
+        self.started = time.perf_counter()
+        self._deadline = self.started + self.duration if self.duration else None
+        threads = [
+            threading.Thread(target=self._run_user, args=(index,), name=f"vu-{index}", daemon=True)
+            for index in range(self.users)
+        ]
+        for thread in threads:
+            thread.start()
+        try:
+            for thread in threads:
+                thread.join()
+        finally:
+            TestConfig.COMMAND_METRICS = command_metrics
+        self.finished = time.perf_counter()
+        return self.summary()
+    
+    def summary(self):
+        """Get completed checkouts per minute and latency percentiles per step"""
+        now = time.perf_counter()
+        elapsed = (now if self.finished is None else self.finished) - (now if self.started is None else self.started)
+        steps = {}
+        for step in PurchaseJourney.STEPS:
+            durations = sorted(self.step_durations[step])
+            stats = {"count": len(durations), "errors": self.step_errors[step]}
+            for pct in self.PERCENTILES:
+                stats[f"p{pct}_s"] = round(Stats.percentile(durations, pct), 3) if durations else None
+            stats["max_s"] = round(durations[-1], 3) if durations else None
+            steps[step] = stats
+        return {
+            "users": self.users,
+            "ramp_up_s": self.ramp_up,
+            "elapsed_s": round(elapsed, 3),
+            "completed_checkouts": self.completed,
+            "checkouts_per_min": round(self.completed / elapsed * 60, 2) if elapsed > 0 else 0.0,
+            "steps": steps,
+        }
+    
+    def _run_user(self, index):
+        """Run the journey repeatedly as one virtual user"""
+        if self.users > 1 and self.ramp_up:
+            time.sleep(self.ramp_up * index / self.users)
+        # No spares: every virtual user drives exactly one browser
+        pool = DriverPool(self.browser_name, headless=True, size=1, spares=0)
+        iteration = 0
+        try:
+            while not self._is_done(iteration):
+                iteration += 1
+                try:
+                    driver = pool.acquire()
+                except Exception as e:
+                    self.logger.error(f"vu-{index} could not start a browser: {e}")
+                    with self._lock:
+                        self.step_errors["login"] += 1
+                    return
+                try:
+                    self._run_iteration(PurchaseJourney(driver, self.items, checkout_data=self.checkout_data))
+                finally:
+                    pool.release(driver)
+        finally:
+            pool.shutdown()
+    
+    def _run_iteration(self, journey):
+        """Run and time each step of one journey"""
+        for step in PurchaseJourney.STEPS:
+            start = time.perf_counter()
+            try:
+                ok = getattr(journey, step)()
+            except Exception as e:
+                self.logger.warning(f"Load journey step {step} failed: {e}")
+                ok = False
+            if not self._record_step(step, ok, time.perf_counter() - start):
+                return
+    
+    def _record_step(self, step, ok, elapsed):
+        """Record a step's duration or error; a finished last step completes a checkout"""
+        with self._lock:
+            if not ok:
+                self.step_errors[step] += 1
+                return False
+            self.step_durations[step].append(elapsed)
+            if step == PurchaseJourney.STEPS[-1]:
+                self.completed += 1
+        return True
+    
+    def _is_done(self, iteration):
+        """Check whether a virtual user should stop"""
+        if self.iterations is not None and iteration >= self.iterations:
+            return True
+        return self._deadline is not None and time.perf_counter() >= self._deadline
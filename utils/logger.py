@@ -1,12 +1,61 @@
+import atexit
+import json
 import logging
-from datetime import datetime
+import logging.handlers
+import os
+import queue
+import time
+from config.config import TestConfig
 from .path_manager import PathManager
+from .test_context import TestContext
+
+
+class JsonLineFormatter(logging.Formatter):
+    """Formats a record as one compact JSON line"""
+    
+    def format(self, record):
+        entry = {
+            "ts": round(record.created, 6),
+            "level": record.levelname,
+            "worker": record.worker,
+            "test": record.test,
+            "elapsed_ms": record.elapsed_ms,
+            "func": f"{record.module}.{record.funcName}:{record.lineno}",
+            "msg": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, separators=(",", ":"), ensure_ascii=False)
+
+
+class ContextQueueHandler(logging.handlers.QueueHandler):
+    """Tags records with the worker, test and elapsed time, then hands them to the writer thread"""
+    
+    def prepare(self, record):
+        record.worker = TestContext.get_worker_id()
+        record.test = TestContext.current_test
+        record.elapsed_ms = round(TestContext.get_test_elapsed_ms() or record.relativeCreated, 1)
+        # Only resolve the arguments here (they may change later); formatting happens on the listener
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
 
 class Logger:
-    """Centralized logging utility for the automation framework"""
+    """Centralized logging utility for the automation framework
+    
+    Log calls only put the record on a queue; a listener thread formats and
+    writes it. Each xdist worker writes its own size-rotated file of JSON
+    lines, logs/automation_gwN.jsonl, and every other process (a run without
+    xdist, the xdist controller, load_test.py) one named after its PID,
+    logs/automation_main_<pid>.jsonl, so processes never rotate each other's
+    file. merge_logs.py interleaves them.
+    """
     
     _instance = None
     _logger = None
+    _queue = None
+    _listener = None
     
     def __new__(cls):
         if cls._instance is None:
@@ -14,11 +63,17 @@ class Logger:
             cls._instance._setup_logger()
         return cls._instance
     
+    @staticmethod
+    def get_log_path():
+        """Get the log file of this process"""
+        suffix = TestContext.get_worker_suffix() or f"_main_{os.getpid()}"
+        return PathManager.get_logs_path() / f"automation{suffix}.jsonl"
+    
     def _setup_logger(self):
         """Setup the logger with proper configuration"""
         if self._logger is None:
             # Create logs directory if it doesn't exist
-            log_dir = PathManager.ensure_directory_exists(PathManager.get_logs_path())
+            PathManager.ensure_directory_exists(PathManager.get_logs_path())
             
             # Create logger
             self._logger = logging.getLogger('webui_automation')
@@ -26,31 +81,35 @@ class Logger:
             
             # Prevent duplicate handlers
             if not self._logger.handlers:
-                # Create formatters
-                file_formatter = logging.Formatter(
-                    '%(asctime)s - %(name)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
-                )
-                console_formatter = logging.Formatter(
-                    '%(levelname)s - %(message)s'
-                )
-                
-                # File handler
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                file_handler = logging.FileHandler(
-                    log_dir / f'automation_{timestamp}.log',
+                # File handler: JSON lines, rotated by size
+                file_handler = logging.handlers.RotatingFileHandler(
+                    self.get_log_path(),
+                    maxBytes=TestConfig.LOG_MAX_BYTES,
+                    backupCount=TestConfig.LOG_BACKUP_COUNT,
                     encoding='utf-8'
                 )
                 file_handler.setLevel(logging.DEBUG)
-                file_handler.setFormatter(file_formatter)
+                file_handler.setFormatter(JsonLineFormatter())
                 
                 # Console handler
                 console_handler = logging.StreamHandler()
                 console_handler.setLevel(logging.INFO)
-                console_handler.setFormatter(console_formatter)
+                console_handler.setFormatter(logging.Formatter('%(levelname)s - %(message)s'))
                 
-                # Add handlers
-                self._logger.addHandler(file_handler)
-                self._logger.addHandler(console_handler)
+                # Both run on the listener thread; the caller only enqueues
+                Logger._queue = queue.Queue()
+                Logger._listener = logging.handlers.QueueListener(
+                    self._queue, file_handler, console_handler, respect_handler_level=True
+                )
+                Logger._listener.start()
+                atexit.register(Logger._listener.stop)
+                self._logger.addHandler(ContextQueueHandler(self._queue))
+    
+    @classmethod
+    def flush(cls):
+        """Wait until every queued record has been written"""
+        if cls._queue is not None:
+            cls._queue.join()
     
     def get_logger(self):
         """Get the configured logger instance"""
@@ -74,4 +133,4 @@ class Logger:
     
     def critical(self, message):
         """Log critical message"""
-        self._logger.critical(message) 
\ No newline at end of file
+        self._logger.critical(message)
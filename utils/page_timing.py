@@ -0,0 +1,207 @@
+"""Navigation Timing, paint and resource timing captured from the browser after page transitions"""
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from selenium.common.exceptions import WebDriverException
+from config.config import TestConfig
+from .path_manager import PathManager
+from .test_context import TestContext
+
+
+class PageTimingCollector:
+    """Appends one compact JSON line per loaded document to .cache/page_timings.jsonl
+    
+    BasePage calls capture() after navigate_to, refresh_page, go_back,
+    go_forward and click_element when PAGE_TIMING is enabled. A document is
+    identified by performance.timeOrigin, so a click that did not change the
+    page records nothing and a page is never recorded twice. Lines are
+    appended across runs, so the file is a history of page performance.
+    """
+    
+    # Document path -> page object that owns it
+    PAGE_NAMES = {
+        "": "LoginPage",
+        "index.html": "LoginPage",
+        "inventory.html": "InventoryPage",
+        "inventory-item.html": "InventoryItemPage",
+        "cart.html": "CartPage",
+        "checkout-step-one.html": "CheckoutPage",
+        "checkout-step-two.html": "CheckoutOverviewPage",
+        "checkout-complete.html": "CheckoutCompletePage",
+    }
+    
+    SLOWEST_RESOURCES = 3
+    
+    CAPTURE_SCRIPT = """
+        var nav = performance.getEntriesByType('navigation')[0];
+        var cookie = document.cookie.match(/(?:^|; )session-username=([^;]*)/);
+        var result = {
+            origin: performance.timeOrigin, ready: document.readyState,
+            path: location.pathname, user: cookie ? decodeURIComponent(cookie[1]) : null
+        };
+        if (!nav || document.readyState !== 'complete') { return result; }
+        result.type = nav.type;
+        result.ttfb = nav.responseStart;
+        result.dom_interactive = nav.domInteractive;
+        result.dcl = nav.domContentLoadedEventEnd;
+        result.load = nav.loadEventEnd || nav.duration;
+        result.transfer = nav.transferSize;
+        performance.getEntriesByType('paint').forEach(function (entry) {
+            result[entry.name === 'first-contentful-paint' ? 'fcp' : 'fp'] = entry.startTime;
+        });
+        var resources = performance.getEntriesByType('resource');
+        result.res = resources.length;
+        result.res_bytes = resources.reduce(function (total, entry) { return total + (entry.transferSize || 0); }, 0);
+        result.res_slowest = resources.slice().sort(function (a, b) { return b.duration - a.duration; })
+            .slice(0, arguments[0]).map(function (entry) {
+                return [entry.name.split('?')[0].split('/').pop(), entry.duration];
+            });
+        // Buffered observers fill their record queue synchronously, so takeRecords() sees earlier entries
+        var types = (window.PerformanceObserver && PerformanceObserver.supportedEntryTypes) || [];
+        if (types.indexOf('largest-contentful-paint') >= 0) {
+            var lcp = new PerformanceObserver(function () {});
+            lcp.observe({type: 'largest-contentful-paint', buffered: true});
+            var entries = lcp.takeRecords();
+            lcp.disconnect();
+            if (entries.length) { result.lcp = entries[entries.length - 1].startTime; }
+        }
+        if (types.indexOf('layout-shift') >= 0) {
+            var cls = new PerformanceObserver(function () {});
+            cls.observe({type: 'layout-shift', buffered: true});
+            result.cls = cls.takeRecords().reduce(function (total, entry) {
+                return entry.hadRecentInput ? total : total + entry.value;
+            }, 0);
+            cls.disconnect();
+        }
+        return result;
+    """
+    
+    TIMING_FIELDS = ("ttfb", "dom_interactive", "dcl", "load", "fp", "fcp", "lcp")
+    
+    # Measured by measure(): ms from a user action until the page object is ready
+    STEP_FIELD = "ready"
+    
+    _seen = {}
+    _lock = threading.Lock()
+    
+    @classmethod
+    def get_results_path(cls):
+        """Get the page timing results file"""
+        return PathManager.get_cache_path() / "page_timings.jsonl"
+    
+    @classmethod
+    def capture(cls, driver, trigger, page_object=None):
+        """
+        Record the timings of the current document if it has not been recorded yet
+        
+        Args:
+            driver: WebDriver whose current document is measured
+            trigger (str): What caused the transition (navigate, refresh, back, forward, click, teardown)
+            page_object (str): Page object that triggered it, used when the path is not a known page
+        
+        Returns:
+            dict: The recorded entry, or None if nothing new was recorded
+        """
+        try:
+            timing = driver.execute_script(cls.CAPTURE_SCRIPT, cls.SLOWEST_RESOURCES)
+        except WebDriverException:
+            return None
+        if not timing or timing.get("ready") != "complete" or "load" not in timing:
+            return None
+        
+        session = getattr(driver, "session_id", None)
+        with cls._lock:
+            if cls._seen.get(session) == timing["origin"]:
+                return None
+            cls._seen[session] = timing["origin"]
+        
+        entry = cls._build_entry(timing, trigger, page_object)
+        cls._append(entry)
+        return entry
+    
+    @classmethod
+    @contextmanager
+    def measure(cls, driver, page):
+        """
+        Record how long the wrapped step takes to make a page ready, as its "ready" timing
+        
+        Client-side route changes (e.g. login -> inventory) load no new
+        document, so Navigation Timing has nothing for them; this times the
+        step itself, from the action to the page object's load wait.
+        
+        Args:
+            driver: WebDriver the step runs in (the logged-in user is read from it afterwards)
+            page (str): Page object the step leads to, e.g. "InventoryPage"
+        """
+        start = time.perf_counter()
+        yield
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if not TestConfig.PAGE_TIMING:
+            return
+        try:
+            cookie = driver.get_cookie("session-username")
+        except WebDriverException:
+            cookie = None
+        entry = {
+            "ts": round(time.time(), 3),
+            "run": TestContext.get_run_id(),
+            "worker": TestContext.get_worker_id(),
+            "test": TestContext.current_test,
+            "page": page,
+            "user": cookie["value"] if cookie else None,
+            "trigger": "step",
+            cls.STEP_FIELD: round(elapsed_ms, 1),
+        }
+        cls._append(entry)
+    
+    @classmethod
+    def read(cls, path=None):
+        """Read every recorded entry, skipping lines that cannot be parsed"""
+        entries = []
+        try:
+            with open(path or cls.get_results_path(), encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entries.append(json.loads(line))
+                    except ValueError:
+                        continue
+        except OSError:
+            pass
+        return entries
+    
+    @classmethod
+    def _build_entry(cls, timing, trigger, page_object):
+        """Turn the raw browser timings into a compact, tagged entry"""
+        page_file = timing["path"].rsplit("/", 1)[-1]
+        entry = {
+            "ts": round(time.time(), 3),
+            "run": TestContext.get_run_id(),
+            "worker": TestContext.get_worker_id(),
+            "test": TestContext.current_test,
+            "page": cls.PAGE_NAMES.get(page_file, page_object),
+            "user": timing.get("user"),
+            "trigger": trigger,
+            "path": timing["path"],
+            "type": timing.get("type"),
+        }
+        for field in cls.TIMING_FIELDS:
+            if timing.get(field) is not None:
+                entry[field] = round(timing[field], 1)
+        if timing.get("cls") is not None:
+            entry["cls"] = round(timing["cls"], 4)
+        for field in ("transfer", "res", "res_bytes"):
+            entry[field] = timing.get(field)
+        entry["res_slowest"] = [[name, round(duration, 1)] for name, duration in timing.get("res_slowest", [])]
+        return entry
+    
+    @classmethod
+    def _append(cls, entry):
+        """Append one entry as a single line (small appends are atomic across xdist workers)"""
+        path = cls.get_results_path()
+        PathManager.ensure_directory_exists(path.parent)
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+        with cls._lock:
+            with open(path, "a", encoding="utf-8") as f:
+                f.write(line)
@@ -69,6 +69,11 @@ class PathManager:
         """Get the reports directory path"""
         return cls.get_project_root() / "reports"
     
+    @classmethod
+    def get_cache_path(cls):
+        """Get the local cache directory path (driver manifest, run history)"""
+        return cls.get_project_root() / ".cache"
+    
     @classmethod
     def ensure_directory_exists(cls, directory_path):
         """Ensure a directory exists, create if it doesn't"""
@@ -0,0 +1,117 @@
+"""Checks recorded page load timings against the budgets in config/performance_budgets.py"""
+
+import json
+import statistics
+from config.performance_budgets import PerformanceBudgets
+from .page_timing import PageTimingCollector
+from .stats import Stats
+from .test_context import TestContext
+
+
+class PerformanceBudgetChecker:
+    """Evaluates budgets over a rolling window of runs instead of single samples
+    
+    The window is the last PerformanceBudgets.WINDOW_RUNS runs in the page
+    timing history, the current run included. The budget percentile is taken
+    per run and the page is over budget when the median of those per-run
+    values is, so one noisy run cannot fail a test on its own.
+    """
+    
+    def __init__(self, entries=None):
+        self.entries = entries if entries is not None else PageTimingCollector.read()
+        self.window_runs = self._get_window_runs()
+    
+    def check(self, page, user=None):
+        """
+        Check one page and user against its budget
+        
+        Args:
+            page (str): Page object name, e.g. "InventoryPage"
+            user (str): Username the page was loaded as
+        
+        Returns:
+            dict: Budget, observed value and a status of "ok", "over",
+                  "insufficient" (too few samples to judge) or "no-budget"
+        """
+        budget = PerformanceBudgets.get_budget(page, user)
+        result = {"page": page, "user": user}
+        if budget is None:
+            return dict(result, status="no-budget")
+        
+        samples = {}
+        for entry in self.entries:
+            if (entry.get("run") in self.window_runs and entry.get("page") == page
+                    and entry.get("user") == user and entry.get(budget["metric"]) is not None):
+                samples.setdefault(entry["run"], []).append(entry[budget["metric"]])
+        per_run = sorted(Stats.percentile(sorted(values), budget["percentile"]) for values in samples.values())
+        result.update(budget, samples=sum(len(values) for values in samples.values()), runs=len(per_run),
+                      runs_over=sum(1 for value in per_run if value > budget["limit_ms"]))
+        result["value_ms"] = statistics.median(per_run) if per_run else None
+        if len(per_run) < PerformanceBudgets.MIN_RUNS:
+            return dict(result, status="insufficient")
+        return dict(result, status="over" if result["value_ms"] > budget["limit_ms"] else "ok")
+    
+    def check_test(self, nodeid, page=None):
+        """Check every page and user a test loaded in this run (optionally one page only)"""
+        run_id = TestContext.get_run_id()
+        visited = sorted({
+            (entry.get("page"), entry.get("user")) for entry in self.entries
+            if entry.get("run") == run_id and entry.get("test") == nodeid and entry.get("page")
+        }, key=lambda visit: (visit[0], visit[1] or ""))
+        return [self.check(visited_page, user) for visited_page, user in visited if page in (None, visited_page)]
+    
+    def _get_window_runs(self):
+        """Get the ids of the most recent runs, the current one included"""
+        first_seen = {}
+        for entry in self.entries:
+            run_id = entry.get("run")
+            if run_id is not None and run_id not in first_seen:
+                first_seen[run_id] = entry.get("ts", 0)
+        current = TestContext.get_run_id()
+        first_seen.setdefault(current, float("inf"))
+        recent = sorted(first_seen, key=first_seen.get)[-PerformanceBudgets.WINDOW_RUNS:]
+        return set(recent)
+    
+    @staticmethod
+    def format_result(result):
+        """Format a check result as one line"""
+        user = result["user"] or "anonymous"
+        if result["status"] == "no-budget":
+            return f"{result['page']} ({user}): no budget"
+        value = "n/a" if result["value_ms"] is None else f"{result['value_ms']:.0f}ms"
+        return (f"{result['page']} ({user}): median per-run p{result['percentile']} {result['metric']} {value} "
+                f"/ budget {result['limit_ms']}ms ({result['runs_over']} of {result['runs']} runs over, "
+                f"{result['samples']} samples) [{result['status']}]")
+
+
+class PerformanceBudgetPlugin:
+    """Collects budget results from every worker and lists them in the terminal summary"""
+    
+    # Carries a test's budget results from the worker that ran it to the reporting process
+    PROPERTY = "performance_budget"
+    
+    def __init__(self, config):
+        self.is_worker = hasattr(config, "workerinput")
+        self.results = {}
+    
+    def pytest_runtest_logreport(self, report):
+        """Pick up results attached to a test's teardown report"""
+        if self.is_worker or report.when != "teardown":
+            return
+        for name, value in report.user_properties:
+            if name == self.PROPERTY:
+                self.results[report.nodeid] = json.loads(value)
+    
+    def pytest_terminal_summary(self, terminalreporter):
+        """List every checked budget, over-budget pages first"""
+        if self.is_worker or not self.results:
+            return
+        order = {"over": 0, "insufficient": 1, "ok": 2, "no-budget": 3}
+        lines = sorted(
+            (order.get(result["status"], 4), nodeid, PerformanceBudgetChecker.format_result(result))
+            for nodeid, results in self.results.items() for result in results
+        )
+        terminalreporter.write_sep("-", "performance budgets")
+        for _, nodeid, line in lines:
+            terminalreporter.write_line(f"{line}  {nodeid}")
+
@@ -0,0 +1,351 @@
+"""Browserless replay of the purchase journey as plain HTTP requests on asyncio"""
+
+import asyncio
+import json
+import re
+import ssl
+import time
+from urllib.parse import urljoin, urlsplit
+from config.config import TestConfig
+from config.test_data import TestData
+from .load_generator import LoadGenerator, PurchaseJourney
+
+
+class ProtocolError(Exception):
+    """Raised when the server answers a journey request with an error or not at all"""
+
+
+class HttpResponse:
+    """Status, lower-cased headers and body of one HTTP response"""
+    
+    def __init__(self, status, headers, body, set_cookies):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.set_cookies = set_cookies
+    
+    @property
+    def text(self):
+        """Body decoded as UTF-8"""
+        return self.body.decode("utf-8", errors="replace")
+
+
+class ConnectionPool:
+    """Keep-alive HTTP/1.1 connections to one origin, shared by every simulated session
+    
+    At most `size` requests are in flight at once; idle connections are
+    reused, so thousands of sessions run over a few dozen sockets. A request
+    on a reused connection that the server already closed is retried once
+    on a fresh connection, as browsers do for idempotent requests.
+    """
+    
+    def __init__(self, base_url, size=50, timeout=None):
+        parts = urlsplit(base_url)
+        self.host = parts.hostname
+        self.ssl = ssl.create_default_context() if parts.scheme == "https" else None
+        self.port = parts.port or (443 if self.ssl else 80)
+        self.host_header = parts.netloc
+        self.size = size
+        self.timeout = timeout if timeout is not None else TestConfig.PAGE_LOAD_TIMEOUT
+        self.opened = 0
+        self.requests = 0
+        self._idle = []
+        self._slots = asyncio.Semaphore(size)
+    
+    async def request(self, method, path, headers=None):
+        """
+        Send one request and read the full response
+        
+        Args:
+            method (str): HTTP method
+            path (str): Absolute path with query string
+            headers (dict): Extra request headers
+        
+        Returns:
+            HttpResponse: The parsed response
+        """
+        lines = [f"{method} {path} HTTP/1.1", f"Host: {self.host_header}", "Accept-Encoding: identity"]
+        lines.extend(f"{name}: {value}" for name, value in (headers or {}).items())
+        payload = ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+        
+        async with self._slots:
+            self.requests += 1
+            connection = self._idle.pop() if self._idle else None
+            if connection is not None:
+                try:
+                    return await self._exchange(connection, payload)
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    pass  # Closed while idle: retry once on a fresh connection
+            return await self._exchange(await self._open(), payload)
+    
+    async def close(self):
+        """Close every idle connection"""
+        idle, self._idle = self._idle, []
+        for _, writer in idle:
+            writer.close()
+        for _, writer in idle:
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+    
+    async def _open(self):
+        """Open a new connection"""
+        connection = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port, ssl=self.ssl), self.timeout
+        )
+        self.opened += 1
+        return connection
+    
+    async def _exchange(self, connection, payload):
+        """Write a request and read its response, keeping the connection if the server allows"""
+        reader, writer = connection
+        try:
+            writer.write(payload)
+            await writer.drain()
+            response = await asyncio.wait_for(self._read_response(reader), self.timeout)
+        except BaseException:
+            writer.close()
+            raise
+        if response.headers.get("connection", "").lower() == "close":
+            writer.close()
+        else:
+            self._idle.append(connection)
+        return response
+    
+    @staticmethod
+    async def _read_response(reader):
+        """Parse a status line, headers and a length-delimited, chunked or close-delimited body"""
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError("Connection closed without a response")
+        status = int(status_line.split()[1])
+        headers = {}
+        set_cookies = []
+        while True:
+            line = (await reader.readline()).decode("latin-1").rstrip("\r\n")
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            name = name.strip().lower()
+            if name == "set-cookie":
+                set_cookies.append(value.strip())
+            headers[name] = value.strip()
+        
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = int((await reader.readline()).split(b";")[0], 16)
+                if size == 0:
+                    await reader.readline()
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readline()
+            body = b"".join(chunks)
+        elif "content-length" in headers:
+            body = await reader.readexactly(int(headers["content-length"]))
+        elif status in (204, 304) or status < 200:
+            body = b""
+        else:
+            body = await reader.read()
+            headers["connection"] = "close"
+        return HttpResponse(status, headers, body, set_cookies)
+
+
+class ProtocolSession:
+    """One simulated visitor: a cookie jar plus the state the app keeps in the browser
+    
+    The site is rendered client-side: login is checked by the page script
+    against the catalogue script, the session is a cookie set by that script
+    and the cart lives in localStorage. The session performs the same page
+    and asset requests a browser would and keeps that client-side state here.
+    """
+    
+    ASSET_PATTERN = re.compile(r'(?:src|href)="([^"#]+\.(?:css|js|svg|png|jpg))"')
+    APP_DATA_PATTERN = re.compile(r"window\.SWAG_LABS_DATA\s*=\s*(\{.*\})\s*;?\s*$", re.S)
+    
+    # Images the page scripts add after load
+    SCRIPT_ASSETS = {
+        "inventory.html": ("static/img/product.svg",),
+        "inventory-item.html": ("static/img/product.svg",),
+    }
+    
+    SESSION_COOKIE = "session-username"
+    
+    def __init__(self, pool, base_url=None):
+        self.pool = pool
+        self.base_url = base_url or TestConfig.BASE_URL
+        self.base_path = urlsplit(self.base_url).path or "/"
+        self.cookies = {}
+        self.cart = []
+        self.app_data = None
+    
+    async def get(self, url):
+        """GET a URL relative to the site root, sending and storing cookies"""
+        path = urlsplit(urljoin(self.base_path, url))
+        target = path.path + (f"?{path.query}" if path.query else "")
+        headers = {"Cookie": "; ".join(f"{name}={value}" for name, value in self.cookies.items())} if self.cookies else {}
+        try:
+            response = await self.pool.request("GET", target, headers)
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.TimeoutError) as e:
+            raise ProtocolError(f"GET {target} failed: {e!r}") from e
+        if response.status >= 400:
+            raise ProtocolError(f"GET {target} returned {response.status}")
+        for cookie in response.set_cookies:
+            name, _, value = cookie.split(";", 1)[0].partition("=")
+            self.cookies[name.strip()] = value.strip()
+        return response
+    
+    async def load_page(self, page):
+        """Load a page and, concurrently, the stylesheets, scripts and images it uses"""
+        response = await self.get(page)
+        assets = list(dict.fromkeys(
+            asset for asset in self.ASSET_PATTERN.findall(response.text) if "://" not in asset
+        ))
+        assets.extend(self.SCRIPT_ASSETS.get(page, ()))
+        results = await asyncio.gather(*(self.get(asset) for asset in assets))
+        for asset, asset_response in zip(assets, results):
+            if asset.endswith("app-data.js"):
+                self.app_data = self._parse_app_data(asset_response.text)
+        return response
+    
+    def get_app_data(self):
+        """Get the catalogue loaded with the last page, which only the local stand-in serves"""
+        if self.app_data is None:
+            raise ProtocolError(f"No catalogue script (app-data.js) on {self.base_url}; use the local stand-in")
+        return self.app_data
+    
+    def set_cookie(self, name, value):
+        """Set a cookie the way the page script does"""
+        self.cookies[name] = value
+    
+    def _parse_app_data(self, script):
+        """Read the catalogue the page scripts run on"""
+        match = self.APP_DATA_PATTERN.search(script)
+        if not match:
+            raise ProtocolError("Catalogue script has an unexpected format")
+        return json.loads(match.group(1))
+
+
+class ProtocolJourney:
+    """PurchaseJourney's steps replayed over HTTP, applying the page scripts' rules"""
+    
+    STEPS = PurchaseJourney.STEPS
+    
+    def __init__(self, session, items=None, user=None, checkout_data=None):
+        self.session = session
+        self.items = items or ["Sauce Labs Backpack"]
+        self.user = user or TestData.get_user_credentials("valid")
+        self.checkout_data = checkout_data or TestData.get_checkout_data("valid")
+    
+    async def login(self):
+        """Load the login page, log in as the page script would and load the inventory"""
+        await self.session.load_page("index.html")
+        data = self.session.get_app_data()
+        username = self.user["username"]
+        if username not in data["users"] or self.user["password"] != data["password"]:
+            return False
+        if username in data["locked_users"]:
+            return False
+        self.session.set_cookie(ProtocolSession.SESSION_COOKIE, username)
+        await self.session.load_page("inventory.html")
+        return len(self.session.get_app_data()["products"]) > 0
+    
+    async def add_to_cart(self):
+        """Put the journey's items in the emulated localStorage cart"""
+        ids = {product["name"]: product["id"] for product in self.session.get_app_data()["products"]}
+        for item in self.items:
+            if item not in ids:
+                return False
+            if ids[item] not in self.session.cart:
+                self.session.cart.append(ids[item])
+        return len(self.session.cart) == len(self.items)
+    
+    async def checkout(self):
+        """Load the cart and checkout pages and check the overview totals"""
+        await self.session.load_page("cart.html")
+        await self.session.load_page("checkout-step-one.html")
+        if not all(self.checkout_data.get(field) for field in ("first_name", "last_name", "postal_code")):
+            return False
+        await self.session.load_page("checkout-step-two.html")
+        
+        data = self.session.get_app_data()
+        prices = {product["id"]: product["price_value"] for product in data["products"]}
+        subtotal = sum(prices[product_id] for product_id in self.session.cart)
+        tax = round(subtotal * data["tax_rate"], 2)
+        expected_subtotal = sum(TestData.get_product_price_value(item) for item in self.items)
+        return abs(subtotal + tax - TestData.calculate_total(expected_subtotal)) < 0.01
+    
+    async def finish(self):
+        """Load the confirmation page and empty the cart"""
+        response = await self.session.load_page("checkout-complete.html")
+        self.session.cart = []
+        return "thank you for your order" in response.text.lower()
+
+
+class ProtocolLoadGenerator(LoadGenerator):
+    """LoadGenerator variant running every virtual user as a coroutine instead of a browser
+    
+    All sessions share one ConnectionPool, so the socket count is bounded by
+    `connections` however many sessions run. Each iteration starts with a
+    fresh session (empty cookie jar and cart), like a reset browser.
+    """
+    
+    def __init__(self, users=1, duration=None, iterations=None, ramp_up=0.0,
+                 items=None, checkout_data=None, connections=None, base_url=None):
+        super().__init__(users, duration, iterations, ramp_up, None, items, checkout_data)
+        self.connections = connections or min(users, 50)
+        self.base_url = base_url or TestConfig.BASE_URL
+        self.pool = None
+        self.unexpected_errors = {}
+    
+    def run(self):
+        """Run every virtual user to completion on one event loop"""
+        self.started = time.perf_counter()
+        self._deadline = self.started + self.duration if self.duration else None
+        asyncio.run(self._run_users())
+        self.finished = time.perf_counter()
+        return self.summary()
+    
+    def summary(self):
+        """LoadGenerator's summary plus connection reuse"""
+        summary = super().summary()
+        summary["mode"] = "protocol"
+        if self.pool is not None:
+            summary["connections_opened"] = self.pool.opened
+            summary["requests"] = self.pool.requests
+        if self.unexpected_errors:
+            summary["unexpected_errors"] = dict(sorted(self.unexpected_errors.items()))
+        return summary
+    
+    async def _run_users(self):
+        """Start every virtual user and wait for all of them"""
+        self.pool = ConnectionPool(self.base_url, self.connections)
+        try:
+            await asyncio.gather(*(self._run_user(index) for index in range(self.users)))
+        finally:
+            await self.pool.close()
+    
+    async def _run_user(self, index):
+        """Run the journey repeatedly as one virtual user"""
+        if self.users > 1 and self.ramp_up:
+            await asyncio.sleep(self.ramp_up * index / self.users)
+        iteration = 0
+        while not self._is_done(iteration):
+            iteration += 1
+            session = ProtocolSession(self.pool, self.base_url)
+            journey = ProtocolJourney(session, self.items, checkout_data=self.checkout_data)
+            for step in ProtocolJourney.STEPS:
+                start = time.perf_counter()
+                try:
+                    ok = await getattr(journey, step)()
+                except ProtocolError as e:
+                    self.logger.warning(f"Protocol journey step {step} failed: {e}")
+                    ok = False
+                except Exception as e:
+                    # A bug in one session must not abort the gather and with it every other user
+                    self.logger.error(f"vu-{index} protocol journey step {step} raised {e!r}")
+                    self.unexpected_errors[f"vu-{index}"] = self.unexpected_errors.get(f"vu-{index}", 0) + 1
+                    ok = False
+                if not self._record_step(step, ok, time.perf_counter() - start):
+                    break
@@ -0,0 +1,273 @@
+"""Persistent test results keyed by node id and by a hash of the code each test depends on"""
+
+import ast
+import hashlib
+import json
+import os
+import pytest
+from config.config import TestConfig
+from utils.path_manager import PathManager
+
+
+class ResultCache:
+    """Last outcome of every test, with the dependency and config hashes it ran against
+    
+    A test's dependency hash covers every project module reachable through
+    imports (absolute or relative, also inside function bodies) from its own
+    test file, conftest.py and the shared page code (utils/base_page.py,
+    config/test_data.py). The page objects conftest.py imports for its
+    fixtures are the exception: they count only for tests that request a
+    fixture using them, so editing pages/cart_page.py only invalidates tests
+    that use a cart page.
+    """
+    
+    CONFTEST = "conftest.py"
+    COMMON_SOURCES = ("utils/base_page.py", "config/test_data.py")
+    
+    # Modules conftest.py imports from these packages are attributed per fixture
+    FIXTURE_PACKAGES = ("pages/",)
+    
+    MODES = ("failed-first", "changed-first", "changed-only", "skip-passed")
+    
+    def __init__(self, path=None):
+        self.path = path or PathManager.get_cache_path() / "results.json"
+        self.results = self._read()
+        self.config_hash = self.get_config_hash()
+        self._file_hashes = {}
+        self._imports = {}
+        self._closures = {}
+        self._fixture_sources = None
+    
+    @classmethod
+    def get_config_hash(cls):
+        """Hash the public TestConfig settings"""
+        settings = {
+            name: value for name, value in vars(TestConfig).items()
+            if name.isupper() and isinstance(value, (str, int, float, bool))
+        }
+        return hashlib.sha256(json.dumps(settings, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+    
+    def get_sources(self, item):
+        """Get the project-relative source files a test depends on"""
+        test_file = os.path.relpath(str(item.path), PathManager.get_project_root()).replace(os.sep, "/")
+        sources = set(self.get_import_closure(test_file))
+        for source in self.COMMON_SOURCES:
+            sources.update(self.get_import_closure(source))
+        fixture_modules = frozenset(
+            source for source in self.get_imported_sources(self.CONFTEST) if source.startswith(self.FIXTURE_PACKAGES)
+        )
+        sources.update(self.get_import_closure(self.CONFTEST, fixture_modules))
+        fixture_sources = self.get_fixture_sources()
+        for fixture_name in getattr(item, "fixturenames", ()):
+            for source in fixture_sources.get(fixture_name, ()):
+                sources.update(self.get_import_closure(source))
+        return sorted(sources)
+    
+    def get_fixture_sources(self):
+        """Map each conftest.py fixture to the project modules whose imported names its body uses"""
+        if self._fixture_sources is None:
+            tree = self._parse(self.CONFTEST)
+            # Top-level "from pages.cart_page import CartPage" -> {"CartPage": "pages/cart_page.py"}
+            name_sources = {}
+            for node in tree.body:
+                if isinstance(node, ast.ImportFrom):
+                    for alias in node.names:
+                        for source in self._resolve(self.CONFTEST, node.module, node.level, alias.name):
+                            name_sources[alias.asname or alias.name] = source
+            self._fixture_sources = {}
+            for node in tree.body:
+                if isinstance(node, ast.FunctionDef) and any(
+                        "fixture" in ast.unparse(decorator) for decorator in node.decorator_list):
+                    self._fixture_sources[node.name] = sorted({
+                        name_sources[name.id] for name in ast.walk(node)
+                        if isinstance(name, ast.Name) and name.id in name_sources
+                    })
+        return self._fixture_sources
+    
+    def get_import_closure(self, source, exclude=frozenset()):
+        """Get a source file and every project file it imports, directly or transitively (memoised for the run)"""
+        key = (source, exclude)
+        if key not in self._closures:
+            closure = set()
+            pending = [source]
+            while pending:
+                current = pending.pop()
+                if current in closure or current in exclude:
+                    continue
+                closure.add(current)
+                pending.extend(self.get_imported_sources(current))
+            self._closures[key] = closure
+        return self._closures[key]
+    
+    def get_imported_sources(self, source):
+        """Get the project files a source file imports anywhere in its body (memoised for the run)"""
+        if source not in self._imports:
+            imported = set()
+            for node in ast.walk(self._parse(source)):
+                if isinstance(node, ast.Import):
+                    for alias in node.names:
+                        imported.update(self._resolve(source, alias.name, 0))
+                elif isinstance(node, ast.ImportFrom):
+                    for alias in node.names:
+                        imported.update(self._resolve(source, node.module, node.level, alias.name))
+            self._imports[source] = imported
+        return self._imports[source]
+    
+    def _resolve(self, source, module, level, name=None):
+        """Get the project files an import in source refers to: the module and, for "from x import y", x/y.py"""
+        parts = module.split(".") if module else []
+        if level:
+            # Relative to the importing file's package
+            package = source.split("/")[:-1]
+            if level > 1:
+                package = package[:-(level - 1)]
+            parts = package + parts
+        root = PathManager.get_project_root()
+        paths = ["/".join(parts)] if parts else []
+        if name and name != "*":
+            paths.append("/".join(parts + [name]))
+        return [
+            candidate for path in paths for candidate in (f"{path}.py", f"{path}/__init__.py")
+            if (root / candidate).is_file()
+        ]
+    
+    def _parse(self, source):
+        """Parse a project file, treating a missing or broken file as empty"""
+        try:
+            return ast.parse((PathManager.get_project_root() / source).read_bytes(), filename=source)
+        except (OSError, SyntaxError, ValueError):
+            return ast.Module(body=[], type_ignores=[])
+    
+    def get_dependency_hash(self, item):
+        """Hash the contents of every source a test depends on"""
+        digest = hashlib.sha256()
+        for source in self.get_sources(item):
+            digest.update(source.encode("utf-8"))
+            digest.update(self._hash_file(source).encode("utf-8"))
+        return digest.hexdigest()[:16]
+    
+    def classify(self, nodeid, dependency_hash):
+        """
+        Compare a collected test with its last recorded run
+        
+        Returns:
+            str: "failed" (last run failed), "changed" (new, or code/config differs)
+                 or "passed" (passed against identical code and config)
+        """
+        entry = self.results.get(nodeid)
+        if entry is None or entry["deps"] != dependency_hash or entry["config"] != self.config_hash:
+            return "changed"
+        return "failed" if entry["outcome"] == "failed" else "passed"
+    
+    def record(self, nodeid, outcome, dependency_hash):
+        """Record the outcome of a test run"""
+        self.results[nodeid] = {"outcome": outcome, "deps": dependency_hash, "config": self.config_hash}
+    
+    def save(self):
+        """Atomically write the cache"""
+        PathManager.ensure_directory_exists(self.path.parent)
+        tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.results, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+    
+    def _hash_file(self, source):
+        """Hash one project file (memoised for the run)"""
+        if source not in self._file_hashes:
+            try:
+                with open(PathManager.get_project_root() / source, "rb") as f:
+                    self._file_hashes[source] = hashlib.sha256(f.read()).hexdigest()
+            except OSError:
+                self._file_hashes[source] = "missing"
+        return self._file_hashes[source]
+    
+    def _read(self):
+        """Read the cache, treating a missing or corrupt file as empty"""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+
+class IncrementalRunPlugin:
+    """Orders or filters the collection using the result cache and records new results
+    
+    Modes:
+        failed-first   Last-failed tests first, then changed ones, then the rest
+        changed-first  Changed tests first, then last-failed, then the rest
+        changed-only   Only tests that are new or whose code/config changed
+        skip-passed    Everything except tests that passed against identical code and config
+    Without a mode the cache is only updated.
+    """
+    
+    ORDER = {
+        "failed-first": {"failed": 0, "changed": 1, "passed": 2},
+        "changed-first": {"changed": 0, "failed": 1, "passed": 2},
+    }
+    
+    KEEP = {
+        "changed-only": ("changed",),
+        "skip-passed": ("changed", "failed"),
+    }
+    
+    # Carries the dependency hash from the worker that ran a test to the recording process
+    PROPERTY = "result_cache_deps"
+    
+    def __init__(self, config, mode=None):
+        self.config = config
+        self.mode = mode
+        self.cache = ResultCache()
+        self.is_worker = hasattr(config, "workerinput")
+        self.outcomes = {}
+        self.kept_reasons = {}
+    
+    @pytest.hookimpl(hookwrapper=True, trylast=True)
+    def pytest_collection_modifyitems(self, session, config, items):
+        """Filter and order after every other plugin has ordered the collection"""
+        yield
+        states = {}
+        for item in items:
+            dependency_hash = self.cache.get_dependency_hash(item)
+            item.user_properties.append((self.PROPERTY, dependency_hash))
+            states[item.nodeid] = self.cache.classify(item.nodeid, dependency_hash)
+        
+        if self.mode in self.KEEP:
+            keep = self.KEEP[self.mode]
+            deselected = [item for item in items if states[item.nodeid] not in keep]
+            if deselected:
+                config.hook.pytest_deselected(items=deselected)
+                items[:] = [item for item in items if states[item.nodeid] in keep]
+        if self.mode in self.ORDER:
+            # Stable sort: within a group the previous (e.g. longest-first) order is kept
+            items.sort(key=lambda item: self.ORDER[self.mode][states[item.nodeid]])
+        
+        for item in items:
+            self.kept_reasons[states[item.nodeid]] = self.kept_reasons.get(states[item.nodeid], 0) + 1
+    
+    def pytest_report_collectionfinish(self, config, items):
+        """Show how the cache classified the selected tests"""
+        if not self.mode or not self.kept_reasons:
+            return None
+        counts = ", ".join(f"{count} {state}" for state, count in sorted(self.kept_reasons.items()))
+        return f"incremental mode {self.mode}: {counts}"
+    
+    def pytest_runtest_logreport(self, report):
+        """Collect outcomes where every report is seen (xdist controller or single process)"""
+        if self.is_worker:
+            return
+        dependency_hash = dict(report.user_properties).get(self.PROPERTY)
+        if dependency_hash is None:
+            return
+        if report.failed:
+            self.outcomes[report.nodeid] = ("failed", dependency_hash)
+        elif report.when == "call" and report.passed and report.nodeid not in self.outcomes:
+            self.outcomes[report.nodeid] = ("passed", dependency_hash)
+    
+    def pytest_sessionfinish(self, session, exitstatus):
+        """Persist the outcomes of this run"""
+        if self.is_worker or not self.outcomes:
+            return
+        for nodeid, (outcome, dependency_hash) in self.outcomes.items():
+            self.cache.record(nodeid, outcome, dependency_hash)
+        self.cache.save()
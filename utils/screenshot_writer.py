@@ -0,0 +1,132 @@
+"""Screenshots encoded and written on a background thread, stored once per distinct image"""
+
+import hashlib
+import io
+import json
+import os
+import queue
+import threading
+import time
+from config.config import TestConfig
+from .logger import Logger
+from .path_manager import PathManager
+from .test_context import TestContext
+
+# Pillow is optional: without it screenshots are stored as the browser's PNG
+try:
+    from PIL import Image
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+
+class ScreenshotWriter:
+    """Content-addressed screenshot store fed by a single background writer thread
+    
+    The caller only pays for the WebDriver capture and a hash of its PNG
+    bytes: the file is named after that hash, so the same screen captured
+    twice (or by two workers) is stored once and files never overwrite each
+    other. Downscaling, conversion to WebP/JPEG (with Pillow) and disk I/O
+    happen on the writer thread. The name given by the caller is kept in a
+    per-worker manifest, screenshots/manifest{_gwN}.jsonl.
+    """
+    
+    FORMATS = ("png", "jpeg", "webp")
+    
+    _queue = queue.Queue()
+    _thread = None
+    _lock = threading.Lock()
+    _warned = False
+    
+    @classmethod
+    def get_format(cls):
+        """Get the file format screenshots are stored in"""
+        screenshot_format = TestConfig.SCREENSHOT_FORMAT if TestConfig.SCREENSHOT_FORMAT in cls.FORMATS else "png"
+        return screenshot_format if PIL_AVAILABLE else "png"
+    
+    @classmethod
+    def submit(cls, png, name=None):
+        """
+        Queue a screenshot for encoding and writing
+        
+        Args:
+            png (bytes): PNG bytes as returned by driver.get_screenshot_as_png()
+            name (str): Name recorded in the manifest, e.g. the test or page
+        
+        Returns:
+            str: Path the screenshot will be written to (see flush())
+        """
+        digest = hashlib.sha256(png).hexdigest()[:32]
+        extension = "jpg" if cls.get_format() == "jpeg" else cls.get_format()
+        filepath = PathManager.get_screenshots_path() / f"{digest}.{extension}"
+        record = {
+            "name": name,
+            "file": filepath.name,
+            "test": TestContext.current_test,
+            "worker": TestContext.get_worker_id(),
+            "ts": round(time.time(), 3),
+        }
+        cls._start()
+        cls._queue.put((png, filepath, record))
+        return str(filepath)
+    
+    @classmethod
+    def encode(cls, png):
+        """Downscale and convert PNG bytes according to the screenshot settings"""
+        if not PIL_AVAILABLE:
+            if not cls._warned and (TestConfig.SCREENSHOT_FORMAT != "png" or TestConfig.SCREENSHOT_SCALE != 1):
+                cls._warned = True
+                Logger().get_logger().warning("Pillow is not installed, screenshots are stored as full-size PNG")
+            return png
+        image = Image.open(io.BytesIO(png))
+        if TestConfig.SCREENSHOT_SCALE < 1:
+            size = (max(1, int(image.width * TestConfig.SCREENSHOT_SCALE)),
+                    max(1, int(image.height * TestConfig.SCREENSHOT_SCALE)))
+            image = image.resize(size, Image.LANCZOS)
+        output = io.BytesIO()
+        screenshot_format = cls.get_format()
+        if screenshot_format == "png":
+            image.save(output, "PNG", optimize=True)
+        else:
+            if screenshot_format == "jpeg" and image.mode != "RGB":
+                image = image.convert("RGB")
+            image.save(output, screenshot_format.upper(), quality=TestConfig.SCREENSHOT_QUALITY)
+        return output.getvalue()
+    
+    @classmethod
+    def flush(cls):
+        """Wait until every queued screenshot has been written"""
+        if cls._thread is not None:
+            cls._queue.join()
+    
+    @classmethod
+    def _start(cls):
+        """Start the writer thread on first use"""
+        with cls._lock:
+            if cls._thread is None:
+                cls._thread = threading.Thread(target=cls._run, name="screenshot-writer", daemon=True)
+                cls._thread.start()
+    
+    @classmethod
+    def _run(cls):
+        """Encode and write queued screenshots until the process exits"""
+        while True:
+            png, filepath, record = cls._queue.get()
+            try:
+                cls._write(png, filepath, record)
+            except Exception as e:
+                Logger().get_logger().warning(f"Failed to write screenshot {filepath.name}: {e}")
+            finally:
+                cls._queue.task_done()
+    
+    @classmethod
+    def _write(cls, png, filepath, record):
+        """Store a screenshot unless identical content is already stored, then record its name"""
+        directory = PathManager.ensure_directory_exists(filepath.parent)
+        if not filepath.exists():
+            tmp_path = filepath.with_name(f".{filepath.name}.{os.getpid()}.tmp")
+            with open(tmp_path, "wb") as f:
+                f.write(cls.encode(png))
+            os.replace(tmp_path, filepath)
+        with open(directory / f"manifest{TestContext.get_worker_suffix()}.jsonl", "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, separators=(",", ":")) + "\n")
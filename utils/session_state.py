@@ -0,0 +1,117 @@
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.support import expected_conditions as EC
+from config.config import TestConfig
+from config.test_data import TestData
+from pages.login_page import LoginPage
+from utils.logger import Logger
+
+
+class SessionStateCache:
+    """Capture an authenticated session once per user type and inject it afterwards
+    
+    The first login for a user type in a process goes through the login form.
+    Its cookies and localStorage are kept, and later logins only load a
+    lightweight same-origin URL, restore that state and open inventory.html.
+    """
+    
+    INVENTORY_PATH = "inventory.html"
+    
+    # Set by the app on login; an injected session is only trusted when it names the requested user
+    USERNAME_COOKIE = "session-username"
+    
+    # Cart and checkout state is built separately, it must not leak into a fresh session
+    EXCLUDED_STORAGE_KEYS = ("cart-contents",)
+    
+    CAPTURE_STORAGE_SCRIPT = """
+        var state = {};
+        for (var i = 0; i < window.localStorage.length; i++) {
+            var key = window.localStorage.key(i);
+            state[key] = window.localStorage.getItem(key);
+        }
+        return state;
+    """
+    
+    RESTORE_STORAGE_SCRIPT = """
+        var state = arguments[0];
+        for (var key in state) {
+            window.localStorage.setItem(key, state[key]);
+        }
+    """
+    
+    _states = {}
+    
+    @classmethod
+    def login(cls, driver, user_type="valid", landing_path=None, local_storage=None, fast=None):
+        """
+        Leave the driver logged in as the given user type
+        
+        Args:
+            driver (WebDriver): Driver to log in
+            user_type (str): Key of TestData.USERS
+            landing_path (str): Page to open after login, relative to BASE_URL (default inventory.html)
+            local_storage (dict): Extra localStorage entries to seed, e.g. cart contents
+            fast (bool): Inject captured state (default TestConfig.FAST_LOGIN)
+        """
+        logger = Logger().get_logger()
+        landing_path = landing_path or cls.INVENTORY_PATH
+        fast = TestConfig.FAST_LOGIN if fast is None else fast
+        state = cls._states.get(user_type) if fast else None
+        
+        if state is not None:
+            username = TestData.get_user_credentials(user_type)["username"]
+            if cls._inject(driver, state, username, landing_path, local_storage):
+                return
+            logger.warning(f"Injected session for '{user_type}' was rejected, logging in through the form")
+            cls._states.pop(user_type, None)
+        
+        if cls._ui_login(driver, user_type) and fast:
+            cls._states[user_type] = cls._capture(driver)
+        
+        if local_storage or landing_path != cls.INVENTORY_PATH:
+            driver.execute_script(cls.RESTORE_STORAGE_SCRIPT, local_storage or {})
+            driver.get(TestConfig.BASE_URL + landing_path)
+    
+    @classmethod
+    def clear(cls):
+        """Forget every captured session"""
+        cls._states.clear()
+    
+    @classmethod
+    def _ui_login(cls, driver, user_type):
+        """Log in through the login form, returning whether the inventory page was reached"""
+        credentials = TestData.get_user_credentials(user_type)
+        login_page = LoginPage(driver)
+        login_page.navigate_to_login_page()
+        login_page.login(credentials["username"], credentials["password"])
+        try:
+            login_page.waits.until(EC.url_contains(cls.INVENTORY_PATH), label="SessionStateCache.login")
+            return True
+        except TimeoutException:
+            return False
+    
+    @classmethod
+    def _capture(cls, driver):
+        """Capture cookies and localStorage of the current (logged in) page"""
+        storage = driver.execute_script(cls.CAPTURE_STORAGE_SCRIPT)
+        return {
+            "cookies": driver.get_cookies(),
+            "local_storage": {key: value for key, value in storage.items()
+                              if key not in cls.EXCLUDED_STORAGE_KEYS},
+        }
+    
+    @classmethod
+    def _inject(cls, driver, state, username, landing_path, local_storage=None):
+        """Restore captured state, open the landing page directly and check it is logged in as username"""
+        try:
+            driver.get(TestConfig.BASE_URL + TestConfig.SESSION_BOOTSTRAP_PATH)
+            for cookie in state["cookies"]:
+                driver.add_cookie(cookie)
+            driver.execute_script(cls.RESTORE_STORAGE_SCRIPT, {**state["local_storage"], **(local_storage or {})})
+            driver.get(TestConfig.BASE_URL + landing_path)
+            if landing_path not in driver.current_url:
+                return False
+            cookie = driver.get_cookie(cls.USERNAME_COOKIE)
+            return cookie is not None and cookie.get("value") == username
+        except WebDriverException as e:
+            Logger().get_logger().warning(f"Session injection failed: {e}")
+            return False
@@ -0,0 +1,49 @@
+"""Deterministic, duration-balanced split of the collected tests across CI machines"""
+
+from pathlib import Path
+from utils.duration_store import DurationStore
+
+
+class ShardPlanner:
+    """Assigns every test to exactly one of shard_count shards
+    
+    Tests are taken longest first (ties broken by node id) and each goes to
+    the shard with the least predicted work so far (ties go to the lowest
+    shard index). The plan depends only on the node ids and the durations
+    file, so every machine that collects the same tests with the same
+    durations computes the same disjoint slices.
+    """
+    
+    def __init__(self, shard_count, durations_path=None):
+        if shard_count < 1:
+            raise ValueError(f"Shard count must be at least 1, got {shard_count}")
+        self.shard_count = shard_count
+        self.store = DurationStore(Path(durations_path) if durations_path else None)
+    
+    def plan(self, nodeids):
+        """
+        Split node ids into balanced shards
+        
+        Args:
+            nodeids (list): Collected test node ids
+        
+        Returns:
+            list: One (node ids, predicted seconds) pair per shard
+        """
+        shards = [([], 0.0) for _ in range(self.shard_count)]
+        ordered = sorted(set(nodeids), key=lambda nodeid: (-self.store.estimate(nodeid), nodeid))
+        for nodeid in ordered:
+            index = min(range(self.shard_count), key=lambda i: (shards[i][1], i))
+            tests, load = shards[index]
+            tests.append(nodeid)
+            shards[index] = (tests, load + self.store.estimate(nodeid))
+        return shards
+    
+    def select(self, items, shard_index):
+        """Split pytest items into the ones belonging to a shard and the rest"""
+        if not 0 <= shard_index < self.shard_count:
+            raise ValueError(f"Shard index must be in 0..{self.shard_count - 1}, got {shard_index}")
+        selected_ids = set(self.plan([item.nodeid for item in items])[shard_index][0])
+        selected = [item for item in items if item.nodeid in selected_ids]
+        deselected = [item for item in items if item.nodeid not in selected_ids]
+        return selected, deselected
@@ -0,0 +1,19 @@
+"""Summary statistics shared by the timing and load utilities"""
+
+import math
+
+
+class Stats:
+    """Nearest-rank percentiles, the definition used by every report in the framework"""
+    
+    @staticmethod
+    def rank(count, pct):
+        """Get the 1-based rank of a percentile among count ordered values"""
+        return max(1, math.ceil(pct / 100 * count))
+    
+    @classmethod
+    def percentile(cls, sorted_values, pct):
+        """Get the nearest-rank percentile of sorted values, or None if there are none"""
+        if not sorted_values:
+            return None
+        return sorted_values[cls.rank(len(sorted_values), pct) - 1]
@@ -0,0 +1,54 @@
+"""Process-wide context about the running worker and test"""
+
+import os
+import threading
+import time
+import uuid
+
+
+class TestContext:
+    """Holds identifiers shared by the framework utilities during a run"""
+    
+    __test__ = False  # Not a pytest test class
+    
+    current_test = None
+    _test_started = None
+    _thread = threading.local()
+    
+    # Shared by all xdist workers of a run; a fresh id otherwise
+    _run_id = os.getenv("PYTEST_XDIST_TESTRUNUID") or uuid.uuid4().hex
+    
+    @staticmethod
+    def get_worker_id():
+        """Get the pytest-xdist worker id, or 'main' outside of xdist workers"""
+        return os.getenv("PYTEST_XDIST_WORKER", "main")
+    
+    @classmethod
+    def get_worker_suffix(cls):
+        """Get a file name suffix that is unique per xdist worker"""
+        worker_id = cls.get_worker_id()
+        return "" if worker_id == "main" else f"_{worker_id}"
+    
+    @classmethod
+    def get_run_id(cls):
+        """Get an id identifying the current test run"""
+        return cls._run_id
+    
+    @classmethod
+    def set_current_test(cls, nodeid):
+        """Record the node id of the test being executed"""
+        cls.current_test = nodeid
+        cls._thread.test = nodeid
+        cls._test_started = time.perf_counter() if nodeid else None
+    
+    @classmethod
+    def get_thread_test(cls):
+        """Get the test run by the calling thread; None on helper threads (pool pre-warming, load users)"""
+        return getattr(cls._thread, "test", None)
+    
+    @classmethod
+    def get_test_elapsed_ms(cls):
+        """Get the milliseconds since the current test started, or None between tests"""
+        if cls._test_started is None:
+            return None
+        return (time.perf_counter() - cls._test_started) * 1000